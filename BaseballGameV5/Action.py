@@ -1,44 +1,28 @@
-import random
 import InteractionEngine as ie
-import copy
 import Fatigue as f
 import defense as d
-import Steals as steals
-import itertools
 import Stats as stats
-
-
-def player_ref(player):
-    """Convert a player object to a serializable reference dict."""
-    if player is None:
-        return None
-    return {
-        "player_id": getattr(player, 'id', None),
-        "player_name": f"{getattr(player, 'firstname', '')} {getattr(player, 'lastname', '')}"
-    }
-
-
-def player_list_ref(players):
-    """Convert a list of players to serializable reference dicts."""
-    if not players:
-        return []
-    return [player_ref(p) for p in players if p is not None]
+import event_log as el
+from events import PlayEvent
+from game_state import (
+    IS_WALK, IS_HBP, IS_STRIKEOUT, IS_INPLAY, AB_OVER, FREE_PASS, HIT_FLAGS, FIRST, SECOND, THIRD
+)
 
 
 class Action():
-    counter = 0
     def __init__(self, game):
-        self.id = Action.counter
-        Action.counter+=1
+        self.id = game.action_counter
+        game.action_counter += 1
         self.game = game
         self.outcome = None
         self.defensiveoutcome = None
 
         # Capture pre-play state for baserunning analytics
-        self.pre_r1 = game.on_firstbase
-        self.pre_r2 = game.on_secondbase
-        self.pre_r3 = game.on_thirdbase
-        self.pre_outs = game.currentouts
+        state = game.state
+        self.pre_r1 = state.first
+        self.pre_r2 = state.second
+        self.pre_r3 = state.third
+        self.pre_outs = state.outs
 
         Action.AttributeInjuryCheck(self)
         Action.PrePitch(self)
@@ -51,12 +35,14 @@ class Action():
     def AttributeInjuryCheck(self):
         self.game.hometeam.ActionAdjustments()
         self.game.awayteam.ActionAdjustments()
+        Action.InGameInjuryCheck(self)
 
+    def InGameInjuryCheck(self):
         # Check for in-game injuries if injury system is available
         if hasattr(self.game, 'injury_adapter') and self.game.injury_adapter:
             from injury_system import InjurySystem
             if not hasattr(self.game, '_injury_system'):
-                self.game._injury_system = InjurySystem(self.game.injury_adapter)
+                self.game._injury_system = InjurySystem(self.game.injury_adapter, self.game.rng.injury)
 
             # Check batter for injury
             batter = self.game.battingteam.currentbatter
@@ -76,7 +62,7 @@ class Action():
 
     def PrePitch(self):
         self.game.error_count=0
-        skip = steals.Steals(self).skippitch 
+        skip = self.game.baserunning_engine.pre_pitch(self)
         #print(f"{skip} {self.id}{self.defensiveoutcome}")
         
         if skip == True:
@@ -86,8 +72,17 @@ class Action():
             Action.AtBat(self)
     
     def AtBat(self):
-        self.pitch_event = ie.PitchEvent(self)
-        self.outcome = self.pitch_event.outcome
+        if self.game.pa_sampling:
+            self.pitch_event = None
+            self.outcome, folded = ie.sample_pitch(self)
+            # Pitches folded into this action still tire the pitcher and
+            # roll for injuries once each
+            for _ in range(folded):
+                self.game.pitchingteam.TickPitcherStamina()
+                Action.InGameInjuryCheck(self)
+        else:
+            self.pitch_event = ie.PitchEvent(self)
+            self.outcome = self.pitch_event.outcome
         #print(f"{self.game.currentinning:<3}{self.game.topofinning}|{self.game.currentouts:<1}-{self.game.outcount}| {self.game.hometeam.name:<3}{self.game.hometeam.score:>2} / {self.game.awayteam.name:<3}{self.game.awayteam.score:>2} ||| B: {self.game.battingteam.name:>3}{self.game.battingteam.currentbatspot} P: {self.game.pitchingteam.name:>3}{self.game.pitchingteam.currentbatspot}  CAB:{self.game.currentstrikes}/{self.game.currentballs} {self.outcome}")
         #print(self.outcome)
         #outcome = random.choices(['ball', 'strike', 'contact', 'hbp'], [0, 3, 1, 0], k=1)[0]
@@ -96,94 +91,31 @@ class Action():
         #print(f"{self.game.skip_bool} {self.id}{self.defensiveoutcome}")
 
     def ActionPrint(self):
-        # Get modifier snapshot if ball was put in play
-        at_bat_modifiers = None
-        if (hasattr(self, 'pitch_event') and
-            self.pitch_event is not None and
-            self.pitch_event.batted_ball_event is not None):
-            at_bat_modifiers = self.pitch_event.batted_ball_event.get_modifier_snapshot()
-
-        # Get interaction phase data
-        interaction_data = None
-        if hasattr(self, 'pitch_event') and self.pitch_event is not None:
-            interaction_data = self.pitch_event.get_phase_snapshot()
-
-        return {
-            "ID": self.id,
-            "Inning": self.game.currentinning,
-            "Inning Half": "Top" if self.game.topofinning else "Bottom",
-            "Home Team": self.game.hometeam.name,
-            "Home Score": self.game.hometeam.score,
-            "Away Team": self.game.awayteam.name,
-            "Away Score": self.game.awayteam.score,
-            "Ball Count": self.game.currentballs,
-            "Strike Count": self.game.currentstrikes,
-            "Out Count": self.game.currentouts,
-            "Outs this Action": self.game.outcount,
-            "Batter": player_ref(self.game.battingteam.currentbatter),
-            "Pitcher": player_ref(self.game.pitchingteam.currentpitcher),
-            "Outcomes": str(self.outcome),
-            "Batted Ball": str(self.game.batted_ball),
-            "Air or Ground": str(self.game.air_or_ground),
-            "Hit Depth": str(getattr(self.game, 'hit_depth', None)),
-            "Hit Direction": str(getattr(self.game, 'hit_direction', None)),
-            "Hit Situation": str(getattr(self.game, 'hit_situation', None)),
-            "Catch Probability": getattr(self.game, 'catch_probability', None),
-            "Targeted Defender": player_ref(self.game.targeted_defender) if hasattr(self.game.targeted_defender, 'id') else str(self.game.targeted_defender),
-            "Defensive Outcome": str(self.defensiveoutcome[3] if self.defensiveoutcome != None else None),
-            "Error List": str(self.defensiveoutcome[5] if self.defensiveoutcome != None else None),
-            "Defensive Actions": str(self.defensiveoutcome[6] if self.defensiveoutcome != None else None),
-            "On First": player_ref(self.game.on_firstbase),
-            "On Second": player_ref(self.game.on_secondbase),
-            "On Third": player_ref(self.game.on_thirdbase),
-            "Home": player_list_ref(self.game.current_runners_home),
-            "Is_Walk": self.game.is_walk,
-            "Is_Strikeout": self.game.is_strikeout,
-            "Is_InPlay": self.game.is_inplay,
-            "Is_Hit": self.game.is_hit,
-            "Is_HBP": self.game.is_hbp,
-            "Is_Pickoff": self.game.is_pickoff,
-            "Is_StealAttempt": self.game.is_stealattempt,
-            "Is_StealSuccess": self.game.is_stealsuccess,
-            "Error_Count": self.game.error_count,
-            "Is_Liveball": self.game.is_liveball,
-            "Is_Foul": self.outcome is not None and len(self.outcome) > 1 and self.outcome[1] == "Foul",
-            "Is_Single": self.game.is_single,
-            "Is_Double": self.game.is_double,
-            "Is_Triple": self.game.is_triple,
-            "Is_Homerun": self.game.is_homerun,
-            "AB_Over": self.game.ab_over,
-            "Catcher": player_ref(self.game.pitchingteam.catcher),
-            "First Base": player_ref(self.game.pitchingteam.firstbase),
-            "Second Base": player_ref(self.game.pitchingteam.secondbase),
-            "Third Base": player_ref(self.game.pitchingteam.thirdbase),
-            "Shortstop": player_ref(self.game.pitchingteam.shortstop),
-            "Left Field": player_ref(self.game.pitchingteam.leftfield),
-            "Center Field": player_ref(self.game.pitchingteam.centerfield),
-            "Right Field": player_ref(self.game.pitchingteam.rightfield),
-            "At_Bat_Modifiers": at_bat_modifiers,
-            "Interaction_Data": interaction_data,
-            "Timing_Diagnostics": self.defensiveoutcome[7] if (self.defensiveoutcome is not None and len(self.defensiveoutcome) > 7) else None,
-            # Pre-play state for baserunning analytics
-            "Pre_R1": player_ref(self.pre_r1),
-            "Pre_R2": player_ref(self.pre_r2),
-            "Pre_R3": player_ref(self.pre_r3),
-            "Pre_Outs": self.pre_outs,
-            # Runners who scored this play
-            "Runners_Scored": len(self.game.current_runners_home),
-            "Runners_Scored_IDs": [getattr(r, 'id', None) for r in self.game.current_runners_home],
-            # Double play / Triple play tracking
-            "Is_DP_Opportunity": self.pre_r1 is not None and self.pre_outs < 2 and self.game.air_or_ground == "ground",
-            "Is_DP": (self.pre_r1 is not None and self.pre_outs < 2 and self.game.air_or_ground == "ground" and self.game.outcount >= 2),
-            "Is_TP_Opportunity": self.pre_r1 is not None and self.pre_r2 is not None and self.pre_outs == 0 and self.game.air_or_ground == "ground",
-            "Is_TP": (self.pre_r1 is not None and self.pre_r2 is not None and self.pre_outs == 0 and self.game.air_or_ground == "ground" and self.game.outcount >= 3),
-        }
-
-
-
+        """This action as a legacy play-by-play dict."""
+        return PlayEvent.from_action(self).to_dict(self.game.player_names())
+
+    def LogEvent(self, event_log, event):
+        if event_log.enabled(el.PITCH):
+            if event is None:
+                event = PlayEvent.from_action(self)
+            event_log.record(el.PITCH, event.to_dict(self.game.player_names()))
+        elif self.game.ab_over:
+            # Per-PA summary, taken before NextAtBat resets the count
+            event_log.record(el.PA, {
+                "ID": self.id,
+                "Inning": self.game.currentinning,
+                "Inning Half": "Top" if self.game.topofinning else "Bottom",
+                "Home Score": self.game.hometeam.score,
+                "Away Score": self.game.awayteam.score,
+                "Out Count": self.game.currentouts,
+                "Batter": self.game.player_ref(self.game.battingteam.currentbatter.id),
+                "Pitcher": self.game.player_ref(self.game.pitchingteam.currentpitcher.id),
+                "Outcomes": self.outcome,
+                "Defensive Outcome": self.defensiveoutcome.outcome if self.defensiveoutcome != None else None,
+            })
 
     def PostPitch(self):
-        if self.game.is_strikeout == False:
+        if not self.game.state.flags & IS_STRIKEOUT:
             WalkEval(self) 
             if self.defensiveoutcome != None:
                 HitEval(self)        
@@ -192,8 +124,23 @@ class Action():
         self.game.battingteam.score += len(self.game.current_runners_home)
         for runners in self.game.current_runners_home:
             stats.RunScorer(runners)
-        self.game.actions.append(self.ActionPrint())#[self.game.error_count, self.game.currentinning, self.game.topofinning, self.game.currentouts, self.game.outcount, self.game.hometeam.name, self.game.hometeam.score, self.game.awayteam.name, self.game.awayteam.score, self.game.battingteam.name, self.game.battingteam.currentbatspot, self.game.pitchingteam.name, self.game.pitchingteam.currentbatspot, self.game.currentstrikes, self.game.currentballs, self.game.battingteam.currentbatter, self.outcome, self.game.on_firstbase, self.game.on_secondbase, self.game.on_thirdbase, len(self.game.current_runners_home), self.defensiveoutcome, self.game.skip_bool, [self.game.is_single, self.game.is_double, self.game.is_triple, self.game.is_homerun]])
-        print(self.ActionPrint())
+        pitcher = self.game.pitchingteam.currentpitcher
+        self.game.decision_tracker.record(
+            self.game.topofinning,
+            getattr(pitcher, 'id', None),
+            len(self.game.current_runners_home),
+            (self.pre_r1 is not None) + (self.pre_r2 is not None) + (self.pre_r3 is not None),
+            self.game.outcount
+        )
+        event = None
+        if self.game.record_actions:
+            event = PlayEvent.from_action(self)
+            self.game.actions.append(event)#[self.game.error_count, self.game.currentinning, self.game.topofinning, self.game.currentouts, self.game.outcount, self.game.hometeam.name, self.game.hometeam.score, self.game.awayteam.name, self.game.awayteam.score, self.game.battingteam.name, self.game.battingteam.currentbatspot, self.game.pitchingteam.name, self.game.pitchingteam.currentbatspot, self.game.currentstrikes, self.game.currentballs, self.game.battingteam.currentbatter, self.outcome, self.game.on_firstbase, self.game.on_secondbase, self.game.on_thirdbase, len(self.game.current_runners_home), self.defensiveoutcome, self.game.skip_bool, [self.game.is_single, self.game.is_double, self.game.is_triple, self.game.is_homerun]])
+            if self.game.analytics is not None:
+                self.game.analytics.add(event)
+        event_log = self.game.event_log
+        if event_log.level:
+            Action.LogEvent(self, event_log, event)
         NextAction(self)
         NextAtBat(self)        
 
@@ -203,80 +150,51 @@ class Action():
         
 
 def HitEval(self):
-    self.game.on_firstbase = self.defensiveoutcome[4][0]
-    self.game.on_secondbase = self.defensiveoutcome[4][1]
-    self.game.on_thirdbase = self.defensiveoutcome[4][2]
+    state = self.game.state
+    result = self.defensiveoutcome
+    state.first, state.second, state.third = result.first, result.second, result.third
 
     # Process scored runners for hits OR sac flies/tag-ups (runners can score on outs too)
-    outcome = self.defensiveoutcome[3]
-    if outcome in ("single", "double", "triple", "homerun", "out"):
-        listofrunners = self.defensiveoutcome[4][3]
-        for runner in listofrunners:
-            self.game.current_runners_home.append(runner)
+    if result.outcome in ("single", "double", "triple", "homerun", "out"):
+        self.game.current_runners_home.extend(result.scored)
 
 def WalkEval(self):
-    if self.game.is_walk == True:
-        self.game.battingteam.currentbatter.battingstats.Adder("walks", 1)
-        self.game.battingteam.currentbatter.on_base_pitcher = self.game.pitchingteam.currentpitcher
-        self.game.pitchingteam.currentpitcher.pitchingstats.Adder("walks", 1)
-        walk_descript = f"{self.game.pitchingteam.currentpitcher.lineup} {self.game.pitchingteam.currentpitcher.name} walks {self.game.battingteam.currentbatter.lineup} {self.game.battingteam.currentbatter.name}"
+    state = self.game.state
+    if not state.flags & FREE_PASS:
+        return
+
+    batter = self.game.battingteam.currentbatter
+    pitcher = self.game.pitchingteam.currentpitcher
+    batter.on_base_pitcher = pitcher
+    if state.flags & IS_WALK:
+        batter.battingstats.Adder("walks", 1)
+        pitcher.pitchingstats.Adder("walks", 1)
+        walk_descript = None if self.game.outcome_only else f"{pitcher.lineup} {pitcher.name} walks {batter.lineup} {batter.name}"
         outcome = 'walk'
-
-    if self.game.is_hbp == True:
-        self.game.battingteam.currentbatter.battingstats.Adder("hbp", 1)        
-        self.game.battingteam.currentbatter.on_base_pitcher = self.game.pitchingteam.currentpitcher
-        self.game.pitchingteam.currentpitcher.pitchingstats.Adder("hbp", 1)
-        walk_descript = f"{self.game.pitchingteam.currentpitcher.lineup} {self.game.pitchingteam.currentpitcher.name} hits {self.game.battingteam.currentbatter.lineup} {self.game.battingteam.currentbatter.name}"
+    else:
+        batter.battingstats.Adder("hbp", 1)
+        pitcher.pitchingstats.Adder("hbp", 1)
+        walk_descript = None if self.game.outcome_only else f"{pitcher.lineup} {pitcher.name} hits {batter.lineup} {batter.name}"
         outcome = 'hbp'
 
-    if self.game.is_walk == True or self.game.is_hbp == True:
-        if self.game.on_firstbase == None:
-            self.game.on_firstbase = self.game.battingteam.currentbatter
-            self.game.on_firstbase.battingstats.Adder("bases", 1)
-            self.defensiveoutcome = [None, None, None, outcome, [self.game.on_firstbase, self.game.on_secondbase, self.game.on_thirdbase, self.game.current_runners_home], [], [walk_descript]]
-            return
-        if self.game.on_firstbase != None:
-            if self.game.on_secondbase == None:
-                self.game.on_secondbase = self.game.on_firstbase
-                self.game.on_firstbase = self.game.battingteam.currentbatter
-                self.game.on_firstbase.battingstats.Adder("bases", 1)
-                self.game.on_secondbase.battingstats.Adder("bases", 1)
-                self.defensiveoutcome = [None, None, None, outcome, [self.game.on_firstbase, self.game.on_secondbase, self.game.on_thirdbase, self.game.current_runners_home], [], [walk_descript]]
-                return
-            if self.game.on_secondbase != None:
-                if self.game.on_thirdbase == None:
-                    self.game.on_thirdbase = self.game.on_secondbase
-                    self.game.on_secondbase = self.game.on_firstbase
-                    self.game.on_firstbase = self.game.battingteam.currentbatter
-                    self.game.on_thirdbase.battingstats.Adder("bases", 1)
-                    self.game.on_secondbase.battingstats.Adder("bases", 1)
-                    self.game.on_firstbase.battingstats.Adder("bases", 1)
-                    self.defensiveoutcome = [None, None, None, outcome, [self.game.on_firstbase, self.game.on_secondbase, self.game.on_thirdbase, self.game.current_runners_home], [], [walk_descript]]
-                    return
-                if self.game.on_thirdbase != None:
-                    self.game.current_runners_home.append(self.game.on_thirdbase)
-                    self.game.on_thirdbase.battingstats.Adder("bases", 1)
-                    self.game.on_thirdbase = self.game.on_secondbase
-                    self.game.on_secondbase = self.game.on_firstbase
-                    self.game.on_firstbase = self.game.battingteam.currentbatter
-                    self.game.on_thirdbase.battingstats.Adder("bases", 1)
-                    self.game.on_secondbase.battingstats.Adder("bases", 1)
-                    self.game.on_firstbase.battingstats.Adder("bases", 1)
-                    self.defensiveoutcome = [None, None, None, outcome, [self.game.on_firstbase, self.game.on_secondbase, self.game.on_thirdbase, self.game.current_runners_home], [], [walk_descript]]
-                    return
-
-        
-
-
-    else:
-        pass    
+    # Forced runners move up one base; the lead forced runner decides how far the push goes
+    bases = state.bases
+    if bases & FIRST:
+        if bases & SECOND:
+            if bases & THIRD:
+                self.game.current_runners_home.append(state.third)
+                state.third.battingstats.Adder("bases", 1)
+            state.third = state.second
+            state.third.battingstats.Adder("bases", 1)
+        state.second = state.first
+        state.second.battingstats.Adder("bases", 1)
+    state.first = batter
+    batter.battingstats.Adder("bases", 1)
+    self.defensiveoutcome = d.PlayResult.from_game(outcome, self.game, actions=(walk_descript,))
 
 def NextAction(self):
     self.game.pitchingteam.TickPitcherStamina()
-    self.game.is_pickoff = False
-    self.game.is_stealattempt = False
-    self.game.is_stealsuccess = False
-    self.game.is_inplay = False
+    self.game.state.end_action()
     self.game.batted_ball = None
     self.game.air_or_ground = None
     self.game.targeted_defender = None
@@ -287,108 +205,81 @@ def NextAction(self):
     self.game.current_runners_home = []
   
 def NextAtBat(self):
-    #print(self.game.ab_over)
-    if self.game.ab_over == True:
-        if self.game.is_walk  == True or self.game.is_hbp == True:
-            pass
-        else: 
+    state = self.game.state
+    if state.flags & AB_OVER:
+        if not state.flags & FREE_PASS:
             self.game.battingteam.currentbatter.battingstats.Adder("at_bats", 1)
-        self.game.currentstrikes = 0
-        self.game.currentballs = 0
-        self.game.is_hit = False
-        self.game.is_single = False        
-        self.game.is_double = False
-        self.game.is_triple = False
-        self.game.is_homerun = False        
-        self.game.is_walk = False
-        self.game.is_hbp = False
-        self.game.is_strikeout = False
-        self.game.ab_over = False
-        if self.game.on_firstbase != None:
-            self.game.on_firstbase.earned_bool = True
-        if self.game.on_secondbase != None:
-            self.game.on_secondbase.earned_bool = True
-        if self.game.on_thirdbase != None:
-            self.game.on_thirdbase.earned_bool = True
+        state.end_plate_appearance()
+        if state.first is not None:
+            state.first.earned_bool = True
+        if state.second is not None:
+            state.second.earned_bool = True
+        if state.third is not None:
+            state.third.earned_bool = True
         self.game.current_runners_home = []
         self.game.battingteam.TickBatter()
         self.game.pitchingteam.DecidePitchingChange()    
 
 def AtBatOutcomeParser(self):
+    state = self.game.state
 
     if self.outcome[0] == 'Strike':
         self.game.pitchingteam.currentpitcher.pitchingstats.Adder("strikes", 1)
         if self.outcome[1] == "Foul":
-            if self.game.currentstrikes == self.game.rules.strikes - 1:
+            if state.strikes == self.game.rules.strikes - 1:
                 pass
             else:
-                self.game.currentstrikes+=1                      
-            #print(self.game.currentstrikes)
+                state.strikes += 1
         else:
-            self.game.currentstrikes+=1
-            #print(self.game.currentstrikes)
+            state.strikes += 1
 
-    if self.game.currentstrikes >= self.game.rules.strikes:
-        #print("working")
-        self.game.ab_over = True
-        self.game.is_strikeout = True
+    if state.strikes >= self.game.rules.strikes:
+        state.flags |= AB_OVER | IS_STRIKEOUT
         self.game.pitchingteam.currentpitcher.pitchingstats.Adder("strikeouts", 1)
         self.game.battingteam.currentbatter.battingstats.Adder("strikeouts", 1)
-        so_descript = f"{self.game.pitchingteam.currentpitcher.lineup} {self.game.pitchingteam.currentpitcher.name} strikes out {self.game.battingteam.currentbatter.lineup} {self.game.battingteam.currentbatter.name}"
-        self.defensiveoutcome = [None, None, None, "strikeout", [self.game.on_firstbase, self.game.on_secondbase, self.game.on_thirdbase, self.game.current_runners_home], [], [so_descript]]
+        so_descript = None if self.game.outcome_only else f"{self.game.pitchingteam.currentpitcher.lineup} {self.game.pitchingteam.currentpitcher.name} strikes out {self.game.battingteam.currentbatter.lineup} {self.game.battingteam.currentbatter.name}"
+        self.defensiveoutcome = d.PlayResult.from_game("strikeout", self.game, actions=(so_descript,))
 
         self.game.outcount+=1
         
     if self.outcome[0] == 'Ball':
         self.game.pitchingteam.currentpitcher.pitchingstats.Adder("balls", 1)
-        self.game.currentballs +=1
-    
-    if self.game.currentballs >= self.game.rules.balls:
+        state.balls += 1
+
+    if state.balls >= self.game.rules.balls:
         stats.SetPitcherStatus(self.game.battingteam.currentbatter, self.game.pitchingteam.currentpitcher, True)
-        self.game.ab_over = True
-        self.game.is_walk = True
+        state.flags |= AB_OVER | IS_WALK
 
     if self.outcome[0] == 'HBP':
-        self.game.ab_over = True
-        self.game.is_hbp = True
+        state.flags |= AB_OVER | IS_HBP
         stats.SetPitcherStatus(self.game.battingteam.currentbatter, self.game.pitchingteam.currentpitcher, True)
 
     if self.outcome[1] in ('far left', 'left', 'center left', 'dead center', 'center right', 'right', 'far right'):
-        fielding_result = d.fielding(self)
-        self.defensiveoutcome = fielding_result.defenseoutcome
+        # Runs the batter scores are charged to the pitcher who allowed the ball in play
+        self.game.battingteam.currentbatter.on_base_pitcher = self.game.pitchingteam.currentpitcher
+        resolver = self.game.play_resolver
+        self.defensiveoutcome = result = resolver.resolve(self)
 
         # Set game state fields from fielding result
-        self.game.batted_ball = fielding_result.contacttype
-        self.game.air_or_ground = "air" if fielding_result.airball_bool else "ground"
-        self.game.targeted_defender = fielding_result.fieldingdefender
-        self.game.is_inplay = True
+        self.game.batted_ball = resolver.contacttype
+        self.game.air_or_ground = "air" if resolver.airball_bool else "ground"
+        self.game.targeted_defender = resolver.fieldingdefender
+        state.flags |= IS_INPLAY
 
         # Additional debugging fields from new catch_rates system
-        self.game.hit_depth = fielding_result.depth
-        self.game.hit_direction = fielding_result.direction
-        self.game.hit_situation = fielding_result.situation
-        self.game.catch_probability = getattr(fielding_result, 'catch_probability', None)
+        self.game.hit_depth = resolver.depth
+        self.game.hit_direction = resolver.direction
+        self.game.hit_situation = resolver.situation
+        self.game.catch_probability = resolver.catch_probability
 
         # Set hit type flags based on defensive outcome
-        outcome = self.defensiveoutcome[3]
-        if outcome == "single":
-            self.game.is_hit = True
-            self.game.is_single = True
-        elif outcome == "double":
-            self.game.is_hit = True
-            self.game.is_double = True
-        elif outcome == "triple":
-            self.game.is_hit = True
-            self.game.is_triple = True
-        elif outcome == "homerun":
-            self.game.is_hit = True
-            self.game.is_homerun = True
+        state.flags |= HIT_FLAGS.get(result.outcome, 0)
 
         # Set error count from error list
-        self.game.error_count = len(self.defensiveoutcome[5]) if self.defensiveoutcome[5] else 0
+        self.game.error_count = len(result.errors)
 
-        stats.OutcomeStatAdder(self.game.battingteam.currentbatter, self.game.pitchingteam.currentpitcher, self.defensiveoutcome[3])
-        self.game.ab_over = True
+        stats.OutcomeStatAdder(self.game.battingteam.currentbatter, self.game.pitchingteam.currentpitcher, result.outcome)
+        state.flags |= AB_OVER
 
 
 #GAME STATE
@@ -405,7 +296,8 @@ def WalkoffCheck(self):
 def OutProcessor(self):
     # Calculate how many outs can actually be credited this half-inning
     # Can't credit more outs than needed to end the inning (handles double/triple plays)
-    outs_remaining_in_inning = self.game.rules.outs - self.game.currentouts
+    state = self.game.state
+    outs_remaining_in_inning = self.game.rules.outs - state.outs
     outs_to_credit = min(self.game.outcount, outs_remaining_in_inning)
 
     # Credit innings only for outs that "count"
@@ -413,14 +305,14 @@ def OutProcessor(self):
         self.game.pitchingteam.TickInningsPlayed()
 
     # Add the actual outs made to the count
-    self.game.currentouts += self.game.outcount
+    state.outs += self.game.outcount
     self.game.outcount = 0
 
     # Check for walkoff
     WalkoffCheck(self)
 
     # Check if inning should flip (now correctly triggers at 3 outs, not 4)
-    if self.game.currentouts >= self.game.rules.outs:
+    if state.outs >= self.game.rules.outs:
         InningFlip(self)    
 
 def InningFlip(self):
@@ -434,10 +326,7 @@ def InningFlip(self):
     self.game.overallresults.append(stats.InningStats(self.game.currentinning, self.game.battingteam.name, score))    
     
     GameFinishedCheck(self)  
-    self.game.on_firstbase = None
-    self.game.on_secondbase = None
-    self.game.on_thirdbase = None
-    self.game.currentouts = 0
+    self.game.state.end_half_inning()
     self.game.outcount = 0
     if self.game.topofinning == False:
         self.game.currentinning+=1
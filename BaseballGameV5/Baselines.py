@@ -1,7 +1,52 @@
+import copy
 import csv 
 import os 
 import numpy as np
 import json 
+from bisect import bisect
+from itertools import accumulate
+
+from codes import (
+    CONTACT_NAMES, DEPTH_NAMES, DIRECTION_NAMES, SITUATION_NAMES,
+    DEPTH_CODE, Depth, Situation
+)
+from defense import fielding
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict.
+
+    Unlike a mappingproxy it pickles (so frozen configs can be sent to
+    worker processes) and deep-copies to itself.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("FrozenDict does not support item assignment")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def deep_freeze(value):
+    """Return a read-only copy of nested dicts/lists (as FrozenDict/tuple)."""
+    if isinstance(value, dict):
+        return FrozenDict({key: deep_freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(deep_freeze(item) for item in value)
+    return value
+
 
 class Baselines():
     def __init__(self, leaguetype):
@@ -58,9 +103,56 @@ class Baselines():
         self.normalleash = load["normalleash"]
         self.longleash = load["longleash"]
 
+        self.compile()
+
     def __repr__(self):
         return f"{self.leaguetype}"
 
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"Baselines are frozen; cannot set '{name}'")
+        object.__setattr__(self, name, value)
+
+    def __deepcopy__(self, memo):
+        # Frozen instances are shared by every game using the config, so a
+        # deep-copied game shares it too
+        if getattr(self, "_frozen", False):
+            return self
+        clone = object.__new__(type(self))
+        memo[id(self)] = clone
+        for name, value in vars(self).items():
+            object.__setattr__(clone, name, copy.deepcopy(value, memo))
+        return clone
+
+    def freeze(self):
+        """
+        Make this instance immutable so it can be shared between games.
+
+        Nested dicts and lists become read-only mappings and tuples, and
+        further attribute assignment raises AttributeError.
+
+        Returns:
+            self
+        """
+        for name, value in list(vars(self).items()):
+            object.__setattr__(self, name, deep_freeze(value))
+        object.__setattr__(self, "_frozen", True)
+        return self
+
+    def compile(self):
+        """
+        Build the integer-coded lookup tables used on the hot path.
+
+        Runs when the instance is built; call again after changing any
+        attribute by hand. Frozen instances are shared between games, so
+        every game using the same config shares one CompiledBaselines.
+
+        Returns:
+            The CompiledBaselines for this instance
+        """
+        self.compiled = CompiledBaselines(self)
+        return self.compiled
+
     @classmethod
     def from_dict(cls, data: dict, leaguetype: str = "endpoint"):
         """
@@ -126,6 +218,7 @@ class Baselines():
         instance.normalleash = data.get("normalleash", 0.7)
         instance.longleash = data.get("longleash", 0.5)
 
+        instance.compile()
         return instance
 
     def LoadBaselineJSON(directory):
@@ -141,5 +234,156 @@ class Baselines():
             if keyword in fname:
                 rules = Baselines.LoadBaselineJSON(directory+fname)
                 return rules[0][ruletype]
-            
 
+
+class CompiledBaselines():
+    """
+    Baselines flattened into tuples indexed by the integer codes in codes.py.
+
+    Weighted picks are stored as cumulative weights so a draw is one
+    random() and a bisect, matching random.choices() draw for draw.
+    """
+
+    __slots__ = (
+        "depth_cum_weights", "catch_rates", "situations", "alignment",
+        "quality_base", "neutral_base", "poor_base",
+        "barrel_share_of_quality", "flare_share_of_neutral",
+        "topped_share_of_poor", "under_share_of_poor"
+    )
+
+    def __init__(self, baselines):
+        """
+        Args:
+            baselines: Baselines instance to compile
+        """
+        self._compile_contact_tiers(baselines)
+
+        # depth_cum_weights[contact] = (depth codes, cumulative weights) or
+        # None when no distance outcomes are configured
+        self.depth_cum_weights = tuple(
+            CompiledBaselines._depth_table(baselines, contact) for contact in CONTACT_NAMES
+        )
+
+        # catch_rates[contact][situation] = out probability
+        self.catch_rates = tuple(
+            tuple(
+                CompiledBaselines._catch_rate(baselines, contact, situation)
+                for situation in SITUATION_NAMES
+            )
+            for contact in CONTACT_NAMES
+        )
+
+        # situations[depth][direction] = situation code
+        self.situations = tuple(
+            tuple(CompiledBaselines._situation(depth, direction) for direction in DIRECTION_NAMES)
+            for depth in DEPTH_NAMES
+        )
+
+        # alignment[direction][depth] = (positions, cumulative weights) or
+        # None when nobody is aligned there (pitcher fallback)
+        self.alignment = tuple(
+            tuple(CompiledBaselines._alignment(baselines, direction, depth) for depth in DEPTH_NAMES)
+            for direction in DIRECTION_NAMES
+        )
+
+    def pick_depth(self, contact: int, rng) -> int:
+        """
+        Draw a depth code for a contact type.
+
+        Args:
+            contact: ContactType code
+            rng: Random stream to draw from
+
+        Returns:
+            Depth code
+        """
+        table = self.depth_cum_weights[contact]
+        if table is None:
+            return Depth.MIDDLE_OF
+        codes, cum_weights = table
+        return codes[bisect(cum_weights, rng.random() * cum_weights[-1], 0, len(codes) - 1)]
+
+    def pick_position(self, direction: int, depth: int, rng):
+        """
+        Draw the fielding position for a direction and depth.
+
+        Args:
+            direction: Direction code
+            depth: Depth code
+            rng: Random stream to draw from
+
+        Returns:
+            Position string, or None when nobody is aligned there
+        """
+        table = self.alignment[direction][depth]
+        if table is None:
+            return None
+        positions, cum_weights = table
+        return positions[bisect(cum_weights, rng.random() * cum_weights[-1], 0, len(positions) - 1)]
+
+    def _compile_contact_tiers(self, baselines):
+        odds = [
+            baselines.barrelodds, baselines.solidodds, baselines.flareodds,
+            baselines.burnerodds, baselines.underodds, baselines.toppedodds,
+            baselines.weakodds
+        ]
+        total = sum(odds)
+        if total <= 0:
+            total = 1
+        barrel, solid, flare, burner, under, topped, weak = (v / total for v in odds)
+
+        self.quality_base = barrel + solid
+        self.neutral_base = flare + burner
+        self.poor_base = topped + under + weak
+
+        self.barrel_share_of_quality = barrel / self.quality_base if self.quality_base > 0 else 0.5
+        self.flare_share_of_neutral = flare / self.neutral_base if self.neutral_base > 0 else 0.5
+        if self.poor_base > 0:
+            self.topped_share_of_poor = topped / self.poor_base
+            self.under_share_of_poor = under / self.poor_base
+        else:
+            self.topped_share_of_poor = 0.33
+            self.under_share_of_poor = 0.33
+
+    @staticmethod
+    def _depth_table(baselines, contact: str):
+        if not baselines.distoutcomes:
+            return None
+        weights = baselines.distweights.get(contact)
+        if not weights or sum(weights) <= 0:
+            weights = fielding.DEFAULT_DISTWEIGHTS.get(contact, fielding.FALLBACK_DISTWEIGHTS)
+        if sum(weights) <= 0:
+            weights = [1] * len(baselines.distoutcomes)
+        codes = tuple(DEPTH_CODE[name] for name in baselines.distoutcomes)
+        return codes, tuple(accumulate(weights))
+
+    @staticmethod
+    def _catch_rate(baselines, contact: str, situation: str) -> float:
+        rate = baselines.catch_rates.get(contact, {}).get(situation)
+        if rate is None:
+            rate = fielding.DEFAULT_CATCH_RATES.get(situation, fielding.DEFAULT_CATCH_RATE)
+        return rate
+
+    @staticmethod
+    def _situation(depth: str, direction: str) -> int:
+        if depth in fielding.INFIELD_DEPTHS:
+            return Situation.ROUTINE_IF
+        if depth in fielding.OUTFIELD_DEPTHS:
+            is_deep = depth == "deep_of"
+            if direction in fielding.GAP_DIRECTIONS:
+                return Situation.DEEP_GAP if is_deep else Situation.GAP
+            if direction in fielding.LINE_DIRECTIONS:
+                return Situation.DEEP_LINE if is_deep else Situation.LINE
+            return Situation.DEEP if is_deep else Situation.ROUTINE_OF
+        return Situation.DEEP
+
+    @staticmethod
+    def _alignment(baselines, direction: str, depth: str):
+        try:
+            positions = baselines.defensivealignment.get(direction, {}).get(depth, [])
+        except (AttributeError, TypeError):
+            positions = []
+        if not positions:
+            return None
+        weights = [0.5 ** index for index in range(len(positions))]
+        return tuple(positions), tuple(accumulate(weights))
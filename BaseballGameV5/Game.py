@@ -1,12 +1,10 @@
-from ast import Pass, literal_eval
+from ast import Pass
 import Team
 import Rules
 import Action
 import Baselines
 import json
 import csv
-import random
-import numpy as np
 import Stats as stats
 import pandas as pd
 
@@ -15,39 +13,38 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from adapter import PlayerAdapter, BaselineAdapter, RulesAdapter, InjuryAdapter
+from rng import GameRNG
+from event_log import EventLog, OFF
+from config_cache import CONFIG_CACHE
+from analytics import GameAnalytics
+from pitching_decisions import PitchingDecisionTracker
+from snapshot import GameSnapshot
+from game_state import GameState, StateAttributes
+from defense import DefenseTiming, fielding
+from Steals import BaserunningEngine
+from expectancy import TABLE_CACHE as EXPECTANCY_TABLES
+from surrogate_defense import TABLE_CACHE as SURROGATE_TABLES
+
+
+class Game(StateAttributes):
+    # Result sections that are only built when requested
+    OPTIONAL_SECTIONS = ("game_summary", "play_by_play", "tuning_data", "debug")
+    # Sections built from the running play-by-play aggregates
+    ANALYTICS_SECTIONS = frozenset(("game_summary", "tuning_data", "debug"))
 
-
-class Game():
     def __init__(self, gamedict):
         self.gname = gamedict.get("gameid")
+        self.rng = GameRNG(gamedict.get("seed"))
         self.baselines = Baselines.Baselines(gamedict.get("Rules"))
         self.hometeam = Team.Team(gamedict.get("Home"), "Home", gamedict.get("Rotation"), self.baselines)
         self.awayteam = Team.Team(gamedict.get("Away"), "Away", gamedict.get("Rotation"), self.baselines)
         self.rules = Rules.Rules(gamedict.get("Rules"))
         self.currentinning = 1
-        self.currentouts = 0
-        self.currentballs = 0
-        self.currentstrikes = 0
+        self.state = GameState()
+        self.action_counter = 0
         self.outcount = 0
-        self.on_firstbase = None
-        self.on_secondbase = None
-        self.on_thirdbase = None
         self.current_runners_home = []
-        self.is_walk = False
-        self.is_strikeout = False
-        self.is_pickoff = False
-        self.is_stealattempt = False
-        self.is_stealsuccess = False
-        self.is_inplay = False
-        self.is_hit = False #temp
-        self.is_hbp = False
         self.error_count = 0
-        self.is_single = False
-        self.is_double = False
-        self.is_triple = False
-        self.is_homerun = False
-        self.is_liveball = False
-        self.ab_over = False
         self.topofinning = True
         self.gamedone = False
         self.battingteam = self.awayteam
@@ -57,6 +54,21 @@ class Game():
         self.targeted_defender = None
         self.skip_bool = None
         self.actions = []
+        self.record_actions = True
+        self.outcome_only = False
+        self.pa_sampling = False
+        self.matchup_cache = {}
+        self.defense_timing = DefenseTiming()
+        self.play_resolver = fielding(self)
+        self.baserunning_engine = BaserunningEngine(self)
+        self.timing_diagnostics = 0
+        self.surrogate_defense = None
+        self.players_by_id = {}
+        self.player_names_by_id = {}
+        self.analytics = None
+        self.expectancy = None
+        self.decision_tracker = PitchingDecisionTracker()
+        self.event_log = EventLog()
         self.overallresults = []
         self.meta = Game.GameResult(self.gname, self.hometeam, self.awayteam, self.actions)
 
@@ -76,28 +88,21 @@ class Game():
         Returns:
             Game instance ready to run
         """
-        # Seed random for deterministic simulation
-        # Both Python's random and numpy's random must be seeded for full determinism
-        random_seed = payload.get("random_seed")
-        if random_seed:
-            seed_int = int(random_seed)
-            random.seed(seed_int)
-            # numpy requires seed between 0 and 2^32-1, so use modulo for large seeds
-            np.random.seed(seed_int % (2**32))
-
         # Create instance without calling __init__
         instance = object.__new__(cls)
 
+        # Per-game RNG for deterministic simulation; every phase draws from
+        # its own child stream split from this seed, never the global state
+        random_seed = payload.get("random_seed")
+        instance.rng = GameRNG(int(random_seed) if random_seed else None)
+
         # Game identification
         instance.gname = payload.get("game_id", 0)
 
-        # Adapt baselines from level_config and game_constants
-        baseline_data = BaselineAdapter.adapt(level_config, game_constants)
-        instance.baselines = Baselines.Baselines.from_dict(baseline_data)
-
-        # Adapt rules (now passed in from top-level, not from payload)
-        rules_data = RulesAdapter.adapt(rules)
-        instance.rules = Rules.Rules.from_dict(rules_data)
+        # Adapted baselines and rules are shared (frozen) between every game
+        # with the same level config, game constants and rules
+        instance.baselines = CONFIG_CACHE.get_baselines(level_config, game_constants)
+        instance.rules = CONFIG_CACHE.get_rules(rules)
         use_dh = instance.rules.dh
 
         # Get ballpark modifiers
@@ -148,29 +153,11 @@ class Game():
 
         # Initialize game state
         instance.currentinning = 1
-        instance.currentouts = 0
-        instance.currentballs = 0
-        instance.currentstrikes = 0
+        instance.state = GameState()
+        instance.action_counter = 0
         instance.outcount = 0
-        instance.on_firstbase = None
-        instance.on_secondbase = None
-        instance.on_thirdbase = None
         instance.current_runners_home = []
-        instance.is_walk = False
-        instance.is_strikeout = False
-        instance.is_pickoff = False
-        instance.is_stealattempt = False
-        instance.is_stealsuccess = False
-        instance.is_inplay = False
-        instance.is_hit = False
-        instance.is_hbp = False
         instance.error_count = 0
-        instance.is_single = False
-        instance.is_double = False
-        instance.is_triple = False
-        instance.is_homerun = False
-        instance.is_liveball = False
-        instance.ab_over = False
         instance.topofinning = True
         instance.gamedone = False
         instance.battingteam = instance.awayteam
@@ -180,6 +167,31 @@ class Game():
         instance.targeted_defender = None
         instance.skip_bool = None
         instance.actions = []
+        instance.record_actions = True
+        # Outcome-only mode: final score, box score and injuries, with no
+        # play-by-play, snapshots, diagnostics or play descriptions
+        instance.outcome_only = False
+        # PA sampling mode: pitches drawn from each matchup's cached outcome
+        # distribution (whole PAs at once with the bases empty)
+        instance.pa_sampling = False
+        instance.matchup_cache = {}
+        instance.defense_timing = DefenseTiming()
+        # Ball-in-play resolver with pooled per-play state
+        instance.play_resolver = fielding(instance)
+        # Pre-pitch pickoff/steal tables for the current pitcher and runners
+        instance.baserunning_engine = BaserunningEngine(instance)
+        # Defensive timing diagnostics on every Nth ball in play (0 = off)
+        instance.timing_diagnostics = 0
+        # Optional surrogate_defense.SurrogateDefense: balls in play sampled
+        # from pre-tabulated outcome distributions instead of resolved
+        instance.surrogate_defense = None
+        instance.players_by_id = {}
+        instance.player_names_by_id = {}
+        instance.analytics = None
+        # Optional expectancy.ExpectancyTables for per-event WPA/leverage
+        instance.expectancy = None
+        instance.decision_tracker = PitchingDecisionTracker()
+        instance.event_log = EventLog()
         instance.overallresults = []
         instance.ingame_injury_reports = []
 
@@ -195,20 +207,61 @@ class Game():
 
         return instance
 
-    def run_simulation(self):
+    def apply_options(self, options, level_config: dict, game_constants: dict, rules: dict):
+        """
+        Switch on the logging and engine modes of a request.
+
+        Args:
+            options: GameOptions of the request
+            level_config: Level config the game was built from
+            game_constants: Game constants the game was built from
+            rules: Rules dict the game was built from (with the two above,
+                   keys the cached expectancy and surrogate defense tables)
+
+        Raises:
+            LookupError: Surrogate defense requested but no tables were
+                         generated for the level config
+        """
+        self.event_log = EventLog(options.log_level, export=True)
+        if options.expectancy:
+            self.expectancy = EXPECTANCY_TABLES.get(level_config, game_constants, rules)
+        self.outcome_only = options.outcome_only
+        self.pa_sampling = options.pa_sampling
+        if options.surrogate_defense:
+            self.surrogate_defense = SURROGATE_TABLES.require(level_config, game_constants, rules)
+        self.timing_diagnostics = options.timing_diagnostics
+
+    def run_simulation(self, sections=None):
         """
         Run the game simulation and return results.
 
+        Args:
+            sections: Optional sections to build (see OPTIONAL_SECTIONS).
+                      None builds all of them. game_id, result, boxscore and
+                      injuries are always returned. Unrequested sections are
+                      never computed, and play-by-play is only recorded when
+                      some requested section needs it. Outcome-only games
+                      (self.outcome_only) build no sections and log nothing;
+                      with the same seed their scores and box score match a
+                      full-fidelity run.
+
         Returns:
-            Dict with game results, boxscore, play-by-play, injuries, tuning data
+            Dict with game results, boxscore, injuries and the requested sections
         """
+        sections = Game.resolve_sections(sections)
+        if self.outcome_only:
+            sections = frozenset()
+            self.event_log = EventLog(OFF)
+        self.record_actions = bool(sections)
+        if sections & Game.ANALYTICS_SECTIONS:
+            self.analytics = GameAnalytics(self.player_index(), self.player_names())
+
         # Run the game
         while self.gamedone == False:
             x = Action.Action(self)
-        Action.Action.counter = 0
 
         # Build results
-        return {
+        results = {
             "game_id": self.gname,
             "result": {
                 "home_team": self.hometeam.name,
@@ -217,13 +270,87 @@ class Game():
                 "away_score": self.awayteam.score,
                 "winning_team": self.hometeam.name if self.hometeam.score > self.awayteam.score else self.awayteam.name
             },
-            "game_summary": self._build_game_summary(),
-            "boxscore": self.ReturnBox(),
-            "play_by_play": self.actions,
-            "injuries": self.pregame_injury_reports + getattr(self, 'ingame_injury_reports', []),
-            "tuning_data": self._build_tuning_data(),
-            "debug": self._build_debug_data()
         }
+        if "game_summary" in sections:
+            results["game_summary"] = self._build_game_summary()
+        if "play_by_play" in sections:
+            play_by_play = self.play_by_play()
+            results["boxscore"] = self.ReturnBox(playbyplay=play_by_play)
+            results["play_by_play"] = play_by_play
+        else:
+            results["boxscore"] = self.ReturnBox(include_playbyplay=False)
+        results["injuries"] = self.pregame_injury_reports + getattr(self, 'ingame_injury_reports', [])
+        if "tuning_data" in sections:
+            results["tuning_data"] = self._build_tuning_data()
+        if "debug" in sections:
+            results["debug"] = self._build_debug_data()
+        return results
+
+    def player_index(self) -> dict:
+        """Player id -> Player for everyone on either roster."""
+        if not self.players_by_id:
+            for team in (self.awayteam, self.hometeam):
+                for player in team.roster.playerlist:
+                    self.players_by_id[player.id] = player
+        return self.players_by_id
+
+    def player_names(self) -> dict:
+        """Player id -> "First Last" for everyone on either roster."""
+        if not self.player_names_by_id:
+            self.player_names_by_id = {
+                pid: f"{player.firstname} {player.lastname}" for pid, player in self.player_index().items()
+            }
+        return self.player_names_by_id
+
+    def player_ref(self, pid):
+        """Serializable reference dict for a player id (None for no player)."""
+        if pid is None:
+            return None
+        return {"player_id": pid, "player_name": self.player_names().get(pid, " ")}
+
+    def snapshot(self) -> GameSnapshot:
+        """
+        Capture the game between actions for forking (see snapshot.py).
+
+        Returns:
+            GameSnapshot whose fork() builds independent copies of this game
+        """
+        return GameSnapshot(self)
+
+    def _analytics(self) -> GameAnalytics:
+        """Play-by-play aggregates (replayed from the recorded actions if they weren't kept live)."""
+        if self.analytics is None:
+            self.analytics = GameAnalytics.from_events(self.actions, self.player_index(), self.player_names())
+        return self.analytics
+
+    def play_by_play(self) -> list:
+        """Recorded PlayEvents expanded to the play-by-play dict shape."""
+        names = self.player_names()
+        return [event.to_dict(names) for event in self.actions]
+
+    @staticmethod
+    def resolve_sections(sections=None) -> frozenset:
+        """
+        Validate a section selection.
+
+        Args:
+            sections: Iterable of section names, or None for all of them
+
+        Returns:
+            frozenset of selected section names
+
+        Raises:
+            ValueError: If an unknown section is requested
+        """
+        if sections is None:
+            return frozenset(Game.OPTIONAL_SECTIONS)
+        sections = frozenset(sections)
+        unknown = sections - set(Game.OPTIONAL_SECTIONS)
+        if unknown:
+            raise ValueError(
+                f"Unknown sections {sorted(unknown)}; expected any of {list(Game.OPTIONAL_SECTIONS)}"
+            )
+        return sections
 
     def _build_tuning_data(self):
         """Build tuning data for analysis and debugging."""
@@ -250,124 +377,18 @@ class Game():
 
     def _get_pitching_decisions(self):
         """
-        Determine W/L/S/BS for pitchers.
-
-        Rules:
-        - Winning pitcher: pitcher of record when team takes the final lead
-        - Losing pitcher: pitcher who gave up the run that put opponent ahead for good
-        - Save: reliever finishes game with lead, wasn't winning pitcher, and:
-          - Entered with lead of 3 or less, OR
-          - Entered with tying run on base/at bat/on deck, OR
-          - Pitched at least 3 innings
-        - Blown save: pitcher in save situation who allowed tying/go-ahead run
-        """
-        # Track score changes and pitcher of record through the game
-        home_score = 0
-        away_score = 0
-        home_pitcher_of_record = None  # Pitcher credited if home wins
-        away_pitcher_of_record = None  # Pitcher credited if away wins
-        home_losing_pitcher = None     # Pitcher blamed if home loses
-        away_losing_pitcher = None     # Pitcher blamed if away loses
-
-        # Track current pitchers (from play-by-play)
-        current_home_pitcher = None
-        current_away_pitcher = None
-
-        # Save situation tracking
-        save_candidate = None
-        save_situation_entered = False
-        blown_saves = []
-
-        for action in self.actions:
-            # Track current pitcher
-            pitcher_info = action.get("Pitcher")
-            inning_half = action.get("Inning Half")
-
-            if pitcher_info:
-                pitcher_id = pitcher_info.get("player_id")
-                if inning_half == "Top":
-                    # Top of inning = away batting, home pitching
-                    current_home_pitcher = pitcher_info
-                else:
-                    # Bottom of inning = home batting, away pitching
-                    current_away_pitcher = pitcher_info
-
-            # Get runs scored this action
-            runners_scored = action.get("Runners_Scored", 0)
-            if runners_scored > 0:
-                prev_home = home_score
-                prev_away = away_score
-
-                if inning_half == "Top":
-                    away_score += runners_scored
-                else:
-                    home_score += runners_scored
-
-                # Check if lead changed
-                prev_lead = prev_home - prev_away  # Positive = home leads
-                new_lead = home_score - away_score
-
-                # Determine if a team took the lead
-                if prev_lead <= 0 and new_lead > 0:
-                    # Home took the lead
-                    home_pitcher_of_record = current_home_pitcher
-                    # The away pitcher who gave up the lead is the losing pitcher candidate
-                    away_losing_pitcher = current_away_pitcher
-                elif prev_lead >= 0 and new_lead < 0:
-                    # Away took the lead
-                    away_pitcher_of_record = current_away_pitcher
-                    # The home pitcher who gave up the lead is the losing pitcher candidate
-                    home_losing_pitcher = current_home_pitcher
-                elif prev_lead == 0 and new_lead == 0:
-                    # Still tied - no change
-                    pass
-
-        # Final score
-        final_home = self.hometeam.score
-        final_away = self.awayteam.score
-
-        # Determine winning and losing pitchers
-        winning_pitcher = None
-        losing_pitcher = None
-
-        if final_home > final_away:
-            winning_pitcher = home_pitcher_of_record
-            losing_pitcher = away_losing_pitcher
-        elif final_away > final_home:
-            winning_pitcher = away_pitcher_of_record
-            losing_pitcher = home_losing_pitcher
-
-        # Determine save (simplified: last pitcher on winning team who isn't winning pitcher)
-        save_pitcher = None
-        if final_home != final_away:
-            winning_team = self.hometeam if final_home > final_away else self.awayteam
-            # Get the last pitcher used by winning team
-            last_winning_pitcher = None
-            for action in reversed(self.actions):
-                pitcher_info = action.get("Pitcher")
-                if pitcher_info:
-                    inning_half = action.get("Inning Half")
-                    is_winning_team_pitching = (
-                        (inning_half == "Top" and final_home > final_away) or
-                        (inning_half == "Bottom" and final_away > final_home)
-                    )
-                    if is_winning_team_pitching:
-                        last_winning_pitcher = pitcher_info
-                        break
-
-            # Check if save situation (different pitcher than winning pitcher, closed out game)
-            if (last_winning_pitcher and winning_pitcher and
-                last_winning_pitcher.get("player_id") != winning_pitcher.get("player_id")):
-                lead_margin = abs(final_home - final_away)
-                # Simple save: finished game with lead of 3 or less
-                if lead_margin <= 3:
-                    save_pitcher = last_winning_pitcher
+        Pitching decisions (W/L/S/BS/holds) as of the current action.
 
+        Kept up to date by the decision tracker as each action is processed,
+        so this is valid mid-game as well as at the end.
+        """
+        decisions = self.decision_tracker.result(self.hometeam.score, self.awayteam.score)
         return {
-            "winning_pitcher": winning_pitcher,
-            "losing_pitcher": losing_pitcher,
-            "save": save_pitcher,
-            "blown_saves": blown_saves  # Future enhancement
+            "winning_pitcher": self.player_ref(decisions["winning_pitcher"]),
+            "losing_pitcher": self.player_ref(decisions["losing_pitcher"]),
+            "save": self.player_ref(decisions["save"]),
+            "blown_saves": [self.player_ref(pid) for pid in decisions["blown_saves"]],
+            "holds": [self.player_ref(pid) for pid in decisions["holds"]],
         }
 
     def _get_team_totals(self):
@@ -436,29 +457,13 @@ class Game():
             totals["innings_pitched"] = stats.outs_to_innings(total_outs)
             return totals
 
-        # Calculate LOB from play-by-play (runners stranded at end of innings)
-        home_lob = 0
-        away_lob = 0
-        for action in self.actions:
-            # End of half-inning: 3 outs
-            if action.get("Out Count") == 3:
-                runners_on = 0
-                if action.get("On First"):
-                    runners_on += 1
-                if action.get("On Second"):
-                    runners_on += 1
-                if action.get("On Third"):
-                    runners_on += 1
-
-                if action.get("Inning Half") == "Top":
-                    away_lob += runners_on
-                else:
-                    home_lob += runners_on
+        # LOB from play-by-play (runners stranded at end of innings)
+        left_on_base = self._analytics().left_on_base
 
         home_batting = get_team_batting_totals(self.hometeam)
         away_batting = get_team_batting_totals(self.awayteam)
-        home_batting["left_on_base"] = home_lob
-        away_batting["left_on_base"] = away_lob
+        home_batting["left_on_base"] = left_on_base["home"]
+        away_batting["left_on_base"] = left_on_base["away"]
 
         return {
             "away": {
@@ -479,13 +484,7 @@ class Game():
         is_walkoff = False
         if self.hometeam.score > self.awayteam.score:
             # Home won - check if they scored the winning run in their last at-bat
-            last_home_action = None
-            for action in reversed(self.actions):
-                if action.get("Inning Half") == "Bottom":
-                    last_home_action = action
-                    break
-            if last_home_action and last_home_action.get("Runners_Scored", 0) > 0:
-                is_walkoff = True
+            is_walkoff = self._analytics().is_walkoff()
 
         # Count total pitches
         home_pitches = sum(p.pitchingstats.pitches_thrown for p in self.hometeam.roster.playerlist)
@@ -572,153 +571,11 @@ class Game():
 
     def _get_contact_distribution(self):
         """Calculate contact type distribution from play-by-play."""
-        contact_types = ["barrel", "solid", "flare", "burner", "under", "topped", "weak"]
-        counts = {ct: 0 for ct in contact_types}
-        total = 0
-
-        for action in self.actions:
-            batted_ball = action.get("Batted Ball")
-            if batted_ball and batted_ball != "None":
-                if batted_ball in counts:
-                    counts[batted_ball] += 1
-                    total += 1
-
-        # Calculate percentages
-        distribution = {}
-        for ct in contact_types:
-            count = counts[ct]
-            pct = round((count / total * 100), 1) if total > 0 else 0
-            distribution[ct] = {"count": count, "pct": pct}
-
-        distribution["total_batted_balls"] = total
-        return distribution
+        return self._analytics().contact_distribution()
 
     def _get_baserunning_analysis(self):
-        """Analyze baserunning outcomes for tuning validation using Pre_R1/R2/R3 fields."""
-        analysis = {
-            # Sac fly tracking
-            "sac_fly_opportunities": 0,  # R3 with <2 outs, fly ball out
-            "sac_fly_scores": 0,
-
-            # R2 on single tracking
-            "r2_on_single_opportunities": 0,
-            "r2_scores_on_single": 0,
-
-            # R1 advancement tracking
-            "r1_on_single_opportunities": 0,
-            "r1_to_third_on_single": 0,
-
-            # R1 on double tracking
-            "r1_on_double_opportunities": 0,
-            "r1_scores_on_double": 0,
-
-            # Tag-up tracking
-            "tag_up_attempts": 0,
-            "tag_up_successes": 0,
-
-            # Overall
-            "total_runs_scored": 0,
-            "runs_on_hits": 0,
-            "runs_on_sac_flies": 0,
-
-            # Double play / Triple play tracking
-            "dp_opportunities": 0,  # R1 with <2 outs, ground ball
-            "dp_completed": 0,      # 2+ outs on DP opportunity
-            "tp_opportunities": 0,  # R1+R2 with 0 outs, ground ball
-            "tp_completed": 0,      # 3 outs on TP opportunity
-        }
-
-        for action in self.actions:
-            # Track runs scored
-            runners_scored = action.get("Runners_Scored", 0)
-            if runners_scored:
-                analysis["total_runs_scored"] += runners_scored
-
-            # Get pre-play state (captured at start of action)
-            pre_r1 = action.get("Pre_R1")
-            pre_r2 = action.get("Pre_R2")
-            pre_r3 = action.get("Pre_R3")
-            pre_outs = action.get("Pre_Outs", 0)
-
-            # Get post-play state
-            on_third = action.get("On Third")
-            outcome = action.get("Defensive Outcome")
-            air_or_ground = action.get("Air or Ground")
-            runners_scored_ids = action.get("Runners_Scored_IDs", [])
-
-            # Helper to check if a player scored
-            def player_scored(pre_player):
-                if not pre_player:
-                    return False
-                player_id = pre_player.get("player_id")
-                return player_id in runners_scored_ids
-
-            # Helper to check if a player is on a specific base
-            def player_on_base(pre_player, base_obj):
-                if not pre_player or not base_obj:
-                    return False
-                return pre_player.get("player_id") == base_obj.get("player_id")
-
-            # Sac fly opportunity: R3 with <2 outs, OUTFIELD fly ball out
-            # Only count outfield depths as true sac fly opportunities
-            hit_depth = action.get("Hit Depth", "")
-            outfield_depths = ["deep_of", "middle_of", "shallow_of"]
-            if pre_r3 and pre_outs < 2 and air_or_ground == "air" and outcome == "out" and hit_depth in outfield_depths:
-                analysis["sac_fly_opportunities"] += 1
-                if player_scored(pre_r3):
-                    analysis["sac_fly_scores"] += 1
-                    analysis["runs_on_sac_flies"] += 1
-
-            # R2 on single
-            if pre_r2 and outcome == "single":
-                analysis["r2_on_single_opportunities"] += 1
-                if player_scored(pre_r2):
-                    analysis["r2_scores_on_single"] += 1
-
-            # R1 on single
-            if pre_r1 and outcome == "single":
-                analysis["r1_on_single_opportunities"] += 1
-                if player_on_base(pre_r1, on_third):
-                    analysis["r1_to_third_on_single"] += 1
-
-            # R1 on double
-            if pre_r1 and outcome == "double":
-                analysis["r1_on_double_opportunities"] += 1
-                if player_scored(pre_r1):
-                    analysis["r1_scores_on_double"] += 1
-
-            # Track tag-up events from defensive actions
-            defensive_actions = str(action.get("Defensive Actions", ""))
-            if "tags to" in defensive_actions:
-                analysis["tag_up_attempts"] += 1
-                analysis["tag_up_successes"] += 1
-
-            # Track DP/TP opportunities and completions
-            # Use the pre-computed fields from ActionPrint
-            if action.get("Is_DP_Opportunity"):
-                analysis["dp_opportunities"] += 1
-                if action.get("Is_DP"):
-                    analysis["dp_completed"] += 1
-
-            if action.get("Is_TP_Opportunity"):
-                analysis["tp_opportunities"] += 1
-                if action.get("Is_TP"):
-                    analysis["tp_completed"] += 1
-
-        # Calculate rates
-        def safe_rate(num, denom):
-            return round(num / denom * 100, 1) if denom > 0 else 0.0
-
-        analysis["rates"] = {
-            "sac_fly_rate": safe_rate(analysis["sac_fly_scores"], analysis["sac_fly_opportunities"]),
-            "r2_scores_on_single_rate": safe_rate(analysis["r2_scores_on_single"], analysis["r2_on_single_opportunities"]),
-            "r1_to_third_on_single_rate": safe_rate(analysis["r1_to_third_on_single"], analysis["r1_on_single_opportunities"]),
-            "r1_scores_on_double_rate": safe_rate(analysis["r1_scores_on_double"], analysis["r1_on_double_opportunities"]),
-            "dp_rate": safe_rate(analysis["dp_completed"], analysis["dp_opportunities"]),
-            "tp_rate": safe_rate(analysis["tp_completed"], analysis["tp_opportunities"]),
-        }
-
-        return analysis
+        """Analyze baserunning outcomes for tuning validation using pre-play runner state."""
+        return self._analytics().baserunning_analysis()
 
     def _build_debug_data(self):
         """
@@ -902,39 +759,7 @@ class Game():
         Summarize matchup advantages from play-by-play.
         Extracts advantage data logged in actions.
         """
-        advantages = {
-            "contact": [],
-            "power": [],
-            "eye": [],
-            "discipline": []
-        }
-
-        for action in self.actions:
-            # Check if interaction data exists
-            interaction = action.get("Interaction_Data", {})
-            if interaction:
-                for key in advantages.keys():
-                    adv_key = f"adv_{key}"
-                    if adv_key in interaction and interaction[adv_key] is not None:
-                        advantages[key].append(interaction[adv_key])
-
-        # Calculate statistics
-        def calc_stats(values):
-            if not values:
-                return {"count": 0, "min": None, "max": None, "avg": None}
-            return {
-                "count": len(values),
-                "min": round(min(values), 3),
-                "max": round(max(values), 3),
-                "avg": round(sum(values) / len(values), 3)
-            }
-
-        return {
-            "contact_advantage": calc_stats(advantages["contact"]),
-            "power_advantage": calc_stats(advantages["power"]),
-            "eye_advantage": calc_stats(advantages["eye"]),
-            "discipline_advantage": calc_stats(advantages["discipline"]),
-        }
+        return self._analytics().advantage_summary()
 
     def _get_pitcher_matchup_data(self):
         """Get pitcher attribute averages for matchup analysis."""
@@ -978,26 +803,7 @@ class Game():
         Get sample interaction snapshots for debugging.
         Returns up to max_samples of batted ball events with full interaction data.
         """
-        samples = []
-        for action in self.actions:
-            if action.get("Batted Ball") and action.get("Batted Ball") != "None":
-                sample = {
-                    "inning": action.get("Inning"),
-                    "inning_half": action.get("Inning Half"),
-                    "batter": action.get("Batter", {}).get("player_name"),
-                    "pitcher": action.get("Pitcher", {}).get("player_name"),
-                    "batted_ball": action.get("Batted Ball"),
-                    "direction": action.get("Hit Direction"),
-                    "depth": action.get("Hit Depth"),
-                    "outcome": action.get("Defensive Outcome"),
-                    "interaction_data": action.get("Interaction_Data"),
-                    "modifier_data": action.get("Modifier_Data"),
-                }
-                samples.append(sample)
-                if len(samples) >= max_samples:
-                    break
-
-        return samples
+        return self._analytics().samples(max_samples)
 
     def _get_defense_data(self):
         """Get defensive performance data for all fielders."""
@@ -1054,384 +860,30 @@ class Game():
 
     def _get_tier_distribution_by_player(self):
         """Track which tier each batter lands in most often."""
-        player_tiers = {}
-
-        for action in self.actions:
-            batter = action.get("Batter", {})
-            batter_id = batter.get("player_id")
-            if not batter_id:
-                continue
-
-            modifier_data = action.get("Modifier_Data", {})
-            if not modifier_data:
-                continue
-
-            tier = modifier_data.get("selected_tier")
-            if not tier:
-                continue
-
-            if batter_id not in player_tiers:
-                player_tiers[batter_id] = {
-                    "player_name": batter.get("player_name"),
-                    "quality": 0,
-                    "neutral": 0,
-                    "poor": 0,
-                    "total": 0
-                }
-
-            player_tiers[batter_id][tier] += 1
-            player_tiers[batter_id]["total"] += 1
-
-        # Calculate percentages
-        for player_id, data in player_tiers.items():
-            total = data["total"]
-            if total > 0:
-                data["quality_pct"] = round(data["quality"] / total * 100, 1)
-                data["neutral_pct"] = round(data["neutral"] / total * 100, 1)
-                data["poor_pct"] = round(data["poor"] / total * 100, 1)
-
-        return player_tiers
+        return self._analytics().tier_distribution_by_player()
 
     def _get_swing_decision_rates(self):
         """Track swing rates on Inside (strikes) vs Outside (balls) by player."""
-        player_swings = {}
-
-        for action in self.actions:
-            batter = action.get("Batter", {})
-            batter_id = batter.get("player_id")
-            if not batter_id:
-                continue
-
-            interaction = action.get("Interaction_Data", {})
-            if not interaction:
-                continue
-
-            swing_decision = interaction.get("swing_decision")
-            final_location = interaction.get("final_location")
-
-            if swing_decision is None or final_location is None:
-                continue
-
-            if batter_id not in player_swings:
-                player_swings[batter_id] = {
-                    "player_name": batter.get("player_name"),
-                    "inside_swings": 0,
-                    "inside_takes": 0,
-                    "outside_swings": 0,
-                    "outside_takes": 0,
-                }
-
-            if final_location == "Inside":
-                if swing_decision == "Swing":
-                    player_swings[batter_id]["inside_swings"] += 1
-                else:
-                    player_swings[batter_id]["inside_takes"] += 1
-            else:  # Outside
-                if swing_decision == "Swing":
-                    player_swings[batter_id]["outside_swings"] += 1
-                else:
-                    player_swings[batter_id]["outside_takes"] += 1
-
-        # Calculate rates
-        for player_id, data in player_swings.items():
-            inside_total = data["inside_swings"] + data["inside_takes"]
-            outside_total = data["outside_swings"] + data["outside_takes"]
-
-            data["inside_swing_rate"] = round(data["inside_swings"] / inside_total * 100, 1) if inside_total > 0 else 0
-            data["outside_swing_rate"] = round(data["outside_swings"] / outside_total * 100, 1) if outside_total > 0 else 0
-            data["chase_rate"] = data["outside_swing_rate"]  # Alias for clarity
-
-        return player_swings
+        return self._analytics().swing_decision_rates()
 
     def _get_whiff_rates_by_advantage(self):
         """Track K% bucketed by eye advantage."""
-        buckets = {
-            "very_negative": {"range": "< -0.6", "swings": 0, "whiffs": 0, "contacts": 0},
-            "negative": {"range": "-0.6 to -0.3", "swings": 0, "whiffs": 0, "contacts": 0},
-            "slight_negative": {"range": "-0.3 to 0", "swings": 0, "whiffs": 0, "contacts": 0},
-            "slight_positive": {"range": "0 to 0.3", "swings": 0, "whiffs": 0, "contacts": 0},
-            "positive": {"range": "0.3 to 0.6", "swings": 0, "whiffs": 0, "contacts": 0},
-            "very_positive": {"range": ">= 0.6", "swings": 0, "whiffs": 0, "contacts": 0},
-        }
-
-        for action in self.actions:
-            interaction = action.get("Interaction_Data", {})
-            if not interaction:
-                continue
-
-            eye_adv = interaction.get("adv_eye")
-            swing_decision = interaction.get("swing_decision")
-            contact_result = interaction.get("contact_result")
-
-            if eye_adv is None or swing_decision != "Swing":
-                continue
-
-            # Determine bucket
-            if eye_adv < -0.6:
-                bucket = "very_negative"
-            elif eye_adv < -0.3:
-                bucket = "negative"
-            elif eye_adv < 0:
-                bucket = "slight_negative"
-            elif eye_adv < 0.3:
-                bucket = "slight_positive"
-            elif eye_adv < 0.6:
-                bucket = "positive"
-            else:
-                bucket = "very_positive"
-
-            buckets[bucket]["swings"] += 1
-            if contact_result == "Whiff":
-                buckets[bucket]["whiffs"] += 1
-            elif contact_result in ["Foul", "InPlay"]:
-                buckets[bucket]["contacts"] += 1
-
-        # Calculate rates
-        for bucket, data in buckets.items():
-            if data["swings"] > 0:
-                data["whiff_rate"] = round(data["whiffs"] / data["swings"] * 100, 1)
-                data["contact_rate"] = round(data["contacts"] / data["swings"] * 100, 1)
-            else:
-                data["whiff_rate"] = 0
-                data["contact_rate"] = 0
-
-        return buckets
+        return self._analytics().whiff_rates_by_advantage()
 
     def _get_barrel_rates_by_power_advantage(self):
         """Track barrel% bucketed by power advantage."""
-        buckets = {
-            "very_negative": {"range": "< -0.6", "quality_hits": 0, "barrels": 0, "solids": 0},
-            "negative": {"range": "-0.6 to -0.3", "quality_hits": 0, "barrels": 0, "solids": 0},
-            "slight_negative": {"range": "-0.3 to 0", "quality_hits": 0, "barrels": 0, "solids": 0},
-            "slight_positive": {"range": "0 to 0.3", "quality_hits": 0, "barrels": 0, "solids": 0},
-            "positive": {"range": "0.3 to 0.6", "quality_hits": 0, "barrels": 0, "solids": 0},
-            "very_positive": {"range": ">= 0.6", "quality_hits": 0, "barrels": 0, "solids": 0},
-        }
-
-        for action in self.actions:
-            modifier_data = action.get("Modifier_Data", {})
-            if not modifier_data:
-                continue
-
-            power_adv = modifier_data.get("power_advantage")
-            selected_tier = modifier_data.get("selected_tier")
-            batted_ball = action.get("Batted Ball")
-
-            if power_adv is None or selected_tier != "quality":
-                continue
-
-            # Determine bucket
-            if power_adv < -0.6:
-                bucket = "very_negative"
-            elif power_adv < -0.3:
-                bucket = "negative"
-            elif power_adv < 0:
-                bucket = "slight_negative"
-            elif power_adv < 0.3:
-                bucket = "slight_positive"
-            elif power_adv < 0.6:
-                bucket = "positive"
-            else:
-                bucket = "very_positive"
-
-            buckets[bucket]["quality_hits"] += 1
-            if batted_ball == "barrel":
-                buckets[bucket]["barrels"] += 1
-            elif batted_ball == "solid":
-                buckets[bucket]["solids"] += 1
-
-        # Calculate rates
-        for bucket, data in buckets.items():
-            if data["quality_hits"] > 0:
-                data["barrel_rate"] = round(data["barrels"] / data["quality_hits"] * 100, 1)
-                data["solid_rate"] = round(data["solids"] / data["quality_hits"] * 100, 1)
-            else:
-                data["barrel_rate"] = 0
-                data["solid_rate"] = 0
-
-        return buckets
+        return self._analytics().barrel_rates_by_power_advantage()
 
     def _get_count_situation_data(self):
         """Track outcomes by ball/strike count."""
-        counts = {}
-
-        for action in self.actions:
-            # Use correct field names from ActionPrint
-            balls = action.get("Ball Count", 0)
-            strikes = action.get("Strike Count", 0)
-            count_key = f"{balls}-{strikes}"
-
-            defensive_outcome = action.get("Defensive Outcome")
-            batted_ball = action.get("Batted Ball")
-
-            if count_key not in counts:
-                counts[count_key] = {
-                    "total_pitches": 0,
-                    "balls": 0,
-                    "strikes_looking": 0,
-                    "strikes_swinging": 0,
-                    "fouls": 0,
-                    "in_play": 0,
-                    "hits": 0,
-                    "outs": 0,
-                    "walks": 0,
-                    "strikeouts": 0,
-                    "hbp": 0,
-                }
-
-            counts[count_key]["total_pitches"] += 1
-
-            # Parse the Outcomes string to get result type and detail
-            # Format: "['Strike', 'Looking', 'Fastball']" or "['Ball', 'Looking', 'Slider']"
-            # or for batted balls: "['barrel', 'center left', 'Fastball']"
-            outcomes_str = action.get("Outcomes", "")
-            result_type = None
-            result_detail = None
-
-            if outcomes_str and outcomes_str != "None":
-                try:
-                    # Parse the string representation of the list
-                    outcomes_list = literal_eval(outcomes_str)
-                    if len(outcomes_list) >= 1:
-                        result_type = outcomes_list[0]
-                    if len(outcomes_list) >= 2:
-                        result_detail = outcomes_list[1]
-                except (ValueError, SyntaxError):
-                    # Fallback: simple string parsing
-                    pass
-
-            # Use boolean flags as backup/verification
-            is_foul = action.get("Is_Foul", False)
-            is_hbp = action.get("Is_HBP", False)
-            is_inplay = action.get("Is_InPlay", False)
-            is_walk = action.get("Is_Walk", False)
-            is_strikeout = action.get("Is_Strikeout", False)
-
-            # Categorize pitch outcome
-            if is_hbp or result_type == "HBP":
-                counts[count_key]["hbp"] += 1
-            elif result_type == "Ball":
-                counts[count_key]["balls"] += 1
-            elif result_type == "Strike":
-                if result_detail == "Looking":
-                    counts[count_key]["strikes_looking"] += 1
-                elif result_detail == "Swinging":
-                    counts[count_key]["strikes_swinging"] += 1
-                elif result_detail == "Foul" or is_foul:
-                    counts[count_key]["fouls"] += 1
-            elif is_foul:
-                # Foul ball (result_type might be contact type for batted foul)
-                counts[count_key]["fouls"] += 1
-
-            # Track balls in play
-            if is_inplay or (batted_ball and batted_ball != "None" and not is_foul):
-                counts[count_key]["in_play"] += 1
-                if defensive_outcome in ["single", "double", "triple", "homerun"]:
-                    counts[count_key]["hits"] += 1
-                elif defensive_outcome == "out":
-                    counts[count_key]["outs"] += 1
-
-            # Track final PA outcomes at this count
-            if action.get("AB_Over"):
-                if is_walk:
-                    counts[count_key]["walks"] += 1
-                elif is_strikeout:
-                    counts[count_key]["strikeouts"] += 1
-
-        return counts
+        return self._analytics().count_situation_data()
 
     def _get_handedness_matchup_breakdown(self):
         """Get per-matchup (LvL, LvR, RvL, RvR, SvL, SvR) advantage and outcome stats."""
-        matchups = {}
-
-        for action in self.actions:
-            batter = action.get("Batter", {})
-            pitcher = action.get("Pitcher", {})
-
-            batter_hand = batter.get("handedness", "R")[0] if batter.get("handedness") else "R"
-            pitcher_hand = pitcher.get("handedness", "R")[1] if pitcher.get("handedness") and len(pitcher.get("handedness", "")) > 1 else "R"
-
-            matchup_key = f"{batter_hand}v{pitcher_hand}"
-
-            if matchup_key not in matchups:
-                matchups[matchup_key] = {
-                    "plate_appearances": 0,
-                    "at_bats": 0,
-                    "hits": 0,
-                    "walks": 0,
-                    "strikeouts": 0,
-                    "homeruns": 0,
-                    "batted_balls": 0,
-                    "quality_contact": 0,
-                    "barrels": 0,
-                    "advantages": {
-                        "contact": [],
-                        "power": [],
-                        "eye": [],
-                        "discipline": []
-                    }
-                }
+        return self._analytics().handedness_matchup_breakdown()
 
-            matchups[matchup_key]["plate_appearances"] += 1
-
-            # Track advantages
-            interaction = action.get("Interaction_Data", {})
-            if interaction:
-                for key in ["contact", "power", "eye", "discipline"]:
-                    adv_key = f"adv_{key}"
-                    if adv_key in interaction and interaction[adv_key] is not None:
-                        matchups[matchup_key]["advantages"][key].append(interaction[adv_key])
-
-            # Track outcomes
-            outcome = action.get("Defensive Outcome")
-            result_type = action.get("Result Type")
-            batted_ball = action.get("Batted Ball")
-
-            if outcome in ["single", "double", "triple", "homerun"]:
-                matchups[matchup_key]["hits"] += 1
-                matchups[matchup_key]["at_bats"] += 1
-                if outcome == "homerun":
-                    matchups[matchup_key]["homeruns"] += 1
-            elif outcome == "out":
-                matchups[matchup_key]["at_bats"] += 1
-            elif result_type == "Ball" and action.get("Balls") == 4:
-                matchups[matchup_key]["walks"] += 1
-            elif result_type == "Strike" and action.get("Strikes") == 3:
-                matchups[matchup_key]["strikeouts"] += 1
-
-            if batted_ball and batted_ball != "None":
-                matchups[matchup_key]["batted_balls"] += 1
-                if batted_ball in ["barrel", "solid"]:
-                    matchups[matchup_key]["quality_contact"] += 1
-                if batted_ball == "barrel":
-                    matchups[matchup_key]["barrels"] += 1
-
-        # Calculate rates and averages
-        for matchup_key, data in matchups.items():
-            ab = data["at_bats"]
-            bb = data["batted_balls"]
-
-            data["avg"] = round(data["hits"] / ab, 3) if ab > 0 else 0
-            data["k_rate"] = round(data["strikeouts"] / data["plate_appearances"] * 100, 1) if data["plate_appearances"] > 0 else 0
-            data["bb_rate"] = round(data["walks"] / data["plate_appearances"] * 100, 1) if data["plate_appearances"] > 0 else 0
-            data["quality_rate"] = round(data["quality_contact"] / bb * 100, 1) if bb > 0 else 0
-            data["barrel_rate"] = round(data["barrels"] / bb * 100, 1) if bb > 0 else 0
-
-            # Calculate advantage averages
-            for key in ["contact", "power", "eye", "discipline"]:
-                values = data["advantages"][key]
-                if values:
-                    data[f"avg_{key}_advantage"] = round(sum(values) / len(values), 3)
-                else:
-                    data[f"avg_{key}_advantage"] = None
-
-            # Remove raw advantage lists to reduce output size
-            del data["advantages"]
-
-        return matchups
-
-    def ReturnBox(self):
-        test = stats.StatJSONConverter(self)
+    def ReturnBox(self, include_playbyplay=True, playbyplay=None):
+        test = stats.StatJSONConverter(self, include_playbyplay, playbyplay)
         return test 
 
     class GameResult():
@@ -1455,7 +907,6 @@ class Game():
     def RunGame(self):    
         while self.gamedone == False:
             x = Action.Action(self)
-        Action.Action.counter = 0
         listofactions = []
         thing = stats.create_score_table(self.overallresults)        
         stats.FieldStatPullSave(self.hometeam, self.gname)
@@ -1473,7 +924,7 @@ class Game():
             if player.battingstats.plate_appearances> 0:
                 pass
 
-        for action in self.actions:
+        for action in self.play_by_play():
             listofactions.append(action)    
         export_dataframe = pd.DataFrame(listofactions)
         export_dataframe.replace({"None": ""}, inplace=True)
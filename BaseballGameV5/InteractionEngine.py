@@ -1,4 +1,5 @@
-import random
+import threading
+from bisect import bisect
 
 
 def clamp(value, min_val, max_val):
@@ -6,6 +7,116 @@ def clamp(value, min_val, max_val):
     return max(min_val, min(max_val, value))
 
 
+class Matchup:
+    """
+    Everything PitchEvent needs that is fixed for a batter/pitcher/catcher
+    combination: the pitch mix, handedness-adjusted batter stats and the
+    per-pitch constants. Only the consistency roll varies pitch to pitch.
+
+    Entries are stamped with each player's ratings_version, so rating
+    changes (AbilityMod, injuries) rebuild them; substitutions simply
+    produce a different key.
+    """
+
+    __slots__ = (
+        "batter", "pitcher", "catcher", "versions",
+        "pitches", "pitch_constants",
+        "eff_contact", "eff_power", "eff_eye", "eff_discipline",
+        "pgencontrol", "frame_chance", "pitch_table"
+    )
+
+    # Pitch selection odds 5/4/3/2/1 for pitch1..pitch5, as cumulative weights
+    PITCH_CUM_WEIGHTS = (5, 9, 12, 14, 15)
+    LOCATIONS = ("Inside", "Outside")
+
+    def __init__(self, batter, pitcher, catcher):
+        self.batter = batter
+        self.pitcher = pitcher
+        self.catcher = catcher
+        self.versions = Matchup.versions_of(batter, pitcher, catcher)
+
+        self.pitches = (
+            pitcher.pitch1, pitcher.pitch2, pitcher.pitch3, pitcher.pitch4, pitcher.pitch5
+        )
+        # pitch_constants[i] = (pcntrl, pbrk, pacc, max_degrade)
+        self.pitch_constants = tuple(
+            (pitch.pcntrl, pitch.pbrk, pitch.pacc, Matchup._max_degrade(pitch))
+            for pitch in self.pitches
+        )
+
+        self._adjust_for_handedness()
+        self.pgencontrol = pitcher.pgencontrol
+
+        catchframe = max(catcher.catchframe, 20)  # Floor at 20
+        frame_normalized = (catchframe - 20) / 90  # 0.0 to 1.0
+        self.frame_chance = PitchEvent.FRAME_MIN + (frame_normalized * (PitchEvent.FRAME_MAX - PitchEvent.FRAME_MIN))
+        # Outcome distribution for PA sampling mode, built on first use
+        self.pitch_table = None
+
+    @staticmethod
+    def versions_of(batter, pitcher, catcher) -> tuple:
+        """Ratings versions a cached matchup is valid for."""
+        return (batter.ratings_version, pitcher.ratings_version, id(catcher), catcher.ratings_version)
+
+    @staticmethod
+    def _max_degrade(pitch) -> float:
+        # At consist=20: max_degrade = 0.20 (can lose up to 20%)
+        # At consist=110: max_degrade = 0.02 (almost no variance)
+        consist = max(pitch.consist, 20)  # Floor at 20
+        consist_normalized = (consist - 20) / 90  # 0.0 to 1.0
+        return 0.20 - (consist_normalized * 0.18)
+
+    def _adjust_for_handedness(self):
+        """Batter stats after the handedness matchup adjustment."""
+        mod_amount = 2
+        min_stat = 1
+        max_stat = 99
+        batter = self.batter
+
+        # Switch hitters get no adjustment
+        if batter.handedness[0] == "S":
+            self.eff_contact = batter.contact
+            self.eff_power = batter.power
+            self.eff_eye = batter.eye
+            self.eff_discipline = batter.discipline
+        # Same-side matchup (e.g., RHB vs RHP) - pitcher advantage
+        elif batter.handedness[0] == self.pitcher.handedness[1]:
+            self.eff_contact = max(batter.contact - mod_amount, min_stat)
+            self.eff_power = max(batter.power - mod_amount, min_stat)
+            self.eff_eye = max(batter.eye - mod_amount, min_stat)
+            self.eff_discipline = max(batter.discipline - mod_amount, min_stat)
+        # Opposite-side matchup - batter advantage
+        else:
+            self.eff_contact = min(batter.contact + mod_amount, max_stat)
+            self.eff_power = min(batter.power + mod_amount, max_stat)
+            self.eff_eye = min(batter.eye + mod_amount, max_stat)
+            self.eff_discipline = min(batter.discipline + mod_amount, max_stat)
+
+    @staticmethod
+    def lookup(game, batter, pitcher, catcher):
+        """
+        Get the cached matchup for the players, building it on first use
+        or when any of their ratings changed since it was built.
+
+        Args:
+            game: Game owning the cache
+            batter: Current batter
+            pitcher: Current pitcher
+            catcher: Current catcher
+
+        Returns:
+            Matchup instance
+        """
+        cache = game.matchup_cache
+        key = (batter.id, pitcher.id)
+        matchup = cache.get(key)
+        if matchup is None or matchup.catcher is not catcher or \
+                matchup.versions != Matchup.versions_of(batter, pitcher, catcher):
+            matchup = Matchup(batter, pitcher, catcher)
+            cache[key] = matchup
+        return matchup
+
+
 class PitchEvent:
     """
     Sequential Pipeline for pitcher/batter interaction.
@@ -42,6 +153,7 @@ class PitchEvent:
     def __init__(self, action):
         self.action = action
         self.game = action.game
+        self.rng = action.game.rng.pitch
         self.batter = action.game.battingteam.currentbatter
         self.pitcher = action.game.pitchingteam.currentpitcher
         self.catcher = action.game.pitchingteam.catcher
@@ -54,11 +166,12 @@ class PitchEvent:
 
         self.batted_ball_event = None
 
-        # Store effective stats (will be modified by handedness)
-        self.eff_contact = self.batter.contact
-        self.eff_power = self.batter.power
-        self.eff_eye = self.batter.eye
-        self.eff_discipline = self.batter.discipline
+        # Per-matchup constants (pitch mix, handedness-adjusted stats)
+        self.matchup = Matchup.lookup(action.game, self.batter, self.pitcher, self.catcher)
+        self.eff_contact = self.matchup.eff_contact
+        self.eff_power = self.matchup.eff_power
+        self.eff_eye = self.matchup.eff_eye
+        self.eff_discipline = self.matchup.eff_discipline
 
         # Initialize phase tracking variables
         self.swing_decision = None
@@ -83,8 +196,7 @@ class PitchEvent:
         # Phase 0.5: Consistency Roll - may degrade pitch attributes
         self.eff_pcntrl, self.eff_pbrk, self.eff_pacc = self.phase05_consistency_roll()
 
-        # Phase 0.75: Handedness Adjustment
-        self.phase075_handedness_adjustment()
+        # Phase 0.75: Handedness Adjustment (precomputed in the matchup)
 
         # Calculate matchup advantages (after effective stats are set)
         self.advantages = self.calculate_matchup_advantages()
@@ -119,17 +231,11 @@ class PitchEvent:
 
     def phase0_pitch_selection(self):
         """Select pitch and intended location."""
-        pitchlist = [
-            self.pitcher.pitch1,
-            self.pitcher.pitch2,
-            self.pitcher.pitch3,
-            self.pitcher.pitch4,
-            self.pitcher.pitch5
-        ]
-        pitchodds = [5, 4, 3, 2, 1]
-
-        pitch = random.choices(pitchlist, pitchodds, k=1)[0]
-        location = random.choices(["Inside", "Outside"], [1, 1], k=1)[0]
+        matchup = self.matchup
+        cum_weights = Matchup.PITCH_CUM_WEIGHTS
+        self.pitch_index = bisect(cum_weights, self.rng.random() * cum_weights[-1], 0, 4)
+        pitch = matchup.pitches[self.pitch_index]
+        location = Matchup.LOCATIONS[bisect((1, 2), self.rng.random() * 2, 0, 1)]
 
         return pitch, location
 
@@ -139,48 +245,19 @@ class PitchEvent:
         Low consist = left-tail degradation (can crater).
         High consist = floor near 0% degradation.
         """
-        consist = max(self.pitch.consist, 20)  # Floor at 20
-        consist_normalized = (consist - 20) / 90  # 0.0 to 1.0
-
-        # Max possible degradation decreases as consist increases
-        # At consist=20: max_degrade = 0.20 (can lose up to 20%)
-        # At consist=110: max_degrade = 0.02 (almost no variance)
-        max_degrade = 0.20 - (consist_normalized * 0.18)
+        pcntrl, pbrk, pacc, max_degrade = self.matchup.pitch_constants[self.pitch_index]
 
         # Roll for actual degradation (left-tail: 0 to max_degrade)
-        degrade_roll = random.random() * max_degrade
+        degrade_roll = self.rng.random() * max_degrade
         self.consist_degrade = degrade_roll  # Store for snapshot
 
         # Apply to pitch attributes for THIS pitch only
-        eff_pcntrl = self.pitch.pcntrl * (1 - degrade_roll)
-        eff_pbrk = self.pitch.pbrk * (1 - degrade_roll)
-        eff_pacc = self.pitch.pacc * (1 - degrade_roll)
+        eff_pcntrl = pcntrl * (1 - degrade_roll)
+        eff_pbrk = pbrk * (1 - degrade_roll)
+        eff_pacc = pacc * (1 - degrade_roll)
 
         return eff_pcntrl, eff_pbrk, eff_pacc
 
-    def phase075_handedness_adjustment(self):
-        """Modify batter stats based on handedness matchup."""
-        mod_amount = 2
-        min_stat = 1
-        max_stat = 99
-
-        # Switch hitters get no adjustment
-        if self.batter.handedness[0] == "S":
-            return
-
-        # Same-side matchup (e.g., RHB vs RHP) - pitcher advantage
-        if self.batter.handedness[0] == self.pitcher.handedness[1]:
-            self.eff_contact = max(self.batter.contact - mod_amount, min_stat)
-            self.eff_power = max(self.batter.power - mod_amount, min_stat)
-            self.eff_eye = max(self.batter.eye - mod_amount, min_stat)
-            self.eff_discipline = max(self.batter.discipline - mod_amount, min_stat)
-        # Opposite-side matchup - batter advantage
-        else:
-            self.eff_contact = min(self.batter.contact + mod_amount, max_stat)
-            self.eff_power = min(self.batter.power + mod_amount, max_stat)
-            self.eff_eye = min(self.batter.eye + mod_amount, max_stat)
-            self.eff_discipline = min(self.batter.discipline + mod_amount, max_stat)
-
     def calculate_matchup_advantages(self):
         """
         Calculate relative advantages for all attribute pairings.
@@ -206,14 +283,14 @@ class PitchEvent:
         Determine pitch execution and check for HBP.
         Returns "HBP" or final location ("Inside"/"Outside").
         """
-        control_score = (self.pitcher.pgencontrol + self.eff_pcntrl) / 2
+        control_score = (self.matchup.pgencontrol + self.eff_pcntrl) / 2
         control_score = max(control_score, 20)  # Floor at 20
         control_normalized = (control_score - 20) / 90  # 0.0 to 1.0
 
         # HBP: base rate 0.003, scales from 0.006 (low control) to 0.0015 (high control)
         hbp_rate = self.HBP_BASE_RATE * (2 - control_normalized)
 
-        if random.random() < hbp_rate:
+        if self.rng.random() < hbp_rate:
             return "HBP"
 
         # For now, location stays as intended (drift can be added later)
@@ -263,7 +340,7 @@ class PitchEvent:
             base_rate = self.BASE_SWING_ON_BALL
             self.swing_prob = clamp(base_rate - discipline_modifier, 0.05, 0.95)
 
-        if random.random() < self.swing_prob:
+        if self.rng.random() < self.swing_prob:
             return "Swing"
         else:
             return "Take"
@@ -276,13 +353,8 @@ class PitchEvent:
             return ["Strike", "Looking", self.pitch.name]
         else:  # Outside
             # Base outcome is Ball, but catcher can frame it
-            catchframe = max(self.catcher.catchframe, 20)  # Floor at 20
-            frame_normalized = (catchframe - 20) / 90  # 0.0 to 1.0
-
             # Frame chance: 0.01 at low, 0.05 at high
-            frame_chance = self.FRAME_MIN + (frame_normalized * (self.FRAME_MAX - self.FRAME_MIN))
-
-            if random.random() < frame_chance:
+            if self.rng.random() < self.matchup.frame_chance:
                 return ["Strike", "Looking", self.pitch.name]  # Framed!
             else:
                 return ["Ball", "Looking", self.pitch.name]
@@ -322,9 +394,9 @@ class PitchEvent:
         self.contact_prob = clamp(self.contact_prob, 0.40, 0.95)
 
         # Roll for contact
-        if random.random() < self.contact_prob:
+        if self.rng.random() < self.contact_prob:
             # Contact made - split between InPlay and Foul
-            if random.random() < self.FOUL_RATE:
+            if self.rng.random() < self.FOUL_RATE:
                 return "Foul"
             else:
                 return "InPlay"
@@ -409,24 +481,20 @@ class BattedBallEvent:
         self.batter = pitchevent.batter
         self.pitcher = pitchevent.pitcher
         self.game = pitchevent.game
+        self.rng = pitchevent.game.rng.batted_ball
 
         # Get matchup advantages from PitchEvent
         self.advantages = pitchevent.advantages
 
-        # Config baseline contact odds
-        baselines = pitchevent.game.baselines
-        self.base_odds = {
-            "barrel": baselines.barrelodds,
-            "solid": baselines.solidodds,
-            "flare": baselines.flareodds,
-            "burner": baselines.burnerodds,
-            "under": baselines.underodds,
-            "topped": baselines.toppedodds,
-            "weak": baselines.weakodds
-        }
-
-        # Calculate base tier probabilities from config
-        self._calculate_base_tiers()
+        # Base tier probabilities, compiled once per config from the odds
+        compiled = pitchevent.game.baselines.compiled
+        self.quality_base = compiled.quality_base
+        self.neutral_base = compiled.neutral_base
+        self.poor_base = compiled.poor_base
+        self.barrel_share_of_quality = compiled.barrel_share_of_quality
+        self.flare_share_of_neutral = compiled.flare_share_of_neutral
+        self.topped_share_of_poor = compiled.topped_share_of_poor
+        self.under_share_of_poor = compiled.under_share_of_poor
 
         # Store raw stats for tuning export
         self.raw_batter_contact = self.batter.contact
@@ -438,39 +506,6 @@ class BattedBallEvent:
         self.direction = self.phase6_direction()
         self.outcome = [self.contact_type, self.direction, pitchevent.pitch.name]
 
-    def _calculate_base_tiers(self):
-        """Calculate base tier probabilities from config odds."""
-        total = sum(self.base_odds.values())
-        if total <= 0:
-            total = 1
-
-        # Normalize odds
-        odds = {k: v / total for k, v in self.base_odds.items()}
-
-        # Calculate tier base probabilities
-        self.quality_base = odds["barrel"] + odds["solid"]
-        self.neutral_base = odds["flare"] + odds["burner"]
-        self.poor_base = odds["topped"] + odds["under"] + odds["weak"]
-
-        # Store within-tier shares from config
-        if self.quality_base > 0:
-            self.barrel_share_of_quality = odds["barrel"] / self.quality_base
-        else:
-            self.barrel_share_of_quality = 0.5
-
-        if self.neutral_base > 0:
-            self.flare_share_of_neutral = odds["flare"] / self.neutral_base
-        else:
-            self.flare_share_of_neutral = 0.5
-
-        if self.poor_base > 0:
-            self.topped_share_of_poor = odds["topped"] / self.poor_base
-            self.under_share_of_poor = odds["under"] / self.poor_base
-            # weak is the remainder
-        else:
-            self.topped_share_of_poor = 0.33
-            self.under_share_of_poor = 0.33
-
     def phase5_contact_type(self):
         """
         Determine batted ball contact type using tier system.
@@ -499,7 +534,7 @@ class BattedBallEvent:
         }
 
         # Step 2: Roll for tier
-        roll = random.random()
+        roll = self.rng.random()
         if roll < quality_prob:
             tier = 'quality'
         elif roll < quality_prob + neutral_prob:
@@ -586,21 +621,21 @@ class BattedBallEvent:
 
         self.barrel_share = barrel_share  # Store for tuning export
 
-        if random.random() < barrel_share:
+        if self.rng.random() < barrel_share:
             return 'barrel'
         else:
             return 'solid'
 
     def _roll_neutral_tier(self):
         """Roll within Neutral tier using config ratios."""
-        if random.random() < self.flare_share_of_neutral:
+        if self.rng.random() < self.flare_share_of_neutral:
             return 'flare'
         else:
             return 'burner'
 
     def _roll_poor_tier(self):
         """Roll within Poor tier using config ratios."""
-        roll = random.random()
+        roll = self.rng.random()
         if roll < self.topped_share_of_poor:
             return 'topped'
         elif roll < self.topped_share_of_poor + self.under_share_of_poor:
@@ -624,14 +659,26 @@ class BattedBallEvent:
             'weak': round(poor_prob * (1 - self.topped_share_of_poor - self.under_share_of_poor), 4)
         }
 
+    DIRECTIONS = [
+        "far left", "left", "center left", "dead center",
+        "center right", "right", "far right"
+    ]
+
     def phase6_direction(self):
         """
         Determine field direction using batter spray splits.
         """
+        weights = BattedBallEvent.direction_weights(self.batter)
+        direction = self.rng.choices(self.DIRECTIONS, weights=weights, k=1)[0]
+        return direction
+
+    @staticmethod
+    def direction_weights(batter):
+        """Weights of DIRECTIONS from the batter's spray splits."""
         # Get batter's spray splits (default to even if not set)
-        left_split = getattr(self.batter, 'left_split', 0.33)
-        center_split = getattr(self.batter, 'center_split', 0.34)
-        right_split = getattr(self.batter, 'right_split', 0.33)
+        left_split = getattr(batter, 'left_split', 0.33)
+        center_split = getattr(batter, 'center_split', 0.34)
+        right_split = getattr(batter, 'right_split', 0.33)
 
         # Derive 7-zone spread from 3 splits
         far_left = left_split / 4
@@ -644,19 +691,13 @@ class BattedBallEvent:
         center_left = (left + center) / 2
         center_right = (right + center) / 2
 
-        directions = [
-            "far left", "left", "center left", "dead center",
-            "center right", "right", "far right"
-        ]
         weights = [far_left, left, center_left, center, center_right, right, far_right]
 
         # Safety check for valid weights
         weights = [max(0, w) if w == w else 0 for w in weights]
         if sum(weights) <= 0:
             weights = [1/7] * 7  # Even distribution fallback
-
-        direction = random.choices(directions, weights=weights, k=1)[0]
-        return direction
+        return weights
 
     def get_modifier_snapshot(self):
         """Return modifier data for tuning export."""
@@ -677,3 +718,376 @@ class BattedBallEvent:
 
     def __repr__(self):
         return f"BattedBallEvent: {self.contact_type} to {self.direction}"
+
+
+# ----------------------------------------------------------------------
+# PA sampling mode
+# ----------------------------------------------------------------------
+
+# Pitch outcome kinds for the count Markov chain
+BALL, STRIKE, FOUL, HBP, IN_PLAY = range(5)
+# Quadrature points over the (continuous) consistency roll; the phases are
+# close to linear in it, so PA probabilities agree with 64 points to ~1e-5
+CONSISTENCY_NODES = 4
+# Pitch tables shared between games, keyed by matchup content
+PITCH_TABLE_CACHE_SIZE = 4096
+# Two-strike fouls tracked per PA; longer foul runs fold into the last step
+MAX_TWO_STRIKE_FOULS = 12
+
+
+class PitchTable:
+    """
+    Exact single-pitch outcome distribution for a matchup.
+
+    Mirrors the PitchEvent/BattedBallEvent phases: pitch selection,
+    location, HBP, swing, take/framing, contact/foul, contact type and
+    direction. The consistency roll is integrated with a midpoint rule of
+    CONSISTENCY_NODES points; everything else is exact. Outcomes are the
+    [result, detail, pitch] lists PitchEvent returns. The direction of a
+    ball in play only depends on the batter, so it is kept as a separate
+    distribution and picked with what is left of the same draw.
+    """
+
+    __slots__ = (
+        "outcomes", "kinds", "cum", "probs", "kind_prob", "kind_index", "kind_probs", "kind_cum",
+        "directions", "direction_cum", "pa_tables"
+    )
+
+    CONTACT_TYPES = ("barrel", "solid", "flare", "burner", "topped", "under", "weak")
+
+    def __init__(self, matchup, compiled):
+        """
+        Args:
+            matchup: Matchup to build the distribution for
+            compiled: CompiledBaselines (contact tier bases)
+        """
+        pe = PitchEvent
+        tiers = object.__new__(BattedBallEvent)
+        tiers.quality_base = compiled.quality_base
+        tiers.neutral_base = compiled.neutral_base
+        tiers.poor_base = compiled.poor_base
+        flare = compiled.flare_share_of_neutral
+        topped = compiled.topped_share_of_poor
+        under = compiled.under_share_of_poor
+        weak = 1 - topped - under
+        frame = matchup.frame_chance
+        node_step = 1 / CONSISTENCY_NODES
+
+        self.outcomes = []
+        self.kinds = []
+        self.probs = []
+        previous = 0
+        for index, cum_weight in enumerate(Matchup.PITCH_CUM_WEIGHTS):
+            pitch_p = (cum_weight - previous) / Matchup.PITCH_CUM_WEIGHTS[-1]
+            previous = cum_weight
+            pcntrl, pbrk, pacc, max_degrade = matchup.pitch_constants[index]
+
+            # hbp, ball, looking, swinging, foul, then the contact types
+            slots = [0.0] * (5 + len(PitchTable.CONTACT_TYPES))
+            for node in range(CONSISTENCY_NODES):
+                degrade = (node + 0.5) * node_step * max_degrade
+                eff_pcntrl = pcntrl * (1 - degrade)
+                eff_pbrk = pbrk * (1 - degrade)
+                eff_pacc = pacc * (1 - degrade)
+
+                control_score = max((matchup.pgencontrol + eff_pcntrl) / 2, 20)
+                hbp_rate = pe.HBP_BASE_RATE * (2 - (control_score - 20) / 90)
+                weight = pitch_p * node_step
+                slots[0] += weight * hbp_rate
+                half = weight * (1 - hbp_rate) / 2  # Inside / Outside
+
+                recognition = clamp(matchup.eff_eye / max((eff_pbrk + eff_pacc) / 2, 1), 0.5, 1.5)
+                discipline_modifier = ((matchup.eff_discipline - eff_pcntrl) / pe.ADVANTAGE_DIVISOR
+                                       * recognition * pe.DISCIPLINE_SWING_MODIFIER)
+                eye_modifier = ((matchup.eff_eye - eff_pbrk) / pe.ADVANTAGE_DIVISOR
+                                * recognition * pe.EYE_CONTACT_MODIFIER)
+
+                swing_in = clamp(pe.BASE_SWING_ON_STRIKE + discipline_modifier, 0.05, 0.95)
+                swing_out = clamp(pe.BASE_SWING_ON_BALL - discipline_modifier, 0.05, 0.95)
+                contact_in = clamp(pe.BASE_CONTACT_RATE + eye_modifier + 0.05, 0.40, 0.95)
+                contact_out = clamp(pe.BASE_CONTACT_RATE + eye_modifier - 0.05, 0.40, 0.95)
+
+                take_out = half * (1 - swing_out)
+                slots[1] += take_out * (1 - frame)
+                slots[2] += half * (1 - swing_in) + take_out * frame
+                swing_in *= half
+                swing_out *= half
+                slots[3] += swing_in * (1 - contact_in) + swing_out * (1 - contact_out)
+                contact = swing_in * contact_in + swing_out * contact_out
+                slots[4] += contact * pe.FOUL_RATE
+                in_play = contact * (1 - pe.FOUL_RATE)
+
+                quality, neutral, poor = tiers._redistribute_tiers(
+                    (matchup.eff_contact - eff_pcntrl) / pe.ADVANTAGE_DIVISOR
+                )
+                barrel = clamp(
+                    compiled.barrel_share_of_quality
+                    + (matchup.eff_power - eff_pacc) / pe.ADVANTAGE_DIVISOR * BattedBallEvent.POWER_BARREL_SHIFT,
+                    0.05, 0.95
+                )
+                slots[5] += in_play * quality * barrel
+                slots[6] += in_play * quality * (1 - barrel)
+                slots[7] += in_play * neutral * flare
+                slots[8] += in_play * neutral * (1 - flare)
+                slots[9] += in_play * poor * topped
+                slots[10] += in_play * poor * under
+                slots[11] += in_play * poor * weak
+
+            name = matchup.pitches[index].name
+            entries = [
+                (("HBP", "Hit By Pitch", name), HBP),
+                (("Ball", "Looking", name), BALL),
+                (("Strike", "Looking", name), STRIKE),
+                (("Strike", "Swinging", name), STRIKE),
+                (("Strike", "Foul", name), FOUL),
+            ] + [((contact_type, None, name), IN_PLAY) for contact_type in PitchTable.CONTACT_TYPES]
+            for (outcome, kind), p in zip(entries, slots):
+                if p > 0:
+                    self.outcomes.append(outcome)
+                    self.kinds.append(kind)
+                    self.probs.append(p)
+
+        self.cum = cumulative(self.probs)
+        self.kind_prob = [0.0] * 5
+        self.kind_index = [[] for _ in range(5)]
+        for i, (kind, p) in enumerate(zip(self.kinds, self.probs)):
+            self.kind_prob[kind] += p
+            self.kind_index[kind].append(i)
+        self.kind_probs = [[self.probs[i] for i in indexes] for indexes in self.kind_index]
+        self.kind_cum = [cumulative(probs) for probs in self.kind_probs]
+
+        self.directions = BattedBallEvent.DIRECTIONS
+        self.direction_cum = cumulative(BattedBallEvent.direction_weights(matchup.batter))
+        self.pa_tables = {}
+
+    def sample(self, u: float):
+        """Pitch outcome for a uniform draw u in [0, 1)."""
+        index, rest = pick(self.cum, self.probs, u)
+        return self._outcome(index, rest)
+
+    def sample_kind(self, kind: int, u: float):
+        """Pitch outcome of the given kind for a uniform draw u in [0, 1)."""
+        choice, rest = pick(self.kind_cum[kind], self.kind_probs[kind], u)
+        return self._outcome(self.kind_index[kind][choice], rest)
+
+    def _outcome(self, index: int, rest: float):
+        outcome = self.outcomes[index]
+        if self.kinds[index] != IN_PLAY:
+            return list(outcome)
+        cum = self.direction_cum
+        direction = self.directions[bisect(cum, rest * cum[-1], 0, len(cum) - 1)]
+        return [outcome[0], direction, outcome[2]]
+
+    def plate_appearance(self, balls: int, strikes: int, rules):
+        """PA distribution from a count (cached per count)."""
+        key = (balls, strikes)
+        table = self.pa_tables.get(key)
+        if table is None:
+            table = self.pa_tables[key] = PlateAppearanceTable(self, balls, strikes, rules)
+        return table
+
+    @staticmethod
+    def lookup(game, batter, pitcher, catcher):
+        """
+        The matchup's pitch table, building it on first use.
+
+        Tables are also shared between games (and seasons) through a
+        process-wide cache keyed by everything they are computed from.
+        """
+        matchup = Matchup.lookup(game, batter, pitcher, catcher)
+        table = matchup.pitch_table
+        if table is None:
+            compiled = game.baselines.compiled
+            key = PitchTable.content_key(matchup, compiled)
+            table = _pitch_tables.get(key)
+            if table is None:
+                # Build outside the lock; a concurrent duplicate build is harmless
+                table = PitchTable(matchup, compiled)
+                with _pitch_tables_lock:
+                    if len(_pitch_tables) >= PITCH_TABLE_CACHE_SIZE:
+                        _pitch_tables.clear()
+                    table = _pitch_tables.setdefault(key, table)
+            matchup.pitch_table = table
+        return table
+
+    @staticmethod
+    def content_key(matchup, compiled) -> tuple:
+        """Everything a PitchTable is computed from."""
+        return (
+            matchup.eff_contact, matchup.eff_power, matchup.eff_eye, matchup.eff_discipline,
+            matchup.pgencontrol, matchup.frame_chance, matchup.pitch_constants,
+            tuple(pitch.name for pitch in matchup.pitches),
+            tuple(BattedBallEvent.direction_weights(matchup.batter)),
+            compiled.quality_base, compiled.neutral_base, compiled.poor_base,
+            compiled.barrel_share_of_quality, compiled.flare_share_of_neutral,
+            compiled.topped_share_of_poor, compiled.under_share_of_poor,
+        )
+
+
+_pitch_tables = {}
+_pitch_tables_lock = threading.Lock()
+
+
+def cumulative(weights) -> list:
+    """Running totals of a weight list."""
+    total = 0.0
+    cum = []
+    for weight in weights:
+        total += weight
+        cum.append(total)
+    return cum
+
+
+def pick(cum, probs, u: float):
+    """
+    Pick an entry of a discrete distribution with one uniform draw.
+
+    Args:
+        cum: Cumulative weights
+        probs: Entry weights
+        u: Uniform draw in [0, 1)
+
+    Returns:
+        (index, rest): the entry and a fresh uniform in [0, 1) (the draw's
+        position inside the entry) for any further choice
+    """
+    x = u * cum[-1]
+    index = bisect(cum, x, 0, len(cum) - 1)
+    low = cum[index - 1] if index else 0.0
+    rest = (x - low) / probs[index] if probs[index] > 0 else 0.0
+    return index, min(max(rest, 0.0), 0.999999999)
+
+
+class PlateAppearanceTable:
+    """
+    Distribution of how a PA ends, from a starting count.
+
+    Pitches are independent given the matchup, so the count is a Markov
+    chain over the PitchTable kinds. Each terminal entry is (kind, balls,
+    strikes, fouls): the terminal pitch kind, the count it was thrown in
+    and the two-strike fouls before it, which together give the pitch,
+    ball and strike totals of the PA.
+    """
+
+    __slots__ = ("terminals", "cum", "probs")
+
+    def __init__(self, pitch_table, balls: int, strikes: int, rules):
+        p_ball, p_strike, p_foul, p_hbp, p_in_play = pitch_table.kind_prob
+        total = sum(pitch_table.kind_prob)
+        p_ball, p_strike, p_foul, p_hbp, p_in_play = (
+            p / total for p in (p_ball, p_strike, p_foul, p_hbp, p_in_play)
+        )
+        max_balls = rules.balls - 1
+        two_strikes = rules.strikes - 1
+
+        terminals = {}
+
+        def end(kind, b, s, f, p):
+            key = (kind, b, s, f)
+            terminals[key] = terminals.get(key, 0.0) + p
+
+        # Counts before two strikes (fouls count as strikes)
+        reach = {(balls, strikes): 1.0} if strikes < two_strikes else {}
+        reach_two = {}
+        if strikes >= two_strikes:
+            reach_two[(balls, 0)] = 1.0
+        for s in range(strikes, two_strikes):
+            for b in range(balls, max_balls + 1):
+                p = reach.pop((b, s), 0.0)
+                if not p:
+                    continue
+                end(HBP, b, s, 0, p * p_hbp)
+                end(IN_PLAY, b, s, 0, p * p_in_play)
+                if b == max_balls:
+                    end(BALL, b, s, 0, p * p_ball)
+                else:
+                    reach[(b + 1, s)] = reach.get((b + 1, s), 0.0) + p * p_ball
+                if s + 1 == two_strikes:
+                    reach_two[(b, 0)] = reach_two.get((b, 0), 0.0) + p * (p_strike + p_foul)
+                else:
+                    reach[(b, s + 1)] = reach.get((b, s + 1), 0.0) + p * (p_strike + p_foul)
+
+        # Two strikes: fouls keep the count, tracked up to MAX_TWO_STRIKE_FOULS
+        for b in range(balls, max_balls + 1):
+            for f in range(MAX_TWO_STRIKE_FOULS + 1):
+                p = reach_two.pop((b, f), 0.0)
+                if not p:
+                    continue
+                if f == MAX_TWO_STRIKE_FOULS:
+                    p /= 1 - p_foul
+                else:
+                    reach_two[(b, f + 1)] = reach_two.get((b, f + 1), 0.0) + p * p_foul
+                end(STRIKE, b, two_strikes, f, p * p_strike)
+                end(HBP, b, two_strikes, f, p * p_hbp)
+                end(IN_PLAY, b, two_strikes, f, p * p_in_play)
+                if b == max_balls:
+                    end(BALL, b, two_strikes, f, p * p_ball)
+                else:
+                    reach_two[(b + 1, f)] = reach_two.get((b + 1, f), 0.0) + p * p_ball
+
+        self.terminals = [key for key, p in terminals.items() if p > 0]
+        self.probs = [terminals[key] for key in self.terminals]
+        self.cum = cumulative(self.probs)
+
+    def sample(self, u: float):
+        """
+        Sample how the PA ends from one uniform draw.
+
+        Args:
+            u: Uniform draw in [0, 1)
+
+        Returns:
+            (kind, balls, strikes, fouls, u2): the terminal entry and a
+            fresh uniform (the draw's position inside the entry) for
+            picking the terminal pitch outcome
+        """
+        index, rest = pick(self.cum, self.probs, u)
+        return self.terminals[index] + (rest,)
+
+
+def sample_pitch(action):
+    """
+    PA sampling mode: resolve the next pitch (or the rest of the PA) with
+    one draw from the matchup's cached distributions.
+
+    With the bases empty nothing can happen between pitches, so the rest of
+    the PA is sampled at once: the count jumps to the count of its last
+    pitch and the pitches before it are credited (pitch, ball and strike
+    totals, stamina ticks, injury rolls). With runners on, pickoffs and
+    steals are checked before every pitch, so only the next pitch is drawn.
+
+    This is an alternative pitch model, not a fast path: whole games run no
+    meaningfully faster than with the pitch pipeline. Use outcome_only to
+    cut simulation time.
+
+    Args:
+        action: Action.Action being resolved
+
+    Returns:
+        (outcome, extra_pitches): the [result, detail, pitch] outcome of the
+        pitch that ends the action and the number of earlier pitches folded
+        into it
+    """
+    game = action.game
+    pitcher = game.pitchingteam.currentpitcher
+    table = PitchTable.lookup(game, game.battingteam.currentbatter, pitcher, game.pitchingteam.catcher)
+    u = game.rng.pitch.random()
+
+    stats = pitcher.pitchingstats
+    state = game.state
+    if state.bases:
+        stats.Adder("pitches_thrown", 1)
+        return table.sample(u), 0
+
+    balls, strikes = state.balls, state.strikes
+    kind, end_balls, end_strikes, fouls, u2 = table.plate_appearance(balls, strikes, game.rules).sample(u)
+    added_balls = end_balls - balls
+    added_strikes = end_strikes - strikes + fouls
+    state.balls = end_balls
+    state.strikes = end_strikes
+    if added_balls:
+        stats.Adder("balls", added_balls)
+    if added_strikes:
+        stats.Adder("strikes", added_strikes)
+    stats.Adder("pitches_thrown", 1 + added_balls + added_strikes)
+    return table.sample_kind(kind, u2), added_balls + added_strikes
@@ -101,6 +101,17 @@ class Player():
         self.on_base_pitcher = None
         self.abilitymodifierscore = 1
 
+        # Effective ratings are only recomputed when an input changes
+        # (modifier score, rating multipliers) or the player was marked
+        # dirty. ratings_version is bumped on every recompute so caches
+        # built from the ratings (e.g. PitchEvent matchups) can rebuild.
+        self.rating_multipliers = {}
+        self.ratings_version = 0
+        self.ratings_dirty = True
+        self._applied_score = None
+        # Forked players share pitch objects with their snapshot until
+        # AbilityMod first rewrites them (see snapshot.py)
+        self.shared_pitches = False
 
         self.og_contact = self.contact
         self.og_power = self.power
@@ -240,7 +251,46 @@ class Player():
             "injurystate": self.injurystate
             }
 
+    # Ratings recomputed by AbilityMod (and so eligible for multipliers)
+    MODIFIED_RATINGS = (
+        "contact", "power", "discipline", "eye", "basereaction", "baserunning",
+        "speed", "throwpower", "throwacc", "fieldcatch", "fieldreact", "fieldspot",
+        "catchframe", "catchsequence", "pthrowpower", "pgencontrol", "pickoff", "psequencing"
+    )
+
+    PITCH_ATTRS = ("pitch1", "pitch2", "pitch3", "pitch4", "pitch5")
+
+    def add_rating_multiplier(self, attr_name, multiplier):
+        """
+        Add a persistent multiplier (e.g. an injury effect) to a rating.
+
+        Args:
+            attr_name: Rating attribute name
+            multiplier: Factor applied on top of the modifier score
+
+        Returns:
+            False if the attribute isn't an AbilityMod rating
+        """
+        if attr_name not in Player.MODIFIED_RATINGS:
+            return False
+        # Rebind rather than mutate so forks can share the dict
+        self.rating_multipliers = {
+            **self.rating_multipliers,
+            attr_name: self.rating_multipliers.get(attr_name, 1) * multiplier
+        }
+        self.ratings_dirty = True
+        return True
+
     def AbilityMod(self):
+        # Nothing to do unless an input changed since the last recompute
+        if not self.ratings_dirty and self.abilitymodifierscore == self._applied_score:
+            return
+        self.ratings_version += 1
+        self.ratings_dirty = False
+        self._applied_score = self.abilitymodifierscore
+        if self.shared_pitches:
+            self.unshare_pitches()
+
         self.contact = round( self.og_contact * self.abilitymodifierscore, 2)
         self.power = round( self.og_power * self.abilitymodifierscore, 2)
         self.discipline = round( self.og_discipline * self.abilitymodifierscore, 2)
@@ -274,6 +324,17 @@ class Player():
         self.pitch5.pacc = round( self.og_pitch5pacc * self.abilitymodifierscore, 2)
         self.pitch5.pcntrl = round( self.og_pitch5pcntrl * self.abilitymodifierscore, 2)
         self.pitch5.pbrk = round( self.og_pitch5pbrk * self.abilitymodifierscore, 2)
+        for attr_name, multiplier in self.rating_multipliers.items():
+            setattr(self, attr_name, getattr(self, attr_name) * multiplier)
+
+    def unshare_pitches(self):
+        """Give the player private copies of its pitches (copy-on-write after a fork)."""
+        for attr in Player.PITCH_ATTRS:
+            pitch = getattr(self, attr)
+            clone = object.__new__(Player.CreatePitch)
+            clone.__dict__.update(pitch.__dict__)
+            setattr(self, attr, clone)
+        self.shared_pitches = False
 
     class CreatePitch():
         def __init__(self, pitchname, ovr, pacc, pcntrl, pbrk, consist):
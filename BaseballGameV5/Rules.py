@@ -1,5 +1,6 @@
 import os
 import csv
+import copy
 import json
 
 class Rules():
@@ -15,6 +16,32 @@ class Rules():
     def __repr__(self):
         return f"{self.ruletype} {self.innings} {self.outs}"
 
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"Rules are frozen; cannot set '{name}'")
+        object.__setattr__(self, name, value)
+
+    def __deepcopy__(self, memo):
+        # Frozen instances are shared by every game using the config, so a
+        # deep-copied game shares it too
+        if getattr(self, "_frozen", False):
+            return self
+        clone = object.__new__(type(self))
+        memo[id(self)] = clone
+        for name, value in vars(self).items():
+            object.__setattr__(clone, name, copy.deepcopy(value, memo))
+        return clone
+
+    def freeze(self):
+        """
+        Make this instance immutable so it can be shared between games.
+
+        Returns:
+            self
+        """
+        object.__setattr__(self, "_frozen", True)
+        return self
+
     @classmethod
     def from_dict(cls, data: dict, ruletype: str = "endpoint"):
         """
@@ -262,7 +262,7 @@ def BattingStatPullSave(team, gname):
     export, filename = StatPullBatting(team, gname)
     StatSaverCombo(export, filename)
 
-def StatJSONConverter(game):
+def StatJSONConverter(game, include_playbyplay=True, playbyplay=None):
     game.hometeam
     game.awayteam
     game.actions
@@ -271,7 +271,12 @@ def StatJSONConverter(game):
     homebat, homepitch, homefield = TeamStatPull(game.hometeam)
     awaybat, awaypitch, awayfield = TeamStatPull(game.awayteam)
     #actions = ActionSort(game.actions)
-    actions = game.actions
+    if not include_playbyplay:
+        actions = []
+    elif playbyplay is not None:
+        actions = playbyplay
+    else:
+        actions = game.play_by_play()
 
     homebatJSON = json.dumps([obj.__dict__ for obj in homebat])
     homepitchJSON = json.dumps([obj.to_dict() for obj in homepitch])
@@ -1,336 +1,261 @@
-import math
-import numpy as np
-from defense import fielding as f
-from defense import BasePaths as b
+"""
+Pre-pitch baserunning: pickoff throws and steal attempts.
+
+Each game keeps one BaserunningEngine. Before every pitch with runners on
+it decides whether a single baserunning event happens instead of (or, for
+a steal attempt that draws an error, ahead of) the pitch.
+
+The candidate events depend only on which bases are occupied, so the
+EVENT_ORDER table lists them per base-occupancy code: pickoff throws to
+the occupied bases from first to third, then steal attempts from the lead
+runner back by runners whose next base is open. Their probabilities come
+from the pitcher's pickoff frequency and the runners' steal frequencies and
+are folded into one cumulative table whenever the pitcher or a runner
+changes. A pitch where nothing happens then costs a single draw from the
+game's baserunning stream and one comparison against the table's quiet
+share.
+"""
+
 from defense import Error_Throw_Catch
-from defense import Error_Catch
-from defense import Error_Throw
-from defense import Throw_CatchDepth
-
-class Steals():
-    def __init__(self, gamestate):
-        self.gamestate = gamestate
-        self.firstbase = self.gamestate.game.on_firstbase
-        self.secondbase = self.gamestate.game.on_secondbase 
-        self.thirdbase = self.gamestate.game.on_thirdbase
-        self.runnerstrategy =  self.gamestate.game.battingteam.strategy
-        self.defensestrategy =  self.gamestate.game.pitchingteam.strategy
-        self.defensiveactions = []
-        self.defense = self.gamestate.game.pitchingteam
+from defense import PlayResult
+from game_state import (IS_PICKOFF, IS_STEALATTEMPT, BASES_EMPTY, BASE_STATES,
+                        FIRST, SECOND, THIRD)
+
+# Pre-pitch event kinds
+PICKOFF, STEAL = 0, 1
+
+# By base number (1-3): occupancy bit, GameState slot, fielder at the bag
+BASE_BITS = (0, FIRST, SECOND, THIRD)
+RUNNER_SLOTS = (None, "first", "second", "third")
+BASEMEN = (None, "firstbase", "secondbase", "thirdbase")
+
+# Weights of (speed, baserunning) in the runner's pickoff and steal scores
+PICKOFF_RUNNER_WEIGHTS = (3, 6)
+STEAL_RUNNER_WEIGHTS = (6, 3)
+# Weights of (throw power, throw accuracy, catch sequencing, pitch
+# sequencing) in the battery's score against a steal
+BATTERY_WEIGHTS = (15, 3, 1, 1)
+
+
+def _event_order(bases):
+    """Candidate (kind, base) events for an occupancy code, in draw order."""
+    occupied = [base for base in (1, 2, 3) if bases & BASE_BITS[base]]
+    pickoffs = [(PICKOFF, base) for base in occupied]
+    steals = [(STEAL, base) for base in reversed(occupied)
+              if base == 3 or not bases & BASE_BITS[base + 1]]
+    return tuple(pickoffs + steals)
+
+
+EVENT_ORDER = tuple(_event_order(bases) for bases in range(BASE_STATES))
+
+
+def frequency_odds(frequency) -> float:
+    """Per-pitch probability of a strategy frequency (percent, clamped)."""
+    return min(max(frequency / 100, 0.0), 1.0)
+
+
+def runner_score(runner, weights) -> float:
+    """Runner's speed/baserunning score on the 0-100 rating scale."""
+    bsp = (runner.speed - 50) / 50
+    bbr = (runner.baserunning - 50) / 50
+    brr = (runner.baserunning - 50) / 5
+    w_speed, w_running = weights
+    return (1 + (bsp * w_speed + bbr * w_running) / (w_speed + w_running)) * 50 + brr
+
+
+def battery_score(pitcher, catcher) -> float:
+    """Catcher's and pitcher's combined score against a steal."""
+    ctp = (catcher.throwpower - 50) / 50
+    cta = (catcher.throwacc - 50) / 50
+    ccs = (catcher.catchsequence - 50) / 50
+    pps = (pitcher.psequencing - 50) / 50
+    cfr = (catcher.fieldreact - 50) / 5
+    w_tp, w_ta, w_cs, w_ps = BATTERY_WEIGHTS
+    weighted = (ctp * w_tp + cta * w_ta + ccs * w_cs + pps * w_ps) / (w_tp + w_ta + w_cs + w_ps)
+    return (1 + weighted) * 50 + cfr
+
+
+class BaserunningEngine:
+    """Per-game pre-pitch pickoff and steal resolution."""
+
+    __slots__ = ("game", "pickoff_odds", "steal_odds", "pitcher", "first", "second", "third",
+                 "quiet", "events", "gamestate", "errorlist", "defensiveactions")
+
+    def __init__(self, game):
+        """
+        Args:
+            game: Game whose pitchers and runners are evaluated
+        """
+        self.game = game
+        # Per-pitch odds by player id (strategy frequencies are fixed per game)
+        self.pickoff_odds = {}
+        self.steal_odds = {}
+        # Pitcher and runners the current table was built for
+        self.pitcher = self.first = self.second = self.third = None
+        # Share of pitches with no event, then (threshold, kind, base) rows
+        self.quiet = 1.0
+        self.events = ()
+        # Action being resolved, and the lists its PlayResult reports
+        self.gamestate = None
         self.errorlist = []
-        self.basepaths = b(self, self.gamestate.game.battingteam.currentbatter, self.firstbase, self.secondbase, self.thirdbase, self.gamestate.game)
-        self.skippitch = self.steal_eval(self.firstbase, self.secondbase, self.thirdbase)
-                
-    def pull_stealfreq(runner, stratlist):
-        #print(f"Running Pull Steal Freq")
-        freq = [player.stealfreq for player in stratlist if player.id == runner.id][0]
-        return freq     
-    
-    def pull_pickofffreq(pitcher, stratlist):
-        #print(f"Running Pull Pickoff Freq")
-        freq = [player.pickofffreq for player in stratlist if player.id == pitcher.id][0]
-        return freq     
-    
-    def steal_eval(self, firstbase, secondbase, thirdbase):
-        #print(f"Running Steal Eval")
-        if firstbase == None and secondbase == None and thirdbase == None:
+        self.defensiveactions = []
+
+    def pre_pitch(self, action) -> bool:
+        """
+        Roll for a baserunning event before a pitch.
+
+        Args:
+            action: Action about to throw the pitch; receives the
+                    defensiveoutcome of any event
+
+        Returns:
+            True when the event replaces the pitch
+        """
+        game = self.game
+        state = game.state
+        if state.bases == BASES_EMPTY:
             return False
-        else:
-            pickofffreqrating = Steals.pull_pickofffreq(self.gamestate.game.pitchingteam.currentpitcher, self.defensestrategy.playerstrategy)
-            diceroll = np.random.rand() * 100
-            if pickofffreqrating > diceroll:
-                self.gamestate.game.is_pickoff = True
-                if firstbase != None:
-                    pickoff, baserunner, throwerror, catcherror = Steals.pickoff_math(self, self.gamestate.game.baselines.pickoff_success, firstbase, self.gamestate.game.pitchingteam.currentpitcher, self.gamestate.game.pitchingteam.firstbase)
-                    if pickoff == True:
-                        if (throwerror == False and catcherror == False):
-                            self.gamestate.defensiveoutcome = (None, None, None, "successful pickoff", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-                            self.gamestate.game.on_firstbase = None
-                            self.gamestate.game.outcount+=1
-                            return True
-                    elif pickoff == False:
-                        if throwerror == True:
-                            self.gamestate.defensiveoutcome = (None, None, None, "error on pickoff", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-                            self.gamestate.game.error_count+=1
-                            if thirdbase != None:
-                                self.gamestate.game.current_runners_home.append(thirdbase)
-                                self.gamestate.game.on_thirdbase = None                                
-                            if secondbase != None:
-                                self.gamestate.game.on_thirdbase = self.gamestate.game.on_secondbase
-                                self.gamestate.game.on_secondbase = None
-                            if firstbase != None:
-                                self.gamestate.game.on_secondbase = self.gamestate.game.on_firstbase
-                                self.gamestate.game.on_firstbase = None      
-                            return True
-                        elif catcherror == True:
-                            self.gamestate.defensiveoutcome = (None, None, None, "error on pickoff", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-                            self.gamestate.game.error_count+=1
-                            #need to assign error eventually
-                            return True
-                        self.gamestate.defensiveoutcome = (None, None, None, "unsuccessful pickoff", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-                        return True
-            else:
-                pass
-
-            diceroll = np.random.rand() * 100
-            if pickofffreqrating > diceroll:
-                self.gamestate.game.is_pickoff = True
-                if secondbase != None:
-                    pickoff, baserunner, throwerror, catcherror = Steals.pickoff_math(self, self.gamestate.game.baselines.pickoff_success, secondbase, self.gamestate.game.pitchingteam.currentpitcher, self.gamestate.game.pitchingteam.secondbase)
-                    if pickoff == True:
-                        if throwerror == False and catcherror == False:
-                            self.gamestate.defensiveoutcome = (None, None, None, "successful pickoff", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-                            self.gamestate.game.on_secondbase = None
-                            self.gamestate.game.outcount+=1
-                            return True
-                    elif pickoff == False:
-                        if throwerror == True:
-                            self.gamestate.defensiveoutcome = (None, None, None, "error on pickoff", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-                            self.gamestate.game.error_count+=1
-                            if thirdbase != None:
-                                self.gamestate.game.current_runners_home.append(thirdbase)
-                                self.gamestate.game.on_thirdbase = None                                
-                            if secondbase != None:
-                                self.gamestate.game.on_thirdbase = self.gamestate.game.on_secondbase
-                                self.gamestate.game.on_secondbase = None
-                            if firstbase != None:
-                                self.gamestate.game.on_secondbase = self.gamestate.game.on_firstbase
-                                self.gamestate.game.on_firstbase = None      
-                            return True
-                        elif catcherror == True:
-                            self.gamestate.defensiveoutcome = (None, None, None, "error on pickoff", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-                            self.gamestate.game.error_count+=1
-                            #need to assign error eventually
-                            return True
-                        self.gamestate.defensiveoutcome = (None, None, None, "unsuccessful pickoff", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-                        return True
-            else:
-                pass
-
-            diceroll = np.random.rand() * 100
-            if pickofffreqrating > diceroll:
-                self.gamestate.game.is_pickoff = True
-                if thirdbase != None:
-                    pickoff, baserunner, throwerror, catcherror = Steals.pickoff_math(self, self.gamestate.game.baselines.pickoff_success, thirdbase, self.gamestate.game.pitchingteam.currentpitcher, self.gamestate.game.pitchingteam.thirdbase)
-                    if pickoff == True:
-                        if throwerror == False and catcherror == False:
-                            self.gamestate.defensiveoutcome = (None, None, None, "successful pickoff", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-                            self.gamestate.game.on_thirdbase = None
-                            self.gamestate.game.outcount+=1
-                            return True
-                    elif pickoff == False:
-                        if throwerror == True:
-                            self.gamestate.defensiveoutcome = (None, None, None, "error on pickoff", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-                            self.gamestate.game.error_count+=1
-                            if thirdbase != None:
-                                self.gamestate.game.current_runners_home.append(thirdbase)
-                                self.gamestate.game.on_thirdbase = None                                
-                            if secondbase != None:
-                                self.gamestate.game.on_thirdbase = self.gamestate.game.on_secondbase
-                                self.gamestate.game.on_secondbase = None
-                            if firstbase != None:
-                                self.gamestate.game.on_secondbase = self.gamestate.game.on_firstbase
-                                self.gamestate.game.on_firstbase = None      
-                            return True
-                        elif catcherror == True:
-                            self.gamestate.defensiveoutcome = (None, None, None, "error on pickoff", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-                            self.gamestate.game.error_count+=1
-                            return True
-                        self.gamestate.defensiveoutcome = (None, None, None, "unsuccessful pickoff", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-                        return True
+        pitcher = game.pitchingteam.currentpitcher
+        if (pitcher is not self.pitcher or state.first is not self.first
+                or state.second is not self.second or state.third is not self.third):
+            self._build_table(pitcher, state)
+
+        roll = game.rng.baserunning.random()
+        if roll < self.quiet:
+            return False
+        for threshold, kind, base in self.events:
+            if roll < threshold:
+                break
+
+        self.gamestate = action
+        self.errorlist = []
+        self.defensiveactions = []
+        if kind == PICKOFF:
+            return self._pickoff(base)
+        return self._steal(base)
+
+    def _build_table(self, pitcher, state):
+        """Fold the event probabilities for these players into a cumulative table."""
+        game = self.game
+        self.pitcher = pitcher
+        self.first, self.second, self.third = state.first, state.second, state.third
+
+        pickoff = self.pickoff_odds.get(pitcher.id)
+        if pickoff is None:
+            pickoff = frequency_odds(game.pitchingteam.index.strategy(pitcher.id).pickofffreq)
+            self.pickoff_odds[pitcher.id] = pickoff
+
+        # Each event is tried only if none before it happened
+        remaining = 1.0
+        shares = []
+        for kind, base in EVENT_ORDER[state.bases]:
+            if kind == PICKOFF:
+                odds = pickoff
             else:
-                pass
-
-            if self.gamestate.game.is_pickoff != True:
-                if thirdbase != None:
-                    stealfreqrating = Steals.pull_stealfreq(self.thirdbase, self.runnerstrategy.playerstrategy)
-                    diceroll = np.random.rand() * 100
-                    if (stealfreqrating > diceroll):
-                        self.gamestate.game.is_stealattempt = True
-                        outcome, error_check = Steals.calc_baserunning_math(self, self.gamestate.game.baselines.steal_success, thirdbase, self.gamestate.game.pitchingteam.currentpitcher, self.gamestate.game.pitchingteam.catcher, self.gamestate.game.pitchingteam.thirdbase)
-
-                        if (error_check[0] == True and error_check[1] == True) or error_check[0] == True:
-                            self.gamestate.game.error_count+=1
-                            self.gamestate.game.current_runners_home.append(thirdbase)
-                            thirdbase.battingstats.Adder("stolen_bases", 1)
-                            self.gamestate.game.on_thirdbase = None
-                            if secondbase != None:
-                                self.gamestate.game.on_thirdbase = self.gamestate.game.on_secondbase                                
-                                self.gamestate.game.on_secondbase = None
-                            if firstbase != None:
-                                self.gamestate.game.on_secondbase = self.gamestate.game.on_firstbase
-                                self.gamestate.game.on_firstbase = None
-                            self.gamestate.defensiveoutcome = (None, None, None, "error on steal", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)                        
-                        elif error_check[1] == True:
-                            self.gamestate.game.error_count+=1
-                            thirdbase.battingstats.Adder("stolen_bases", 1)
-                            self.gamestate.game.current_runners_home.append(thirdbase)
-                            self.gamestate.game.on_thirdbase = None
-                            self.gamestate.defensiveoutcome = (None, None, None, "error on steal", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)                        
-                        elif error_check[0] and error_check[1] == False:
-                            if outcome == True:
-                                self.gamestate.game.is_stealsuccess = True
-                                self.gamestate.game.current_runners_home.append(thirdbase)
-                                thirdbase.battingstats.Adder("stolen_bases", 1)
-                                self.gamestate.game.on_thirdbase = None
-                                self.gamestate.defensiveoutcome = (None, None, None, "stolen base", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)                        
-                                return True           
-                            if outcome == False:
-                                thirdbase.battingstats.Adder("caught_stealing", 1)
-                                self.gamestate.game.on_thirdbase = None
-                                self.gamestate.game.outcount += 1
-                                self.gamestate.defensiveoutcome = (None, None, None, "caught stealing", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-                                return True
-                else:
-                    pass
-                        #return True
-
-                if secondbase != None:
-                    stealfreqrating = Steals.pull_stealfreq(self.secondbase, self.runnerstrategy.playerstrategy)
-                    diceroll = np.random.rand() * 100
-                    if (stealfreqrating > diceroll):
-                        self.gamestate.game.is_stealattempt = True
-                        outcome, error_check = Steals.calc_baserunning_math(self, self.gamestate.game.baselines.steal_success, secondbase, self.gamestate.game.pitchingteam.currentpitcher, self.gamestate.game.pitchingteam.catcher, self.gamestate.game.pitchingteam.secondbase)
-
-                        if (error_check[0] == True and error_check[1] == True) or error_check[0] == True:
-                            self.gamestate.game.error_count+=1
-                            if thirdbase != None:
-                                self.gamestate.game.current_runners_home.append(thirdbase)
-                                self.gamestate.game.on_thirdbase = None
-                            secondbase.battingstats.Adder("stolen_bases", 1)
-                            self.gamestate.game.on_thirdbase = self.gamestate.game.on_secondbase
-                            self.gamestate.game.on_secondbase = None
-                            if firstbase != None:
-                                self.gamestate.game.on_secondbase = self.gamestate.game.on_firstbase
-                                self.gamestate.game.on_firstbase = None
-                            self.gamestate.defensiveoutcome = (None, None, None, "error on steal", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)                        
-                        elif error_check[1] == True:
-                            self.gamestate.game.error_count+=1
-                            secondbase.battingstats.Adder("stolen_bases", 1)
-                            self.gamestate.game.on_thirdbase = self.gamestate.game.on_secondbase
-                            self.gamestate.game.on_secondbase = None
-                            self.gamestate.defensiveoutcome = (None, None, None, "error on steal", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)                        
-                        elif error_check[0] and error_check[1] == False:
-                            if outcome == True:
-                                self.gamestate.game.is_stealsuccess = True
-                                secondbase.battingstats.Adder("stolen_bases", 1)
-                                self.gamestate.game.on_thirdbase = secondbase
-                                self.gamestate.game.on_secondbase = None
-                                self.gamestate.defensiveoutcome = (None, None, None, "stolen base", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)                        
-                                return True           
-                            if outcome == False:
-                                self.gamestate.game.on_secondbase = None
-                                secondbase.battingstats.Adder("caught_stealing", 1)
-                                self.gamestate.game.outcount += 1
-                                self.gamestate.defensiveoutcome = (None, None, None, "caught stealing", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-                                return True
-                else:
-                    pass
-
-                if firstbase != None:
-                    stealfreqrating = Steals.pull_stealfreq(self.firstbase, self.runnerstrategy.playerstrategy)
-                    diceroll = np.random.rand() * 100
-                    if (stealfreqrating > diceroll):
-                        self.gamestate.game.is_stealattempt = True
-                        outcome, error_check = Steals.calc_baserunning_math(self, self.gamestate.game.baselines.steal_success, firstbase, self.gamestate.game.pitchingteam.currentpitcher, self.gamestate.game.pitchingteam.catcher, self.gamestate.game.pitchingteam.firstbase)
-
-                        if (error_check[0] == True and error_check[1] == True) or error_check[0] == True:
-                            self.gamestate.game.error_count+=1
-                            if thirdbase != None:
-                                self.gamestate.game.current_runners_home.append(thirdbase)
-                                self.gamestate.game.on_thirdbase = None
-                            if secondbase != None:
-                                self.gamestate.game.on_thirdbase = secondbase
-                                self.gamestate.game.on_secondbase = None
-                            firstbase.battingstats.Adder("stolen_bases", 1)
-                            self.gamestate.game.on_secondbase = self.gamestate.game.on_firstbase
-                            self.gamestate.game.on_firstbase = None
-                            self.gamestate.defensiveoutcome = (None, None, None, "error on steal", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)                        
-                        elif error_check[1] == True:
-                            self.gamestate.game.error_count+=1
-                            firstbase.battingstats.Adder("stolen_bases", 1)
-                            self.gamestate.game.on_secondbase = self.gamestate.game.on_firstbase
-                            self.gamestate.game.on_firstbase = None
-                            self.gamestate.defensiveoutcome = (None, None, None, "error on steal", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)                        
-                        elif error_check[0] and error_check[1] == False:
-                            if outcome == True:
-                                self.gamestate.game.is_stealsuccess = True
-                                self.gamestate.game.on_secondbase = firstbase
-                                firstbase.battingstats.Adder("stolen_bases", 1)
-                                self.gamestate.game.on_firstbase = None
-                                self.gamestate.defensiveoutcome = (None, None, None, "stolen base", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)                        
-                                return True           
-                            if outcome == False:
-                                self.gamestate.game.on_firstbase = None
-                                firstbase.battingstats.Adder("caught_stealing", 1)
-                                self.gamestate.game.outcount += 1
-                                self.gamestate.defensiveoutcome = (None, None, None, "caught stealing", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-                                return True
-                else:
-                    pass
-        return False
-            
-    def pickoff_math(self, pickoffsuccess, baserunner, pitcher, baseman):
-        diceroll = np.random.rand() * 100
-        
-        pickoffmod = (pitcher.pickoff - 50)/50
-        pickoffchances = (1+pickoffmod)*50
-        
-        bsp = (baserunner.speed - 50)/50
-        bbr = (baserunner.baserunning - 50)/50
-        brr = (baserunner.baserunning - 50)/5
-        baserunner_scores = [bsp, bbr]
-        baserunner_weights = [3, 6]
-        baserunner  = ((1+np.average(baserunner_scores, weights=baserunner_weights))*50)+brr
-        
-        error_check_t, error_check_c, d_action = Error_Throw_Catch(self, pitcher, baseman)     #self.gamestate.game.baselines.Throw_Catch(pitcher, baseman)
-        error_check = [error_check_t, error_check_c]
-        self.defensiveactions.append(d_action)
+                runner = getattr(state, RUNNER_SLOTS[base])
+                odds = self.steal_odds.get(runner.id)
+                if odds is None:
+                    odds = frequency_odds(game.battingteam.index.strategy(runner.id).stealfreq)
+                    self.steal_odds[runner.id] = odds
+            share = remaining * odds
+            if share > 0:
+                shares.append((share, kind, base))
+                remaining -= share
 
+        self.quiet = remaining
+        events = []
+        threshold = remaining
+        for share, kind, base in shares:
+            threshold += share
+            events.append((threshold, kind, base))
+        if events:
+            # Rounding must not leave a sliver of rolls matching no event
+            events[-1] = (1.0, events[-1][1], events[-1][2])
+        self.events = tuple(events)
 
-        if error_check[0] or error_check[1] == True:
-            self.gamestate.defensiveoutcome = (None, None, None, "error on pickoff", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-            return False, baserunner, error_check[0], error_check[1]
+    def _advance_all(self):
+        """Move every runner up a base; the runner on third scores."""
+        game = self.game
+        state = game.state
+        if state.third is not None:
+            game.current_runners_home.append(state.third)
+        state.third, state.second, state.first = state.second, state.first, None
 
-        pickoffscore = (pickoffchances / baserunner) * pickoffsuccess
-        diceroll = np.random.rand()
-        if pickoffscore > diceroll:
-            self.gamestate.defensiveoutcome = (None, None, None, "pickoff", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-            return True, None, error_check[0], error_check[1]
-        else:
-            self.gamestate.defensiveoutcome = (None, None, None, "failed pickoff", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-            return False, baserunner, error_check[0], error_check[1]
-        
-    def calc_baserunning_math(self, stealsuccess, baserunner, pitcher, catcher, baseman):
-        bsp = (baserunner.speed - 50)/50
-        bbr = (baserunner.baserunning - 50)/50
-        brr = (baserunner.baserunning - 50)/5
-        baserunner_scores = [bsp, bbr]
-        baserunner_weights = [6, 3]
-        baserunner  = ((1+np.average(baserunner_scores, weights=baserunner_weights))*50)+brr
-
-        ctp = (catcher.throwpower - 50)/50
-        cta = (catcher.throwacc - 50)/50
-        ccs = (catcher.catchsequence - 50)/50
-        pps = (pitcher.psequencing - 50)/50
-        cfr = (catcher.fieldreact - 50)/5
-        battery_scores = [ctp, cta, ccs, pps]
-        battery_weights = [15, 3, 1, 1]
-        battery = ((1+np.average(battery_scores, weights=battery_weights))*50)+cfr
-        comp_score = baserunner/battery
-        steal_outcome_odds = comp_score*stealsuccess
-
-        diceroll = np.random.rand()
-        
-        
-        error_check_t, error_check_c,  d_action = Error_Throw_Catch(self, catcher, baseman) #self.gamestate.game.baselines.Throw_Catch(pitcher, baseman) 
-        error_check = [error_check_t, error_check_c]
+    def _result(self, outcome):
+        """Record the event's PlayResult on the action."""
+        self.gamestate.defensiveoutcome = PlayResult.from_game(
+            outcome, self.game, self.errorlist, self.defensiveactions
+        )
+
+    def _pickoff(self, base) -> bool:
+        """Pickoff throw to an occupied base; always replaces the pitch."""
+        game = self.game
+        state = game.state
+        state.flags |= IS_PICKOFF
+        slot = RUNNER_SLOTS[base]
+        runner = getattr(state, slot)
+        pitcher = game.pitchingteam.currentpitcher
+        baseman = getattr(game.pitchingteam, BASEMEN[base])
+
+        error_check_t, error_check_c, d_action = Error_Throw_Catch(self, pitcher, baseman)
         self.defensiveactions.append(d_action)
-        
 
-        if (steal_outcome_odds > diceroll):
-            self.gamestate.defensiveoutcome = (None, None, None, "stolen base", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-            return True, error_check
+        if error_check_t:
+            game.error_count += 1
+            self._advance_all()
+            self._result("error on pickoff")
+        elif error_check_c:
+            game.error_count += 1
+            #need to assign error eventually
+            self._result("error on pickoff")
         else:
-            self.gamestate.defensiveoutcome = (None, None, None, "caught stealing", [self.gamestate.game.on_firstbase, self.gamestate.game.on_secondbase, self.gamestate.game.on_thirdbase, self.gamestate.game.current_runners_home], self.errorlist, self.defensiveactions)
-            return False, error_check
\ No newline at end of file
+            pickoffscore = pitcher.pickoff / runner_score(runner, PICKOFF_RUNNER_WEIGHTS) * game.baselines.pickoff_success
+            if pickoffscore > game.rng.baserunning.random():
+                setattr(state, slot, None)
+                game.outcount += 1
+                self._result("successful pickoff")
+            else:
+                self._result("unsuccessful pickoff")
+        return True
+
+    def _steal(self, base) -> bool:
+        """
+        Steal attempt by the runner on a base (3 = steal of home).
+
+        Returns:
+            True when the attempt replaces the pitch; an attempt that draws
+            an error moves the runners and the pitch is still thrown
+        """
+        game = self.game
+        state = game.state
+        state.flags |= IS_STEALATTEMPT
+        slot = RUNNER_SLOTS[base]
+        runner = getattr(state, slot)
+        pitchingteam = game.pitchingteam
+        catcher = pitchingteam.catcher
+
+        comp_score = runner_score(runner, STEAL_RUNNER_WEIGHTS) / battery_score(pitchingteam.currentpitcher, catcher)
+        stolen = comp_score * game.baselines.steal_success > game.rng.baserunning.random()
+
+        error_check_t, error_check_c, d_action = Error_Throw_Catch(self, catcher, getattr(pitchingteam, BASEMEN[base]))
+        self.defensiveactions.append(d_action)
+
+        if error_check_t or error_check_c:
+            game.error_count += 1
+            runner.battingstats.Adder("stolen_bases", 1)
+            if error_check_t:
+                self._advance_all()
+            else:
+                # The runner alone takes the (open) next base
+                setattr(state, slot, None)
+                if base == 3:
+                    game.current_runners_home.append(runner)
+                else:
+                    setattr(state, RUNNER_SLOTS[base + 1], runner)
+            self._result("error on steal")
+            return False
+
+        # A clean attempt does not settle the play: the runner holds, the
+        # pitch is thrown and the attempt's odds only name the outcome
+        self._result("stolen base" if stolen else "caught stealing")
+        return False
@@ -4,6 +4,38 @@ from Baselines import Baselines as b
 import Fatigue as f
 import Player
 import os
+from roster_index import RosterIndex
+
+
+class PlayerListRoster:
+    """Roster stand-in for teams built from endpoint players."""
+
+    def __init__(self, playerlist):
+        self.playerlist = playerlist
+
+
+class EndpointPlayerStrat:
+    """Per-player strategy read from endpoint player data."""
+
+    def __init__(self, player):
+        self.id = player.id
+        # Use player's usage_preference if available
+        pref = getattr(player, 'usage_preference', 'normal')
+        self.pitchpull = 100 if pref == 'normal' else (80 if pref == 'short' else 120)
+        self.pulltend = pref if pref in ['normal', 'quick', 'long'] else 'normal'
+        # Strategy values from player (endpoint data)
+        self.stealfreq = getattr(player, 'stealfreq', 10.0)
+        self.pickofffreq = getattr(player, 'pickofffreq', 10.0)
+        self.plate_approach = getattr(player, 'plate_approach', 'normal')
+        self.pitchchoices = getattr(player, 'pitchchoices', [])
+
+
+class PlayerListStrategy:
+    """Team strategy stand-in holding one EndpointPlayerStrat per player."""
+
+    def __init__(self, players):
+        self.playerstrategy = [EndpointPlayerStrat(p) for p in players]
+
 
 class Team():
     def __init__(self, name, travelstatus, pitchervalue, baselines):
@@ -38,6 +70,7 @@ class Team():
         self.currentpitcher = Team.GrabStartingPitcher(self, pitchervalue)
         self.reliefpitchers = Team.GrabReliefPitchers(self)
         self.benchplayers = Team.GrabBenchBats(self)
+        self.index = RosterIndex(self)
 
     @classmethod
     def from_players(cls, name: str, players: list, baselines, use_dh: bool = True,
@@ -64,31 +97,8 @@ class Team():
         # Store all players for reference
         instance._all_players = players
 
-        # Create a mock roster object with playerlist
-        class MockRoster:
-            def __init__(self, playerlist):
-                self.playerlist = playerlist
-        instance.roster = MockRoster(players)
-
-        # Create a mock strategy object
-        class MockStrategy:
-            def __init__(self, players):
-                self.playerstrategy = []
-                for p in players:
-                    class PlayerStrat:
-                        def __init__(self, player):
-                            self.id = player.id
-                            # Use player's usage_preference if available
-                            pref = getattr(player, 'usage_preference', 'normal')
-                            self.pitchpull = 100 if pref == 'normal' else (80 if pref == 'short' else 120)
-                            self.pulltend = pref if pref in ['normal', 'quick', 'long'] else 'normal'
-                            # Strategy values from player (endpoint data)
-                            self.stealfreq = getattr(player, 'stealfreq', 10.0)
-                            self.pickofffreq = getattr(player, 'pickofffreq', 10.0)
-                            self.plate_approach = getattr(player, 'plate_approach', 'normal')
-                            self.pitchchoices = getattr(player, 'pitchchoices', [])
-                    self.playerstrategy.append(PlayerStrat(p))
-        instance.strategy = MockStrategy(players)
+        instance.roster = PlayerListRoster(players)
+        instance.strategy = PlayerListStrategy(players)
 
         # Grab position players
         instance.catcher = instance._grab_position_from_list(players, 'catcher')
@@ -133,6 +143,7 @@ class Team():
 
         instance.reliefpitchers = [p for p in players if p.lineup == "relief" and p.energy >= 75]
         instance.benchplayers = [p for p in players if p.lineup == "bench"]
+        instance.index = RosterIndex(instance)
 
         return instance
 
@@ -232,6 +243,7 @@ class Team():
         
         starterid = find_index(self.battinglist, 'lineup', subbedplayer.lineup)
         self.battinglist[starterid] = sub
+        self.index.substitute(sub)
 
     def TickInningsPlayed(self):
         defenders = [defender for defender in self.battinglist if defender.lineup!="designatedhitter"]
@@ -267,7 +279,7 @@ class Team():
         pass
 
     def DecidePitchingChange(self):
-        playerstrat = [playerstrat for playerstrat in self.strategy.playerstrategy if playerstrat.id == self.currentpitcher.id][0]
+        playerstrat = self.index.strategy(self.currentpitcher.id)
 
         if self.currentpitcher.pitchingstats.pitches_thrown > playerstrat.pitchpull:
             #print(f"pitches exceeded {self.currentpitcher.pitchingstats.pitches_thrown} / {playerstrat.pitchpull}")
@@ -11,6 +11,7 @@ This adapter:
 3. Calculates injury risk modifiers based on player injury_risk attribute
 """
 
+import random
 from typing import Dict, List, Optional
 from Player import Player
 
@@ -118,6 +119,8 @@ class InjuryAdapter:
                     original_value = getattr(player, attr_name)
                     new_value = original_value * multiplier
                     setattr(player, attr_name, new_value)
+                    # Keep the effect when AbilityMod recomputes ratings
+                    player.add_rating_multiplier(attr_name, multiplier)
                     applied_effects[attr_name] = {
                         "original": original_value,
                         "modified": new_value,
@@ -188,7 +191,7 @@ class InjuryAdapter:
             pool.append(injury)
         return pool
 
-    def calculate_injury_duration(self, injury_type: dict) -> int:
+    def calculate_injury_duration(self, injury_type: dict, rng=None) -> int:
         """
         Calculate random duration for an injury.
 
@@ -196,19 +199,20 @@ class InjuryAdapter:
 
         Args:
             injury_type: Injury type definition
+            rng: Random stream to draw from (defaults to module random)
 
         Returns:
             Duration in weeks
         """
-        import random
+        rng = rng or random
         min_weeks = injury_type.get("min_weeks", 1)
         max_weeks = injury_type.get("max_weeks", 4)
         mean_weeks = injury_type.get("mean_weeks", 2)
 
         # Use triangular distribution centered on mean
-        return round(random.triangular(min_weeks, max_weeks, mean_weeks))
+        return round(rng.triangular(min_weeks, max_weeks, mean_weeks))
 
-    def calculate_injury_effects(self, injury_type: dict) -> dict:
+    def calculate_injury_effects(self, injury_type: dict, rng=None) -> dict:
         """
         Calculate random effects for an injury.
 
@@ -216,12 +220,12 @@ class InjuryAdapter:
 
         Args:
             injury_type: Injury type definition
+            rng: Random stream to draw from (defaults to module random)
 
         Returns:
             Dict of attribute -> multiplier
         """
-        import random
-
+        rng = rng or random
         impact_template = injury_type.get("impact_template_json", {})
         effects = {}
 
@@ -229,7 +233,7 @@ class InjuryAdapter:
             if isinstance(bounds, dict):
                 min_pct = bounds.get("min_pct", 1.0)
                 max_pct = bounds.get("max_pct", 1.0)
-                effects[attr] = random.uniform(min_pct, max_pct)
+                effects[attr] = rng.uniform(min_pct, max_pct)
             else:
                 effects[attr] = bounds
 
@@ -290,4 +290,7 @@ class PlayerAdapter:
                 if hasattr(player, og_attr):
                     setattr(player, og_attr, getattr(player, og_attr) * pitch_break_mod)
 
+            # Base ratings changed; recompute on the next AbilityMod
+            player.ratings_dirty = True
+
         return players
@@ -0,0 +1,507 @@
+"""
+Incremental play-by-play analytics.
+
+GameAnalytics folds every recorded PlayEvent into the aggregates behind the
+tuning_data, debug and game_summary sections as the action finishes, so
+building those sections at game end is a read of running totals instead
+of a rescan of the whole play-by-play per aggregate. The result methods
+never modify the running state and can be called at any point mid-game.
+"""
+
+from codes import CONTACT_NAMES, DEPTH_NAMES, DIRECTION_NAMES, ContactType, Depth, PitchResult, PitchDetail, PlayOutcome
+from events import IS_WALK, IS_STRIKEOUT, IS_INPLAY, IS_HBP, AB_OVER
+
+
+# Batted ball samples kept for debug output
+MAX_INTERACTION_SAMPLES = 10
+
+ADVANTAGE_KEYS = ("contact", "power", "eye", "discipline")
+
+# Advantage buckets (upper bound, key, label), checked in order
+ADVANTAGE_BUCKETS = (
+    (-0.6, "very_negative", "< -0.6"),
+    (-0.3, "negative", "-0.6 to -0.3"),
+    (0, "slight_negative", "-0.3 to 0"),
+    (0.3, "slight_positive", "0 to 0.3"),
+    (0.6, "positive", "0.3 to 0.6"),
+    (None, "very_positive", ">= 0.6"),
+)
+
+OUTFIELD_DEPTHS = (Depth.DEEP_OF, Depth.MIDDLE_OF, Depth.SHALLOW_OF)
+
+BASERUNNING_KEYS = (
+    # Sac fly tracking
+    "sac_fly_opportunities", "sac_fly_scores",
+    # R2 on single tracking
+    "r2_on_single_opportunities", "r2_scores_on_single",
+    # R1 advancement tracking
+    "r1_on_single_opportunities", "r1_to_third_on_single",
+    # R1 on double tracking
+    "r1_on_double_opportunities", "r1_scores_on_double",
+    # Tag-up tracking
+    "tag_up_attempts", "tag_up_successes",
+    # Overall
+    "total_runs_scored", "runs_on_hits", "runs_on_sac_flies",
+    # Double play / Triple play tracking
+    "dp_opportunities", "dp_completed", "tp_opportunities", "tp_completed",
+)
+
+COUNT_SITUATION_KEYS = (
+    "total_pitches", "balls", "strikes_looking", "strikes_swinging", "fouls",
+    "in_play", "hits", "outs", "walks", "strikeouts", "hbp",
+)
+
+HANDEDNESS_KEYS = (
+    "plate_appearances", "at_bats", "hits", "walks", "strikeouts", "homeruns",
+    "batted_balls", "quality_contact", "barrels",
+)
+
+
+def advantage_bucket(value: float) -> str:
+    """Bucket key for an advantage value."""
+    for upper, key, _ in ADVANTAGE_BUCKETS:
+        if upper is None or value < upper:
+            return key
+
+
+def rate(num, denom, ndigits=1, scale=100, default=0):
+    """num/denom as a rounded percentage (default when there is no denominator)."""
+    return round(num / denom * scale, ndigits) if denom > 0 else default
+
+
+class RunningStats:
+    """Count/min/max/sum of a stream of values."""
+
+    __slots__ = ("count", "min", "max", "total")
+
+    def __init__(self):
+        self.count = 0
+        self.min = None
+        self.max = None
+        self.total = 0
+
+    def add(self, value):
+        if self.count == 0:
+            self.min = self.max = value
+        else:
+            if value < self.min:
+                self.min = value
+            if value > self.max:
+                self.max = value
+        self.count += 1
+        self.total += value
+
+    def summary(self) -> dict:
+        if not self.count:
+            return {"count": 0, "min": None, "max": None, "avg": None}
+        return {
+            "count": self.count,
+            "min": round(self.min, 3),
+            "max": round(self.max, 3),
+            "avg": round(self.total / self.count, 3)
+        }
+
+
+class GameAnalytics:
+    """Running play-by-play aggregates for one game."""
+
+    def __init__(self, players: dict, names: dict):
+        """
+        Args:
+            players: Player id -> Player for both rosters
+            names: Player id -> "First Last" for both rosters
+        """
+        self.players = players
+        self.names = names
+        self.total_actions = 0
+
+        self.contact_counts = [0] * len(CONTACT_NAMES)
+        self.baserunning = dict.fromkeys(BASERUNNING_KEYS, 0)
+        self.left_on_base = {"away": 0, "home": 0}
+        self.last_bottom_runs = None
+
+        self.advantages = {key: RunningStats() for key in ADVANTAGE_KEYS}
+        self.interaction_samples = []
+        self.player_tiers = {}
+        self.player_swings = {}
+        self.whiff_buckets = {
+            key: {"range": label, "swings": 0, "whiffs": 0, "contacts": 0}
+            for _, key, label in ADVANTAGE_BUCKETS
+        }
+        self.barrel_buckets = {
+            key: {"range": label, "quality_hits": 0, "barrels": 0, "solids": 0}
+            for _, key, label in ADVANTAGE_BUCKETS
+        }
+        self.counts = {}
+        self.matchups = {}
+        self.matchup_advantages = {}
+
+    @classmethod
+    def from_events(cls, events, players: dict, names: dict):
+        """
+        Build the aggregates for an already-recorded play-by-play.
+
+        Args:
+            events: PlayEvents in game order
+            players: Player id -> Player for both rosters
+            names: Player id -> "First Last" for both rosters
+
+        Returns:
+            GameAnalytics instance
+        """
+        analytics = cls(players, names)
+        for event in events:
+            analytics.add(event)
+        return analytics
+
+    def add(self, event):
+        """
+        Fold one recorded action into every aggregate.
+
+        Args:
+            event: events.PlayEvent for the action
+        """
+        self.total_actions += 1
+        batted_ball = event.batted_ball
+        if batted_ball is not None:
+            self.contact_counts[event.contact] += 1
+
+        if event.outs == 3:
+            runners_on = ((event.on_first_id is not None) + (event.on_second_id is not None)
+                          + (event.on_third_id is not None))
+            self.left_on_base["away" if event.top else "home"] += runners_on
+        if not event.top:
+            self.last_bottom_runs = event.runners_scored
+
+        self._add_baserunning(event)
+
+        interaction = event.interaction
+        if interaction:
+            for key in ADVANTAGE_KEYS:
+                value = interaction.get(f"adv_{key}")
+                if value is not None:
+                    self.advantages[key].add(value)
+            if event.batter_id:
+                self._add_swing_decision(event, interaction)
+            self._add_whiff(interaction)
+
+        modifiers = event.modifiers
+        if modifiers:
+            if event.batter_id:
+                self._add_tier(event, modifiers)
+            self._add_barrel(event, modifiers)
+
+        if batted_ball is not None and len(self.interaction_samples) < MAX_INTERACTION_SAMPLES:
+            self.interaction_samples.append({
+                "inning": event.inning,
+                "inning_half": "Top" if event.top else "Bottom",
+                "batter": self.names.get(event.batter_id),
+                "pitcher": self.names.get(event.pitcher_id),
+                "batted_ball": batted_ball,
+                "direction": DIRECTION_NAMES[event.direction],
+                "depth": DEPTH_NAMES[event.depth],
+                "outcome": event.outcome_name,
+                "interaction_data": interaction,
+                "modifier_data": modifiers,
+            })
+
+        self._add_count_situation(event)
+        self._add_handedness(event)
+
+    # ------------------------------------------------------------------
+    # Per-aggregate updates
+    # ------------------------------------------------------------------
+
+    def _add_baserunning(self, event):
+        analysis = self.baserunning
+        runners_scored = event.runners_scored
+        if runners_scored:
+            analysis["total_runs_scored"] += runners_scored
+
+        pre_r1 = event.pre_r1_id
+        pre_r2 = event.pre_r2_id
+        pre_r3 = event.pre_r3_id
+        outcome = event.play_outcome
+        scored_ids = event.scored_ids
+
+        # Sac fly opportunity: R3 with <2 outs, OUTFIELD fly ball out
+        if (pre_r3 is not None and event.pre_outs < 2 and event.air is True
+                and outcome == PlayOutcome.OUT and event.depth in OUTFIELD_DEPTHS):
+            analysis["sac_fly_opportunities"] += 1
+            if pre_r3 in scored_ids:
+                analysis["sac_fly_scores"] += 1
+                analysis["runs_on_sac_flies"] += 1
+
+        if outcome == PlayOutcome.SINGLE:
+            if pre_r2 is not None:
+                analysis["r2_on_single_opportunities"] += 1
+                if pre_r2 in scored_ids:
+                    analysis["r2_scores_on_single"] += 1
+            if pre_r1 is not None:
+                analysis["r1_on_single_opportunities"] += 1
+                if pre_r1 == event.on_third_id:
+                    analysis["r1_to_third_on_single"] += 1
+        elif outcome == PlayOutcome.DOUBLE and pre_r1 is not None:
+            analysis["r1_on_double_opportunities"] += 1
+            if pre_r1 in scored_ids:
+                analysis["r1_scores_on_double"] += 1
+
+        # Tag-up events from defensive actions
+        if event.defensive_actions and any("tags to" in str(play) for play in event.defensive_actions):
+            analysis["tag_up_attempts"] += 1
+            analysis["tag_up_successes"] += 1
+
+        if event.is_dp_opportunity:
+            analysis["dp_opportunities"] += 1
+            if event.is_dp:
+                analysis["dp_completed"] += 1
+        if event.is_tp_opportunity:
+            analysis["tp_opportunities"] += 1
+            if event.is_tp:
+                analysis["tp_completed"] += 1
+
+    def _add_swing_decision(self, event, interaction):
+        swing_decision = interaction.get("swing_decision")
+        final_location = interaction.get("final_location")
+        if swing_decision is None or final_location is None:
+            return
+
+        swings = self.player_swings.get(event.batter_id)
+        if swings is None:
+            swings = self.player_swings[event.batter_id] = {
+                "player_name": self.names.get(event.batter_id),
+                "inside_swings": 0,
+                "inside_takes": 0,
+                "outside_swings": 0,
+                "outside_takes": 0,
+            }
+        side = "inside" if final_location == "Inside" else "outside"
+        swings[f"{side}_swings" if swing_decision == "Swing" else f"{side}_takes"] += 1
+
+    def _add_whiff(self, interaction):
+        eye_adv = interaction.get("adv_eye")
+        if eye_adv is None or interaction.get("swing_decision") != "Swing":
+            return
+
+        bucket = self.whiff_buckets[advantage_bucket(eye_adv)]
+        bucket["swings"] += 1
+        contact_result = interaction.get("contact_result")
+        if contact_result == "Whiff":
+            bucket["whiffs"] += 1
+        elif contact_result in ("Foul", "InPlay"):
+            bucket["contacts"] += 1
+
+    def _add_tier(self, event, modifiers):
+        tier = modifiers.get("selected_tier")
+        if not tier:
+            return
+
+        tiers = self.player_tiers.get(event.batter_id)
+        if tiers is None:
+            tiers = self.player_tiers[event.batter_id] = {
+                "player_name": self.names.get(event.batter_id),
+                "quality": 0,
+                "neutral": 0,
+                "poor": 0,
+                "total": 0
+            }
+        tiers[tier] += 1
+        tiers["total"] += 1
+
+    def _add_barrel(self, event, modifiers):
+        power_adv = modifiers.get("power_advantage")
+        if power_adv is None or modifiers.get("selected_tier") != "quality":
+            return
+
+        bucket = self.barrel_buckets[advantage_bucket(power_adv)]
+        bucket["quality_hits"] += 1
+        if event.depth is not None:
+            if event.contact == ContactType.BARREL:
+                bucket["barrels"] += 1
+            elif event.contact == ContactType.SOLID:
+                bucket["solids"] += 1
+
+    def _add_count_situation(self, event):
+        count_key = f"{event.balls}-{event.strikes}"
+        counts = self.counts.get(count_key)
+        if counts is None:
+            counts = self.counts[count_key] = dict.fromkeys(COUNT_SITUATION_KEYS, 0)
+
+        counts["total_pitches"] += 1
+        result_type = event.result
+        is_foul = event.is_foul
+
+        # Categorize pitch outcome
+        if event.has(IS_HBP) or result_type == PitchResult.HBP:
+            counts["hbp"] += 1
+        elif result_type == PitchResult.BALL:
+            counts["balls"] += 1
+        elif result_type == PitchResult.STRIKE:
+            if event.detail == PitchDetail.LOOKING:
+                counts["strikes_looking"] += 1
+            elif event.detail == PitchDetail.SWINGING:
+                counts["strikes_swinging"] += 1
+            elif is_foul:
+                counts["fouls"] += 1
+        elif is_foul:
+            counts["fouls"] += 1
+
+        # Balls in play
+        if event.has(IS_INPLAY) or (event.batted_ball is not None and not is_foul):
+            counts["in_play"] += 1
+            if event.is_hit_outcome:
+                counts["hits"] += 1
+            elif event.play_outcome == PlayOutcome.OUT:
+                counts["outs"] += 1
+
+        # Final PA outcomes at this count
+        if event.has(AB_OVER):
+            if event.has(IS_WALK):
+                counts["walks"] += 1
+            elif event.has(IS_STRIKEOUT):
+                counts["strikeouts"] += 1
+
+    def _add_handedness(self, event):
+        batter = self.players.get(event.batter_id)
+        pitcher = self.players.get(event.pitcher_id)
+        batter_hand = batter.handedness[0] if batter is not None and batter.handedness else "R"
+        pitcher_hand = pitcher.handedness[1] if pitcher is not None and len(pitcher.handedness or "") > 1 else "R"
+        matchup_key = f"{batter_hand}v{pitcher_hand}"
+
+        matchup = self.matchups.get(matchup_key)
+        if matchup is None:
+            matchup = self.matchups[matchup_key] = dict.fromkeys(HANDEDNESS_KEYS, 0)
+            self.matchup_advantages[matchup_key] = {key: [0, 0] for key in ADVANTAGE_KEYS}
+        matchup["plate_appearances"] += 1
+
+        interaction = event.interaction
+        if interaction:
+            advantages = self.matchup_advantages[matchup_key]
+            for key in ADVANTAGE_KEYS:
+                value = interaction.get(f"adv_{key}")
+                if value is not None:
+                    advantages[key][0] += value
+                    advantages[key][1] += 1
+
+        outcome = event.play_outcome
+        if event.is_hit_outcome:
+            matchup["hits"] += 1
+            matchup["at_bats"] += 1
+            if outcome == PlayOutcome.HOMERUN:
+                matchup["homeruns"] += 1
+        elif outcome == PlayOutcome.OUT:
+            matchup["at_bats"] += 1
+        elif outcome == PlayOutcome.WALK:
+            matchup["walks"] += 1
+        elif outcome == PlayOutcome.STRIKEOUT:
+            matchup["strikeouts"] += 1
+
+        if event.batted_ball is not None:
+            matchup["batted_balls"] += 1
+            if event.contact in (ContactType.BARREL, ContactType.SOLID):
+                matchup["quality_contact"] += 1
+            if event.contact == ContactType.BARREL:
+                matchup["barrels"] += 1
+
+    # ------------------------------------------------------------------
+    # Results (fresh dicts; running state is left untouched)
+    # ------------------------------------------------------------------
+
+    def contact_distribution(self) -> dict:
+        """Contact type counts and percentages of balls in play."""
+        total = sum(self.contact_counts)
+        distribution = {}
+        for name, count in zip(CONTACT_NAMES, self.contact_counts):
+            distribution[name] = {"count": count, "pct": rate(count, total)}
+        distribution["total_batted_balls"] = total
+        return distribution
+
+    def baserunning_analysis(self) -> dict:
+        """Baserunning opportunity/success counts and rates."""
+        analysis = dict(self.baserunning)
+        analysis["rates"] = {
+            "sac_fly_rate": rate(analysis["sac_fly_scores"], analysis["sac_fly_opportunities"], default=0.0),
+            "r2_scores_on_single_rate": rate(analysis["r2_scores_on_single"], analysis["r2_on_single_opportunities"], default=0.0),
+            "r1_to_third_on_single_rate": rate(analysis["r1_to_third_on_single"], analysis["r1_on_single_opportunities"], default=0.0),
+            "r1_scores_on_double_rate": rate(analysis["r1_scores_on_double"], analysis["r1_on_double_opportunities"], default=0.0),
+            "dp_rate": rate(analysis["dp_completed"], analysis["dp_opportunities"], default=0.0),
+            "tp_rate": rate(analysis["tp_completed"], analysis["tp_opportunities"], default=0.0),
+        }
+        return analysis
+
+    def advantage_summary(self) -> dict:
+        """Count/min/max/avg of each matchup advantage."""
+        return {f"{key}_advantage": self.advantages[key].summary() for key in ADVANTAGE_KEYS}
+
+    def samples(self, max_samples: int = MAX_INTERACTION_SAMPLES) -> list:
+        """The first batted ball events with their interaction data."""
+        return [dict(sample) for sample in self.interaction_samples[:max_samples]]
+
+    def tier_distribution_by_player(self) -> dict:
+        """Per-batter quality/neutral/poor tier counts and percentages."""
+        player_tiers = {}
+        for batter_id, tiers in self.player_tiers.items():
+            data = dict(tiers)
+            total = data["total"]
+            if total > 0:
+                data["quality_pct"] = round(data["quality"] / total * 100, 1)
+                data["neutral_pct"] = round(data["neutral"] / total * 100, 1)
+                data["poor_pct"] = round(data["poor"] / total * 100, 1)
+            player_tiers[batter_id] = data
+        return player_tiers
+
+    def swing_decision_rates(self) -> dict:
+        """Per-batter swing rates on Inside vs Outside pitches."""
+        player_swings = {}
+        for batter_id, swings in self.player_swings.items():
+            data = dict(swings)
+            data["inside_swing_rate"] = rate(data["inside_swings"], data["inside_swings"] + data["inside_takes"])
+            data["outside_swing_rate"] = rate(data["outside_swings"], data["outside_swings"] + data["outside_takes"])
+            data["chase_rate"] = data["outside_swing_rate"]  # Alias for clarity
+            player_swings[batter_id] = data
+        return player_swings
+
+    def whiff_rates_by_advantage(self) -> dict:
+        """Whiff and contact rates on swings, bucketed by eye advantage."""
+        buckets = {}
+        for key, bucket in self.whiff_buckets.items():
+            data = dict(bucket)
+            data["whiff_rate"] = rate(data["whiffs"], data["swings"])
+            data["contact_rate"] = rate(data["contacts"], data["swings"])
+            buckets[key] = data
+        return buckets
+
+    def barrel_rates_by_power_advantage(self) -> dict:
+        """Barrel and solid shares of quality contact, bucketed by power advantage."""
+        buckets = {}
+        for key, bucket in self.barrel_buckets.items():
+            data = dict(bucket)
+            data["barrel_rate"] = rate(data["barrels"], data["quality_hits"])
+            data["solid_rate"] = rate(data["solids"], data["quality_hits"])
+            buckets[key] = data
+        return buckets
+
+    def count_situation_data(self) -> dict:
+        """Pitch and PA outcomes by ball/strike count."""
+        return {count_key: dict(counts) for count_key, counts in self.counts.items()}
+
+    def handedness_matchup_breakdown(self) -> dict:
+        """Per-matchup (LvL, LvR, RvL, RvR, SvL, SvR) outcome rates and advantages."""
+        matchups = {}
+        for matchup_key, counts in self.matchups.items():
+            data = dict(counts)
+            pa = data["plate_appearances"]
+            bb = data["batted_balls"]
+            data["avg"] = rate(data["hits"], data["at_bats"], 3, 1)
+            data["k_rate"] = rate(data["strikeouts"], pa)
+            data["bb_rate"] = rate(data["walks"], pa)
+            data["quality_rate"] = rate(data["quality_contact"], bb)
+            data["barrel_rate"] = rate(data["barrels"], bb)
+            for key, (total, count) in self.matchup_advantages[matchup_key].items():
+                data[f"avg_{key}_advantage"] = round(total / count, 3) if count else None
+            matchups[matchup_key] = data
+        return matchups
+
+    def is_walkoff(self) -> bool:
+        """Whether the home team scored in its last recorded action."""
+        return self.last_bottom_runs is not None and self.last_bottom_runs > 0
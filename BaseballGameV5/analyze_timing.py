@@ -8,6 +8,9 @@ Analyzes the new Timing_Diagnostics data to understand:
 4. NEW: fieldreact and fieldspot impact
 5. NEW: Variance effects on outcomes
 6. Detailed flare/burner timing breakdown
+
+Diagnostics are off by default; generate output_test.json with them on:
+    python run_local.py input.json -o output_test.json --timing-diagnostics
 """
 
 import json
@@ -7,9 +7,12 @@ Both use the same payload structure - single game just has 1 game in subweeks.a.
 
 import sys
 import os
-from typing import Dict, List, Any
+import json
+from contextlib import asynccontextmanager
+from typing import Dict, List, Any, Optional
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -18,14 +21,51 @@ from api.models import (
     SimulationPayload,
     SimulationResponse,
     HealthResponse,
+    JobStatusResponse,
+    SubweekResultsResponse,
 )
+from api.executor import SimulationPool, pool_size_from_env, pool_mode_from_env
+from api.jobs import JobQueue, MULTI_WORKER_MESSAGE, jobs_enabled_from_env, web_workers_from_env
 import Game
+from event_log import resolve_level
+from game_options import GameOptions
+
+# Worker pool for parallel execution, sized by SIM_POOL_WORKERS (0 = serial)
+# and run as processes or threads per SIM_POOL_MODE
+simulation_pool: Optional[SimulationPool] = None
+
+# Background jobs (/jobs endpoints), unless SIM_JOBS=off
+jobs_enabled = jobs_enabled_from_env()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Pre-start the worker pool and the background job worker."""
+    global simulation_pool
+    workers = pool_size_from_env()
+    if workers > 0:
+        simulation_pool = SimulationPool(workers, pool_mode_from_env())
+        simulation_pool.warm()
+    if jobs_enabled:
+        # run_server refuses this; uvicorn started directly only warns
+        if web_workers_from_env() > 1:
+            print(f"Warning: {MULTI_WORKER_MESSAGE}", file=sys.stderr)
+        job_queue.start()
+    try:
+        yield
+    finally:
+        job_queue.stop()
+        if simulation_pool is not None:
+            simulation_pool.shutdown()
+            simulation_pool = None
+
 
 # Create FastAPI app
 app = FastAPI(
     title="Baseball Game Simulation API",
     description="Simulate baseball games with deterministic results",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware for service-to-service communication
@@ -77,13 +117,18 @@ DEFAULT_RULES = {
     "dh": True
 }
 
+# Optional result sections built when a payload doesn't choose its own
+# (game_id, result, boxscore and injuries are always returned)
+DEFAULT_SECTIONS = ["play_by_play"]
+
 
 def simulate_single_game(
     game_data: dict,
     rules: dict,
     level_config: dict,
     game_constants: dict,
-    injury_types: list = None
+    injury_types: list = None,
+    options: GameOptions = None
 ) -> dict:
     """
     Simulate a single game.
@@ -94,10 +139,15 @@ def simulate_single_game(
         level_config: Level-specific configuration
         game_constants: Shared game constants
         injury_types: List of injury type definitions
+        options: Sections, logging and engine modes of the request
+                 (None = all sections and default modes). A game that asks
+                 for surrogate defense fails when its level has no tables.
 
     Returns:
         Game result dictionary
     """
+    if options is None:
+        options = GameOptions()
     try:
         # Create game from endpoint payload
         game = Game.Game.from_endpoint(
@@ -107,9 +157,10 @@ def simulate_single_game(
             game_constants=game_constants,
             injury_types=injury_types
         )
+        game.apply_options(options, level_config, game_constants, rules)
 
         # Run simulation
-        result = game.run_simulation()
+        result = game.run_simulation(options.sections)
         return result
 
     except Exception as e:
@@ -125,33 +176,22 @@ def simulate_single_game(
         }
 
 
-def process_simulation(payload_dict: dict) -> dict:
+def _iter_game_jobs(payload_dict: dict):
     """
-    Process a simulation payload (works for both single game and batch).
+    Resolve the per-game configuration for every game in the payload.
 
     Args:
         payload_dict: The unified payload structure
 
-    Returns:
-        Results dict with subweeks, total_games_simulated, errors
+    Yields:
+        (subweek_name, game_data, rules, level_config) tuples in payload order
     """
-    game_constants = payload_dict.get("game_constants", DEFAULT_GAME_CONSTANTS)
     level_configs = payload_dict.get("level_configs", {})
     rules_by_level = payload_dict.get("rules", {})
-    injury_types = payload_dict.get("injury_types", [])
     subweeks = payload_dict.get("subweeks", {})
 
-    results: Dict[str, List[dict]] = {}
-    errors: List[dict] = []
-    total_games = 0
-    successful_games = 0
-
     for subweek_name, games in subweeks.items():
-        results[subweek_name] = []
-
         for game_data in games:
-            total_games += 1
-
             # Get level_id from game data
             level_id = str(game_data.get("league_level_id", "9"))
 
@@ -164,31 +204,90 @@ def process_simulation(payload_dict: dict) -> dict:
             if hasattr(level_config, 'model_dump'):
                 level_config = level_config.model_dump()
 
-            try:
+            yield subweek_name, game_data, rules, level_config
+
+
+def iter_simulation(payload_dict: dict, pool: SimulationPool = None):
+    """
+    Simulate every game in a payload, yielding each one as it finishes.
+
+    Games are yielded in payload (subweek/game) order whether they run
+    inline or in the worker pool.
+
+    Args:
+        payload_dict: The unified payload structure
+        pool: Optional worker pool; when given, games run in parallel
+
+    Yields:
+        (subweek_name, game_data, result, error) tuples; exactly one of
+        result (the game result dict) and error (a message) is set
+    """
+    game_constants = payload_dict.get("game_constants", DEFAULT_GAME_CONSTANTS)
+    injury_types = payload_dict.get("injury_types", [])
+    options = GameOptions.from_payload(payload_dict, DEFAULT_SECTIONS)
+    Game.Game.resolve_sections(options.sections)
+    resolve_level(options.log_level)
+
+    jobs = list(_iter_game_jobs(payload_dict))
+    if pool is not None:
+        outcomes = pool.run_games(
+            (game_data, rules, level_config, game_constants, injury_types, options)
+            for _, game_data, rules, level_config in jobs
+        )
+    else:
+        outcomes = (None for _ in jobs)
+
+    for (subweek_name, game_data, rules, level_config), future in zip(jobs, outcomes):
+        try:
+            if future is not None:
+                result = future.result()
+            else:
                 result = simulate_single_game(
                     game_data=game_data,
                     rules=rules,
                     level_config=level_config,
                     game_constants=game_constants,
-                    injury_types=injury_types
+                    injury_types=injury_types,
+                    options=options
                 )
+        except Exception as e:
+            yield subweek_name, game_data, None, str(e)
+            continue
+
+        if "error" in result and result.get("result") is None:
+            yield subweek_name, game_data, None, result["error"]
+        else:
+            yield subweek_name, game_data, result, None
+
+
+def process_simulation(payload_dict: dict, pool: SimulationPool = None) -> dict:
+    """
+    Process a simulation payload (works for both single game and batch).
+
+    Args:
+        payload_dict: The unified payload structure
+        pool: Optional worker pool; when given, games run in parallel and
+              results are gathered back in payload order
+
+    Returns:
+        Results dict with subweeks, total_games_simulated, errors
+    """
+    results: Dict[str, List[dict]] = {
+        subweek_name: [] for subweek_name in payload_dict.get("subweeks", {})
+    }
+    errors: List[dict] = []
+    successful_games = 0
 
-                if "error" in result and result.get("result") is None:
-                    errors.append({
-                        "game_id": game_data.get("game_id"),
-                        "subweek": subweek_name,
-                        "error": result["error"]
-                    })
-                else:
-                    results[subweek_name].append(result)
-                    successful_games += 1
-
-            except Exception as e:
-                errors.append({
-                    "game_id": game_data.get("game_id"),
-                    "subweek": subweek_name,
-                    "error": str(e)
-                })
+    for subweek_name, game_data, result, error in iter_simulation(payload_dict, pool):
+        if error is not None:
+            errors.append({
+                "game_id": game_data.get("game_id"),
+                "subweek": subweek_name,
+                "error": error
+            })
+        else:
+            results[subweek_name].append(result)
+            successful_games += 1
 
     return {
         "subweeks": results,
@@ -203,7 +302,7 @@ async def health_check():
     return HealthResponse(status="healthy", version="1.0.0")
 
 
-@app.post("/simulate", response_model=SimulationResponse)
+@app.post("/simulate", response_model=SimulationResponse, response_model_exclude_unset=True)
 async def simulate(payload: SimulationPayload):
     """
     Unified simulation endpoint for both single game and batch.
@@ -219,15 +318,120 @@ async def simulate(payload: SimulationPayload):
     """
     try:
         payload_dict = payload.model_dump()
-        result = process_simulation(payload_dict)
+        result = process_simulation(payload_dict, pool=simulation_pool)
         return result
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def iter_simulation_ndjson(payload_dict: dict, pool: SimulationPool = None):
+    """
+    Simulate a payload as newline-delimited JSON.
+
+    Emits one line per successfully simulated game as soon as it finishes,
+    followed by a trailing summary line, so nothing but the game in flight
+    is held in memory.
+
+    Args:
+        payload_dict: The unified payload structure
+        pool: Optional worker pool; when given, games run in parallel
+
+    Yields:
+        JSON lines: {"type": "game", "subweek": ..., "game": {...}} per game,
+        then {"type": "summary", "total_games_simulated": ..., "errors": [...]}
+    """
+    errors: List[dict] = []
+    successful_games = 0
+
+    for subweek_name, game_data, result, error in iter_simulation(payload_dict, pool):
+        if error is not None:
+            errors.append({
+                "game_id": game_data.get("game_id"),
+                "subweek": subweek_name,
+                "error": error
+            })
+            continue
+        successful_games += 1
+        yield json.dumps({"type": "game", "subweek": subweek_name, "game": result}, default=str) + "\n"
+
+    yield json.dumps({
+        "type": "summary",
+        "total_games_simulated": successful_games,
+        "errors": errors
+    }) + "\n"
+
+
+@app.post("/simulate/stream")
+async def simulate_stream(payload: SimulationPayload):
+    """
+    Streaming variant of /simulate.
+
+    Responds with application/x-ndjson: one line per finished game in
+    subweek/game order, then a summary line with errors and
+    total_games_simulated. Clients can ingest each game as it arrives.
+    """
+    return StreamingResponse(
+        iter_simulation_ndjson(payload.model_dump(), simulation_pool),
+        media_type="application/x-ndjson"
+    )
+
+
+# Background jobs, drained by a worker thread started in lifespan()
+job_queue = JobQueue(lambda payload_dict: iter_simulation(payload_dict, simulation_pool))
+
+
+def _get_job_or_404(job_id: str):
+    if not jobs_enabled:
+        raise HTTPException(status_code=404, detail="Background jobs are disabled (SIM_JOBS=off)")
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
+
+
+@app.post("/jobs", response_model=JobStatusResponse, status_code=202)
+async def submit_job(payload: SimulationPayload):
+    """
+    Queue a simulation payload and return immediately with a job id.
+
+    Poll /jobs/{job_id} for progress and fetch each subweek from
+    /jobs/{job_id}/subweeks/{subweek} once it is listed as completed.
+    """
+    if not jobs_enabled:
+        raise HTTPException(status_code=404, detail="Background jobs are disabled (SIM_JOBS=off)")
+    job = job_queue.submit(payload.model_dump())
+    return job.status_dict()
+
+
+@app.get("/jobs/{job_id}", response_model=JobStatusResponse)
+async def get_job(job_id: str):
+    """Status and progress (games done out of total) of a job."""
+    return _get_job_or_404(job_id).status_dict()
+
+
+@app.get("/jobs/{job_id}/subweeks/{subweek}", response_model=SubweekResultsResponse,
+         response_model_exclude_unset=True)
+async def get_job_subweek(job_id: str, subweek: str):
+    """Results for one subweek of a job, available once it has finished."""
+    job = _get_job_or_404(job_id)
+    if subweek not in job.results:
+        raise HTTPException(status_code=404, detail=f"Unknown subweek: {subweek}")
+    if subweek not in job.completed_subweeks:
+        raise HTTPException(status_code=409, detail=f"Subweek {subweek} is not finished yet")
+    return {"job_id": job_id, "subweek": subweek, "games": job.results[subweek]}
+
+
+@app.delete("/jobs/{job_id}", status_code=204)
+async def delete_job(job_id: str):
+    """Discard a job's results."""
+    _get_job_or_404(job_id)
+    if not job_queue.remove(job_id):
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+
+
 # Keep legacy endpoints for backwards compatibility
-@app.post("/simulate/game", response_model=SimulationResponse)
+@app.post("/simulate/game", response_model=SimulationResponse, response_model_exclude_unset=True)
 async def simulate_game(payload: SimulationPayload):
     """
     Legacy single game endpoint - redirects to unified /simulate.
@@ -235,7 +439,7 @@ async def simulate_game(payload: SimulationPayload):
     return await simulate(payload)
 
 
-@app.post("/simulate/batch", response_model=SimulationResponse)
+@app.post("/simulate/batch", response_model=SimulationResponse, response_model_exclude_unset=True)
 async def simulate_batch(payload: SimulationPayload):
     """
     Legacy batch endpoint - redirects to unified /simulate.
@@ -252,7 +456,11 @@ async def root():
         "endpoints": {
             "/health": "Health check",
             "/simulate": "Unified simulation endpoint (single or batch)",
+            "/simulate/stream": "Streaming (NDJSON) simulation, one line per game",
             "/simulate/game": "Legacy single game endpoint",
-            "/simulate/batch": "Legacy batch endpoint"
+            "/simulate/batch": "Legacy batch endpoint",
+            "/jobs": "Submit a background simulation job",
+            "/jobs/{job_id}": "Job status and progress",
+            "/jobs/{job_id}/subweeks/{subweek}": "Results for a finished subweek"
         }
     }
@@ -0,0 +1,159 @@
+"""
+Parallel execution of game simulations.
+
+Fans the games of a simulation payload out across a pool of warm workers
+and hands the results back in the original subweek/game order. Workers
+are processes by default, or threads in one process: the engine keeps no
+shared mutable state (RNG streams, action ids and roster objects are per
+game; shared caches are locked), so on free-threaded CPython (3.13t) a
+thread pool uses every core without pickling payloads to subprocesses.
+Every game seeds its own RNG from its `random_seed`, so a game produces
+exactly the same output whether it runs in a worker or inline.
+"""
+
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Environment variable controlling the pool size (0 disables the pool)
+POOL_SIZE_ENV = "SIM_POOL_WORKERS"
+# Environment variable choosing worker processes or threads
+POOL_MODE_ENV = "SIM_POOL_MODE"
+POOL_MODES = ("process", "thread")
+
+# Number of games kept in flight per worker while results are gathered
+PREFETCH_PER_WORKER = 2
+
+
+def _init_worker():
+    """Import the engine up front so the first game doesn't pay for it."""
+    import numpy  # noqa: F401
+    import Game  # noqa: F401
+    import adapter  # noqa: F401
+
+
+def _ping():
+    """No-op task used to force every worker to start."""
+    return os.getpid()
+
+
+def _run_game(game_data, rules, level_config, game_constants, injury_types, options=None):
+    """Worker entry point: simulate one game."""
+    from api.app import simulate_single_game
+
+    return simulate_single_game(
+        game_data=game_data,
+        rules=rules,
+        level_config=level_config,
+        game_constants=game_constants,
+        injury_types=injury_types,
+        options=options
+    )
+
+
+def pool_size_from_env(default: int = 0) -> int:
+    """
+    Read the configured pool size from the environment.
+
+    Args:
+        default: Size to use when the variable is unset or invalid
+
+    Returns:
+        Number of worker processes (0 means run serially)
+    """
+    value = os.environ.get(POOL_SIZE_ENV)
+    if value is None:
+        return default
+    try:
+        return max(0, int(value))
+    except ValueError:
+        return default
+
+
+def pool_mode_from_env(default: str = "process") -> str:
+    """
+    Read the configured pool mode from the environment.
+
+    Args:
+        default: Mode to use when the variable is unset or invalid
+
+    Returns:
+        "process" or "thread"
+    """
+    value = os.environ.get(POOL_MODE_ENV, "").strip().lower()
+    return value if value in POOL_MODES else default
+
+
+class SimulationPool:
+    """
+    Pool of pre-started workers for simulating games.
+
+    Workers import `Game`, `numpy` and the adapters when they start, and
+    `warm()` starts all of them, so no request pays the import cost.
+    Thread workers share the server process (and its imports); process
+    workers each get their own.
+    """
+
+    def __init__(self, workers: Optional[int] = None, mode: str = "process"):
+        """
+        Args:
+            workers: Number of workers (defaults to the CPU count)
+            mode: "process" for worker processes, "thread" for threads
+        """
+        if mode not in POOL_MODES:
+            raise ValueError(f"Unknown pool mode {mode!r}; expected one of {', '.join(POOL_MODES)}")
+        self.workers = workers or os.cpu_count() or 1
+        self.mode = mode
+        if mode == "thread":
+            _init_worker()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="simulation"
+            )
+        else:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker
+            )
+
+    def warm(self):
+        """Start every worker and wait until they are ready."""
+        futures = [self._executor.submit(_ping) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+
+    def run_games(self, jobs: Iterable[tuple]) -> Iterator:
+        """
+        Simulate games in the workers, yielding futures in submission order.
+
+        Only a bounded number of games are in flight at once, so results can
+        be consumed as they are ready instead of all at the end.
+
+        Args:
+            jobs: Iterable of (game_data, rules, level_config, game_constants,
+                  injury_types, options) tuples, options being the
+                  request's GameOptions
+
+        Yields:
+            Future for each game's result dict, in the order submitted
+        """
+        window = self.workers * PREFETCH_PER_WORKER
+        pending = deque()
+
+        for job in jobs:
+            pending.append(self._executor.submit(_run_game, *job))
+            if len(pending) >= window:
+                yield pending.popleft()
+
+        while pending:
+            yield pending.popleft()
+
+    def shutdown(self):
+        """Stop the workers."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
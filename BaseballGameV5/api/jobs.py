@@ -0,0 +1,245 @@
+"""
+Background simulation jobs.
+
+A submitted payload becomes a job that a worker thread inside the service
+drives through the simulation, so long batches don't have to fit inside
+one HTTP request. Clients poll the job for progress and fetch each
+subweek's results as soon as that subweek has finished.
+
+Jobs live in the memory of the server process that accepted them. With
+several server workers (WEB_CONCURRENCY > 1) a poll may reach a worker
+that has never seen the job, so jobs need a single worker: run_server
+refuses to start otherwise, and the app warns at startup. Scale games
+with SIM_POOL_WORKERS instead, or set SIM_JOBS=off to run several
+workers without the /jobs endpoints.
+"""
+
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+# Finished jobs kept in memory before the oldest are dropped
+DEFAULT_MAX_FINISHED_JOBS = 100
+
+# Environment variable that turns background jobs off (0/off/false/no)
+JOBS_ENV = "SIM_JOBS"
+# Environment variable with the number of server worker processes
+WEB_WORKERS_ENV = "WEB_CONCURRENCY"
+
+MULTI_WORKER_MESSAGE = (
+    f"background jobs are kept in one server process, but {WEB_WORKERS_ENV} asks "
+    f"for several; run one worker (parallelise games with SIM_POOL_WORKERS) "
+    f"or set {JOBS_ENV}=off"
+)
+
+
+def jobs_enabled_from_env(default: bool = True) -> bool:
+    """
+    Read whether background jobs are enabled from the environment.
+
+    Args:
+        default: Setting to use when the variable is unset
+
+    Returns:
+        False when SIM_JOBS is 0, off, false or no
+    """
+    value = os.environ.get(JOBS_ENV, "").strip().lower()
+    if not value:
+        return default
+    return value not in ("0", "off", "false", "no")
+
+
+def web_workers_from_env(default: int = 1) -> int:
+    """
+    Read the number of server worker processes from the environment.
+
+    Args:
+        default: Count to use when the variable is unset or invalid
+
+    Returns:
+        Worker count (at least 1)
+    """
+    try:
+        return max(1, int(os.environ.get(WEB_WORKERS_ENV, default)))
+    except ValueError:
+        return default
+
+
+class SimulationJob:
+    """State and results of one submitted simulation payload."""
+
+    def __init__(self, payload_dict: dict):
+        """
+        Args:
+            payload_dict: The unified payload structure
+        """
+        self.job_id = uuid.uuid4().hex
+        self.payload = payload_dict
+        self.status = QUEUED
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.failure = None
+
+        subweeks = payload_dict.get("subweeks", {})
+        self.games_per_subweek = {name: len(games) for name, games in subweeks.items()}
+        self.total_games = sum(self.games_per_subweek.values())
+        self.games_done = 0
+        self.total_games_simulated = 0
+
+        self.results: Dict[str, List[dict]] = {name: [] for name in subweeks}
+        self.errors: List[dict] = []
+        self._done_per_subweek = {name: 0 for name in subweeks}
+        self.completed_subweeks: List[str] = [
+            name for name, count in self.games_per_subweek.items() if count == 0
+        ]
+
+    def record_game(self, subweek_name: str, game_data: dict,
+                    result: Optional[dict], error: Optional[str]):
+        """
+        Store one finished game and update progress.
+
+        Args:
+            subweek_name: Subweek the game belongs to
+            game_data: The game's payload
+            result: Game result dict (None on error)
+            error: Error message (None on success)
+        """
+        if error is not None:
+            self.errors.append({
+                "game_id": game_data.get("game_id"),
+                "subweek": subweek_name,
+                "error": error
+            })
+        else:
+            self.results[subweek_name].append(result)
+            self.total_games_simulated += 1
+
+        self.games_done += 1
+        self._done_per_subweek[subweek_name] += 1
+        if self._done_per_subweek[subweek_name] == self.games_per_subweek[subweek_name]:
+            self.completed_subweeks.append(subweek_name)
+
+    def status_dict(self) -> dict:
+        """Job status and progress, without results."""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "games_done": self.games_done,
+            "total_games": self.total_games,
+            "total_games_simulated": self.total_games_simulated,
+            "completed_subweeks": list(self.completed_subweeks),
+            "errors": list(self.errors),
+            "failure": self.failure,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobQueue:
+    """
+    In-process job queue drained by a single background worker thread.
+
+    The worker runs one job at a time; parallelism across games comes from
+    the runner (e.g. the process pool), not from running jobs side by side.
+    Jobs are only visible to the server process that holds the queue.
+    """
+
+    def __init__(self, runner: Callable[[dict], Iterator],
+                 max_finished_jobs: int = DEFAULT_MAX_FINISHED_JOBS):
+        """
+        Args:
+            runner: Callable taking a payload dict and yielding
+                    (subweek_name, game_data, result, error) per game
+            max_finished_jobs: Finished jobs retained before eviction
+        """
+        self.runner = runner
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs: "OrderedDict[str, SimulationJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[SimulationJob]]" = queue.Queue()
+        self._thread = None
+
+    def start(self):
+        """Start the background worker thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._worker, name="simulation-jobs", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stop the worker after the job in progress finishes."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, payload_dict: dict) -> SimulationJob:
+        """
+        Queue a payload for simulation.
+
+        Args:
+            payload_dict: The unified payload structure
+
+        Returns:
+            The queued job
+        """
+        job = SimulationJob(payload_dict)
+        with self._lock:
+            self._jobs[job.job_id] = job
+        self._queue.put(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[SimulationJob]:
+        """Look up a job by id (None if unknown or evicted)."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def remove(self, job_id: str) -> bool:
+        """Forget a job and its results. Returns False if it was unknown."""
+        with self._lock:
+            return self._jobs.pop(job_id, None) is not None
+
+    def _worker(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            self._run(job)
+
+    def _run(self, job: SimulationJob):
+        job.status = RUNNING
+        job.started_at = time.time()
+        try:
+            for subweek_name, game_data, result, error in self.runner(job.payload):
+                job.record_game(subweek_name, game_data, result, error)
+            job.status = COMPLETED
+        except Exception as e:
+            job.failure = str(e)
+            job.status = FAILED
+        finally:
+            job.payload = None
+            job.finished_at = time.time()
+            self._evict_finished()
+
+    def _evict_finished(self):
+        with self._lock:
+            finished = [
+                job_id for job_id, job in self._jobs.items()
+                if job.status in (COMPLETED, FAILED)
+            ]
+            for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+                del self._jobs[job_id]
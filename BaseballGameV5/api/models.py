@@ -7,7 +7,7 @@ for the baseball simulation endpoints.
 Both single game and batch endpoints now use the same unified payload structure.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Literal
 from pydantic import BaseModel, Field
 
 
@@ -106,6 +106,66 @@ class SimulationPayload(BaseModel):
     rules: Dict[str, RulesModel] = Field(default_factory=dict)  # Keyed by level_id string
     injury_types: List[Dict[str, Any]] = Field(default_factory=list)
 
+    # Optional result sections to build per game: any of game_summary,
+    # play_by_play, tuning_data, debug (None = play_by_play only)
+    sections: Optional[List[Literal["game_summary", "play_by_play", "tuning_data", "debug"]]] = Field(
+        default=None,
+        description="Optional result sections to compute and return"
+    )
+
+    # Event logging verbosity per game (None = SIM_LOG_LEVEL, default off)
+    log_level: Optional[Literal["off", "pa", "pitch"]] = Field(
+        default=None,
+        description="Event log level: off, pa (per plate appearance) or pitch"
+    )
+
+    # Add WPA and leverage to play-by-play when expectancy tables have been
+    # generated for the game's level (see expectancy.py)
+    expectancy: bool = Field(
+        default=False,
+        description="Include per-play WPA and leverage from cached expectancy tables"
+    )
+
+    # Outcome-only engine mode for season runs: score, boxscore and injuries
+    # only (sections and log_level are ignored); same results for a seed
+    outcome_only: bool = Field(
+        default=False,
+        description="Skip play-by-play, snapshots, diagnostics and descriptions"
+    )
+
+    # Draw pitches (whole PAs with the bases empty) from each matchup's
+    # cached outcome distribution instead of running the pitch pipeline.
+    # An alternative pitch model, not a speedup (see outcome_only for that)
+    pa_sampling: bool = Field(
+        default=False,
+        description=(
+            "Sample plate appearances from per-matchup outcome distributions "
+            "(alternative pitch model; gives no meaningful speedup)"
+        )
+    )
+
+    # Experimental: resolve balls in play by sampling the level's cached
+    # surrogate defense tables (see surrogate_defense.py) instead of the
+    # decision tree. Games fail when no tables were generated for the level;
+    # tables are only cached once they pass validation (FIDELITY_LIMITS).
+    surrogate_defense: bool = Field(
+        default=False,
+        description=(
+            "Experimental: sample ball-in-play outcomes from cached surrogate defense "
+            "tables (generate with surrogate_defense.py; games fail without them). "
+            "Tables must stay within a few percent of the full engine's run, hit and "
+            "ball-in-play rates to be cached; whole-game time improves only modestly"
+        )
+    )
+
+    # Defensive timing diagnostics (play_by_play Timing_Diagnostics, read by
+    # analyze_timing.py): 0 = off, 1 = every ball in play, N = every Nth
+    timing_diagnostics: int = Field(
+        default=0,
+        ge=0,
+        description="Record timing diagnostics on every Nth ball in play (0 = off)"
+    )
+
     # Games organized by subweek
     subweeks: Dict[str, List[Dict[str, Any]]] = Field(default_factory=dict)
 
@@ -140,12 +200,15 @@ class InjuryReport(BaseModel):
 
 
 class GameResponse(BaseModel):
-    """Single game simulation response."""
+    """Single game simulation response (optional sections only when requested)."""
     game_id: int
     result: GameResult
+    game_summary: Optional[Dict[str, Any]] = None
     boxscore: Dict[str, Any]
-    play_by_play: List[Dict[str, Any]]
+    play_by_play: Optional[List[Dict[str, Any]]] = None
     injuries: List[Dict[str, Any]] = Field(default_factory=list)
+    tuning_data: Optional[Dict[str, Any]] = None
+    debug: Optional[Dict[str, Any]] = None
 
 
 class SimulationResponse(BaseModel):
@@ -159,6 +222,28 @@ class SimulationResponse(BaseModel):
     errors: List[Dict[str, Any]] = Field(default_factory=list)
 
 
+class JobStatusResponse(BaseModel):
+    """Status and progress of a background simulation job."""
+    job_id: str
+    status: str = Field(description="queued, running, completed or failed")
+    games_done: int = Field(default=0, description="Games finished (including errors)")
+    total_games: int = Field(default=0, description="Games in the payload")
+    total_games_simulated: int = Field(default=0, description="Games finished without error")
+    completed_subweeks: List[str] = Field(default_factory=list, description="Subweeks whose results can be fetched")
+    errors: List[Dict[str, Any]] = Field(default_factory=list)
+    failure: Optional[str] = Field(default=None, description="Reason the job failed, if it did")
+    submitted_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+
+class SubweekResultsResponse(BaseModel):
+    """Results for one finished subweek of a job."""
+    job_id: str
+    subweek: str
+    games: List[GameResponse]
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
     status: str = "healthy"
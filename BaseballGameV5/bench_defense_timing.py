@@ -0,0 +1,147 @@
+"""
+Defensive Timing Microbenchmark
+
+Measures the per-ball-in-play cost of the defensive timing calls with and
+without the per-game DefenseTiming memo:
+1. Total field time for the targeted fielder (with its variance draw)
+2. Throw times from that fielder to every base
+3. Catch/transfer times (force and tag) for the fielders covering each base
+4. Route efficiency modifiers for the runners on base
+
+Balls in play are drawn from the fielding team of a payload game, and both
+variants are checked to produce identical times before they are timed.
+
+Usage:
+    python bench_defense_timing.py <payload.json> --level 9 --balls 20000
+"""
+
+import os
+import sys
+import random
+import argparse
+import time
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from defense import TimeCalculator, DefenseTiming
+
+
+CONTACT_TYPES = ("barrel", "solid", "flare", "burner", "under", "topped", "weak")
+DEPTHS = ("deep_of", "middle_of", "shallow_of", "deep_if", "middle_if", "shallow_if")
+DIRECTIONS = ("far left", "left", "center left", "dead center", "center right", "right", "far right")
+FIELD_POSITIONS = (
+    "firstbase", "secondbase", "thirdbase", "shortstop",
+    "leftfield", "centerfield", "rightfield", "catcher"
+)
+# Fielder covering each base (1-3, 4 = home)
+COVERING_POSITIONS = ("firstbase", "shortstop", "thirdbase", "catcher")
+
+DEFAULT_BALLS = 20000
+DEFAULT_ROUNDS = 5
+
+
+def load_fielding_team(json_file, level):
+    """Build the first game at a level and return its fielding (home) team."""
+    import Game
+    from run_local import load_json_file, DEFAULT_RULES, DEFAULT_LEVEL_CONFIG
+
+    payload = load_json_file(json_file)
+    game_payload = next(
+        (game for games in payload.get("subweeks", {}).values() for game in games
+         if str(game.get("league_level_id", "9")) == level),
+        None
+    )
+    if game_payload is None:
+        raise SystemExit(f"No games at level {level} in {json_file}")
+
+    game = Game.Game.from_endpoint(
+        game_payload,
+        payload.get("rules", {}).get(level, DEFAULT_RULES),
+        payload.get("level_configs", {}).get(level, DEFAULT_LEVEL_CONFIG),
+        payload.get("game_constants", {}),
+        []
+    )
+    return game.hometeam
+
+
+def make_balls(team, count, seed=0):
+    """Random balls in play: (contact, depth, direction, position, fielder, runners)."""
+    rng = random.Random(seed)
+    batters = team.battinglist
+    balls = []
+    for _ in range(count):
+        position = rng.choice(FIELD_POSITIONS)
+        runners = rng.sample(batters, rng.randint(0, 3))
+        balls.append((
+            rng.choice(CONTACT_TYPES), rng.choice(DEPTHS), rng.choice(DIRECTIONS),
+            position, getattr(team, position), runners
+        ))
+    return balls
+
+
+def run_balls(timing, balls, covering, seed=0):
+    """Do the timing work of every ball in play; returns the sum of all times."""
+    rng = random.Random(seed)
+    total = 0.0
+    for contact, depth, direction, position, fielder, runners in balls:
+        field_time, _ = timing.total_field_time(
+            contact, depth, direction, position, fielder, include_variance=True, rng=rng
+        )
+        total += field_time
+        for base in (1, 2, 3, 4):
+            total += timing.throw_time(position, base, fielder.throwpower)
+            receiver = covering[base - 1]
+            total += timing.catch_transfer_time(receiver, True)
+            total += timing.catch_transfer_time(receiver, False)
+        for runner in runners:
+            total += timing.route_efficiency_modifier(runner.baserunning)
+    return total
+
+
+def best_time(fn, rounds):
+    """Fastest of several timed runs, in seconds."""
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark memoised defensive timing")
+    parser.add_argument("json_file", help="Payload providing the fielding team")
+    parser.add_argument("--level", default="9", help="League level id (default: 9)")
+    parser.add_argument("--balls", type=int, default=DEFAULT_BALLS,
+                        help=f"Balls in play per run (default: {DEFAULT_BALLS})")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS,
+                        help=f"Timed runs per variant, best kept (default: {DEFAULT_ROUNDS})")
+    args = parser.parse_args()
+
+    team = load_fielding_team(args.json_file, args.level)
+    covering = [getattr(team, position) for position in COVERING_POSITIONS]
+    balls = make_balls(team, args.balls)
+
+    # A game's memo fills during its first innings; time it warm
+    memo = DefenseTiming()
+    uncached = run_balls(TimeCalculator, balls, covering)
+    cached = run_balls(memo, balls, covering)
+    if uncached != cached:
+        raise SystemExit(f"Memoised timing differs: {cached!r} != {uncached!r}")
+
+    base = best_time(lambda: run_balls(TimeCalculator, balls, covering), args.rounds)
+    fast = best_time(lambda: run_balls(memo, balls, covering), args.rounds)
+
+    per_ball = 1e6 / args.balls
+    print(f"Balls in play:      {args.balls}")
+    print(f"Memo entries:       {len(memo.field_times)} field, {len(memo.throws)} throw, "
+          f"{len(memo.transfers)} transfer, {len(memo.routes)} route")
+    print(f"TimeCalculator:     {base * per_ball:.2f} us/ball")
+    print(f"DefenseTiming:      {fast * per_ball:.2f} us/ball")
+    print(f"Saving:             {(base - fast) * per_ball:.2f} us/ball ({base / fast:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Integer codes for the categorical values the engine works with.
+
+Hot paths index precompiled tables with these codes instead of doing
+string-keyed dict lookups. Each enum's NAMES tuple holds the engine's
+string form (as used in play-by-play) at the code's index, and the
+matching *_CODE dict maps the string back to the code.
+"""
+
+from enum import IntEnum
+
+
+class ContactType(IntEnum):
+    """Batted ball contact types."""
+    BARREL = 0
+    SOLID = 1
+    FLARE = 2
+    BURNER = 3
+    UNDER = 4
+    TOPPED = 5
+    WEAK = 6
+
+
+class Depth(IntEnum):
+    """Where a batted ball lands (BaselineAdapter.DIST_OUTCOMES order)."""
+    HOMERUN = 0
+    DEEP_OF = 1
+    MIDDLE_OF = 2
+    SHALLOW_OF = 3
+    DEEP_IF = 4
+    MIDDLE_IF = 5
+    SHALLOW_IF = 6
+    MOUND = 7
+    CATCHER = 8
+
+
+class Direction(IntEnum):
+    """Field direction of a batted ball, left to right."""
+    FAR_LEFT = 0
+    LEFT = 1
+    CENTER_LEFT = 2
+    DEAD_CENTER = 3
+    CENTER_RIGHT = 4
+    RIGHT = 5
+    FAR_RIGHT = 6
+
+
+class Situation(IntEnum):
+    """Catch-rate situation derived from depth + direction."""
+    DEEP_GAP = 0
+    GAP = 1
+    DEEP_LINE = 2
+    LINE = 3
+    DEEP = 4
+    ROUTINE_OF = 5
+    ROUTINE_IF = 6
+
+
+class PitchResult(IntEnum):
+    """First element of an action's outcome (in play = contact type)."""
+    BALL = 0
+    STRIKE = 1
+    HBP = 2
+    IN_PLAY = 3
+
+
+class PitchDetail(IntEnum):
+    """Second element of a non-in-play outcome (in play = direction)."""
+    LOOKING = 0
+    SWINGING = 1
+    FOUL = 2
+    HIT_BY_PITCH = 3
+
+
+class PlayOutcome(IntEnum):
+    """Result of an action's play (the defensive outcome)."""
+    OUT = 0
+    SINGLE = 1
+    DOUBLE = 2
+    TRIPLE = 3
+    HOMERUN = 4
+    STRIKEOUT = 5
+    WALK = 6
+    HBP = 7
+    STOLEN_BASE = 8
+    CAUGHT_STEALING = 9
+    ERROR_ON_STEAL = 10
+    PICKOFF = 11
+    FAILED_PICKOFF = 12
+    SUCCESSFUL_PICKOFF = 13
+    UNSUCCESSFUL_PICKOFF = 14
+    ERROR_ON_PICKOFF = 15
+
+
+CONTACT_NAMES = ("barrel", "solid", "flare", "burner", "under", "topped", "weak")
+DEPTH_NAMES = (
+    "homerun", "deep_of", "middle_of", "shallow_of",
+    "deep_if", "middle_if", "shallow_if", "mound", "catcher"
+)
+DIRECTION_NAMES = (
+    "far left", "left", "center left", "dead center",
+    "center right", "right", "far right"
+)
+SITUATION_NAMES = ("deep_gap", "gap", "deep_line", "line", "deep", "routine_of", "routine_if")
+
+PITCH_RESULT_NAMES = ("Ball", "Strike", "HBP", None)
+PITCH_DETAIL_NAMES = ("Looking", "Swinging", "Foul", "Hit By Pitch")
+PLAY_OUTCOME_NAMES = (
+    "out", "single", "double", "triple", "homerun", "strikeout", "walk", "hbp",
+    "stolen base", "caught stealing", "error on steal", "pickoff", "failed pickoff",
+    "successful pickoff", "unsuccessful pickoff", "error on pickoff"
+)
+
+CONTACT_CODE = {name: ContactType(code) for code, name in enumerate(CONTACT_NAMES)}
+DEPTH_CODE = {name: Depth(code) for code, name in enumerate(DEPTH_NAMES)}
+DIRECTION_CODE = {name: Direction(code) for code, name in enumerate(DIRECTION_NAMES)}
+SITUATION_CODE = {name: Situation(code) for code, name in enumerate(SITUATION_NAMES)}
+PITCH_RESULT_CODE = {name: PitchResult(code) for code, name in enumerate(PITCH_RESULT_NAMES) if name}
+PITCH_DETAIL_CODE = {name: PitchDetail(code) for code, name in enumerate(PITCH_DETAIL_NAMES)}
+PLAY_OUTCOME_CODE = {name: PlayOutcome(code) for code, name in enumerate(PLAY_OUTCOME_NAMES)}
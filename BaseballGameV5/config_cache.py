@@ -0,0 +1,113 @@
+"""
+Config Cache - Shares compiled Baselines and Rules between games.
+
+Adapting a level config and the game constants into a Baselines object
+(and the rules into a Rules object) is identical for every game at the
+same level, but a batch usually only spans a handful of levels. This cache
+keys the built objects by a content fingerprint of their inputs, keeps the
+most recently used ones (bounded LRU), and freezes them so any number of
+games, threads or workers can share one instance safely.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import Baselines
+import Rules
+from adapter import BaselineAdapter, RulesAdapter
+
+
+# Default number of distinct configs kept per cache
+DEFAULT_MAXSIZE = 32
+
+
+def fingerprint(*parts) -> str:
+    """
+    Content fingerprint of JSON-like config data.
+
+    Args:
+        *parts: Config dicts/lists to fingerprint together
+
+    Returns:
+        Hex digest that is equal for equal content regardless of key order
+    """
+    encoded = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class ConfigCache:
+    """Bounded LRU cache of frozen Baselines and Rules keyed by content."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """
+        Args:
+            maxsize: Maximum number of entries kept for each object type
+        """
+        self.maxsize = maxsize
+        self._baselines = OrderedDict()
+        self._rules = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_baselines(self, level_config: dict, game_constants: dict):
+        """
+        Get the frozen Baselines for a level config and game constants.
+
+        Args:
+            level_config: Level-specific config (batting, contact_odds, etc.)
+            game_constants: Shared game constants (defensive_alignment, etc.)
+
+        Returns:
+            Frozen Baselines instance (shared; must not be modified)
+        """
+        key = fingerprint(level_config, game_constants)
+        return self._get(self._baselines, key, lambda: Baselines.Baselines.from_dict(
+            BaselineAdapter.adapt(level_config, game_constants)
+        ))
+
+    def get_rules(self, rules: dict):
+        """
+        Get the frozen Rules for an endpoint rules dict.
+
+        Args:
+            rules: Rules dict for a level (innings, outs_per_inning, etc.)
+
+        Returns:
+            Frozen Rules instance (shared; must not be modified)
+        """
+        key = fingerprint(rules)
+        return self._get(self._rules, key, lambda: Rules.Rules.from_dict(
+            RulesAdapter.adapt(rules)
+        ))
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._baselines.clear()
+            self._rules.clear()
+
+    def _get(self, entries: OrderedDict, key: str, build):
+        with self._lock:
+            cached = entries.get(key)
+            if cached is not None:
+                entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        # Build outside the lock; a concurrent duplicate build is harmless
+        built = build().freeze()
+
+        with self._lock:
+            cached = entries.setdefault(key, built)
+            entries.move_to_end(key)
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+        return cached
+
+
+# Process-wide cache used by Game.from_endpoint
+CONFIG_CACHE = ConfigCache()
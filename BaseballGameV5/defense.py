@@ -6,12 +6,14 @@ from operator import attrgetter
 from dataclasses import dataclass, field
 from typing import Optional, List, Set, Tuple
 
+from codes import CONTACT_CODE, DIRECTION_CODE, DEPTH_NAMES, SITUATION_NAMES
+
 
 # ============================================================================
 # DATA STRUCTURES FOR DECISION TREE DEFENSE
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RunnerState:
     """Tracks a runner's state during a play."""
     player_id: int
@@ -26,8 +28,23 @@ class RunnerState:
     is_out: bool = False
     earned_run: bool = True  # True until error occurs
 
-
-@dataclass
+    def place(self, player, base: int, is_forced: bool):
+        """Reset a pooled runner to start a play on a base (0 = batter)."""
+        self.player_id = player.id
+        self.player = player
+        self.current_base = base
+        self.target_base = base + 1
+        self.progress = 0.0
+        self.is_forced = is_forced
+        self.speed_rating = getattr(player, 'speed', 50)
+        self.basereaction = getattr(player, 'basereaction', 50)
+        self.baserunning = getattr(player, 'baserunning', 50)
+        self.is_out = False
+        self.earned_run = True
+        return self
+
+
+@dataclass(slots=True)
 class FielderState:
     """Tracks a fielder's state during a play."""
     position: str
@@ -36,7 +53,7 @@ class FielderState:
     location: str = ""  # zone identifier
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayState:
     """Tracks the overall state of a defensive play."""
     ball_location: str = ""
@@ -47,6 +64,53 @@ class PlayState:
     play_active: bool = True
     contact_type: str = ""
     batted_ball_outcome: str = ""  # Will be determined by play resolution
+    timing: object = None  # DefenseTiming of the game (None = uncached TimeCalculator)
+
+
+class PlayResult:
+    """
+    Defensive result of an action, read by HitEval and PlayEvent.
+
+    Ball-in-play results belong to the game's fielding resolver and are
+    overwritten by its next play; walks, strikeouts, steals and pickoffs
+    build their own.
+    """
+
+    __slots__ = ("outcome", "first", "second", "third", "scored", "errors", "actions",
+                 "contact_type", "direction", "defender", "timing")
+
+    def __init__(self, outcome: str = None, first=None, second=None, third=None, scored=(),
+                 errors=(), actions=(), contact_type: str = None, direction: str = None,
+                 defender=None, timing: dict = None):
+        """
+        Args:
+            outcome: Play outcome ('single', 'out', 'walk', 'stolen base', ...)
+            first, second, third: Runner on each base after the play
+            scored: Runners who scored on the play
+            errors: Error entries (players or descriptions)
+            actions: Play descriptions
+            contact_type, direction, defender: Batted ball and the fielder
+                                               who made the last play on it
+            timing: Timing diagnostics of a hit
+        """
+        self.outcome = outcome
+        self.first = first
+        self.second = second
+        self.third = third
+        self.scored = scored
+        self.errors = errors
+        self.actions = actions
+        self.contact_type = contact_type
+        self.direction = direction
+        self.defender = defender
+        self.timing = timing
+
+    @classmethod
+    def from_game(cls, outcome: str, game, errors=(), actions=()):
+        """Result that leaves the game's runners where they are now."""
+        state = game.state
+        return cls(outcome, state.first, state.second, state.third, game.current_runners_home,
+                   errors, actions)
 
 
 # ============================================================================
@@ -173,13 +237,15 @@ class TimeCalculator:
     }
 
     @staticmethod
-    def runner_time(runner: RunnerState, include_variance: bool = True) -> Tuple[float, float]:
+    def runner_time(runner: RunnerState, include_variance: bool = True,
+                    rng=None) -> Tuple[float, float]:
         """
         Calculate time for runner to reach their target base.
 
         Args:
             runner: RunnerState with current_base, target_base, speed_rating, progress
             include_variance: Whether to include per-play variance (default True)
+            rng: Random stream for the variance draw (defaults to module random)
 
         Returns:
             Tuple of (time in seconds, variance applied)
@@ -197,7 +263,7 @@ class TimeCalculator:
         base_result = base_time * speed_mod * remaining
 
         # Add variance if requested
-        variance = TimeCalculator.runner_variance() if include_variance else 0.0
+        variance = TimeCalculator.runner_variance(rng) if include_variance else 0.0
         result = base_result + variance
 
         return max(result, 0.1), variance  # Floor at 0.1s
@@ -286,29 +352,35 @@ class TimeCalculator:
         return 1.0 - ((fieldspot - 50) * 0.0025)
 
     @staticmethod
-    def defense_variance() -> float:
+    def defense_variance(rng=None) -> float:
         """
         Generate per-play variance for defense timing.
         Normal distribution with std dev ~0.1s (so ±0.2s is ~2 std devs).
 
+        Args:
+            rng: Random stream to draw from (defaults to module random)
+
         Returns:
             Variance in seconds (typically -0.2 to +0.2)
         """
         tc = TimeCalculator.TIMING_CONSTANTS
-        variance = random.gauss(0, tc["defense_variance_std"])
+        variance = (rng or random).gauss(0, tc["defense_variance_std"])
         return max(-0.3, min(0.3, variance))  # Clamp to ±0.3s
 
     @staticmethod
-    def runner_variance() -> float:
+    def runner_variance(rng=None) -> float:
         """
         Generate per-play variance for runner timing.
         Normal distribution with std dev ~0.1s.
 
+        Args:
+            rng: Random stream to draw from (defaults to module random)
+
         Returns:
             Variance in seconds (typically -0.2 to +0.2)
         """
         tc = TimeCalculator.TIMING_CONSTANTS
-        variance = random.gauss(0, tc["runner_variance_std"])
+        variance = (rng or random).gauss(0, tc["runner_variance_std"])
         return max(-0.3, min(0.3, variance))  # Clamp to ±0.3s
 
     @staticmethod
@@ -507,7 +579,7 @@ class TimeCalculator:
     @staticmethod
     def total_field_time(contact_type: str, depth: str, direction: str,
                          fielder_pos: str, fielder_player,
-                         include_variance: bool = True) -> Tuple[float, dict]:
+                         include_variance: bool = True, rng=None) -> Tuple[float, dict]:
         """
         Total time from bat contact until fielder can throw.
 
@@ -525,6 +597,7 @@ class TimeCalculator:
             fielder_pos: Position of primary fielder
             fielder_player: Player object for the fielder
             include_variance: Whether to include per-play variance (default True)
+            rng: Random stream for the variance draw (defaults to module random)
 
         Returns:
             Tuple of (total_time in seconds, components_dict for diagnostics)
@@ -554,7 +627,7 @@ class TimeCalculator:
         retrieval_time = TimeCalculator.ball_retrieval_time(contact_type, is_outfield)
 
         # 6. Per-play variance (NEW)
-        defense_var = TimeCalculator.defense_variance() if include_variance else 0.0
+        defense_var = TimeCalculator.defense_variance(rng) if include_variance else 0.0
 
         total = ball_time + react_time + reach_time_modified + retrieval_time + defense_var
 
@@ -575,6 +648,130 @@ class TimeCalculator:
         return max(total, 0.5), components  # Floor at 0.5s
 
 
+# ============================================================================
+# DEFENSE TIMING - Per-game memo of the deterministic timing components
+# ============================================================================
+
+class DefenseTiming:
+    """
+    Per-game memo of the deterministic parts of defensive timing.
+
+    Throw, catch/transfer, reach and route times depend only on positions,
+    the batted-ball zone and player ratings, which change only on
+    substitution or a ratings recompute. Entries are keyed by those inputs
+    (positions and rating values), so a changed rating simply misses the
+    memo. The per-play variance draws (defense_variance, runner_variance)
+    are still made on every play.
+
+    Method names and signatures match TimeCalculator, and every entry is
+    computed by the TimeCalculator formula, so results are identical.
+    """
+
+    __slots__ = ("throws", "transfers", "field_times", "routes")
+
+    # Throw targets (1-3 bases, 4 home); memo tuples are indexed base - 1
+    BASES = range(1, 5)
+
+    def __init__(self):
+        # (position, throwpower) -> throw time to bases 1-4
+        self.throws = {}
+        # fieldcatch -> (tag time, force time)
+        self.transfers = {}
+        # (contact, depth, direction, position, speed, react, spot) -> (time, components)
+        self.field_times = {}
+        # baserunning -> route efficiency modifier
+        self.routes = {}
+
+    def throw_time(self, fielder_pos: str, target_base: int, throw_power: float) -> float:
+        """Memoised TimeCalculator.throw_time."""
+        times = self.throws.get((fielder_pos, throw_power))
+        if times is None:
+            times = self.throws[(fielder_pos, throw_power)] = tuple(
+                TimeCalculator.throw_time(fielder_pos, base, throw_power) for base in DefenseTiming.BASES
+            )
+        return times[target_base - 1]
+
+    def catch_transfer_time(self, fielder_player, is_force: bool) -> float:
+        """Memoised TimeCalculator.catch_transfer_time."""
+        catch_rating = getattr(fielder_player, 'fieldcatch', 50)
+        times = self.transfers.get(catch_rating)
+        if times is None:
+            times = self.transfers[catch_rating] = (
+                TimeCalculator.catch_transfer_time(fielder_player, False),
+                TimeCalculator.catch_transfer_time(fielder_player, True),
+            )
+        return times[bool(is_force)]
+
+    def route_efficiency_modifier(self, baserunning: float) -> float:
+        """Memoised TimeCalculator.route_efficiency_modifier."""
+        route_mod = self.routes.get(baserunning)
+        if route_mod is None:
+            route_mod = self.routes[baserunning] = TimeCalculator.route_efficiency_modifier(baserunning)
+        return route_mod
+
+    def total_field_time(self, contact_type: str, depth: str, direction: str,
+                         fielder_pos: str, fielder_player,
+                         include_variance: bool = True, rng=None) -> Tuple[float, dict]:
+        """
+        TimeCalculator.total_field_time with the deterministic sum memoised.
+
+        Only the defense variance is drawn per play.
+        """
+        fixed_time, fixed_components = self._fixed(contact_type, depth, direction, fielder_pos, fielder_player)
+        defense_var = TimeCalculator.defense_variance(rng) if include_variance else 0.0
+        components = dict(fixed_components)
+        components['defense_variance'] = round(defense_var, 3)
+        return max(fixed_time + defense_var, 0.5), components
+
+    def field_time(self, contact_type: str, depth: str, direction: str,
+                   fielder_pos: str, fielder_player, rng=None) -> float:
+        """total_field_time (with variance) without the diagnostics components."""
+        fixed_time, _ = self._fixed(contact_type, depth, direction, fielder_pos, fielder_player)
+        return max(fixed_time + TimeCalculator.defense_variance(rng), 0.5)
+
+    def _fixed(self, contact_type, depth, direction, fielder_pos, fielder_player):
+        """Memo entry (variance-free time, components) for a ball zone and fielder."""
+        if fielder_player:
+            key = (contact_type, depth, direction, fielder_pos,
+                   getattr(fielder_player, 'speed', 50),
+                   getattr(fielder_player, 'fieldreact', 50),
+                   getattr(fielder_player, 'fieldspot', 50))
+        else:
+            key = (contact_type, depth, direction, fielder_pos, 50, 50, 50)
+        entry = self.field_times.get(key)
+        if entry is None:
+            entry = self.field_times[key] = DefenseTiming._field_time(*key)
+        return entry
+
+    @staticmethod
+    def _field_time(contact_type, depth, direction, fielder_pos, fielder_speed, fielder_react, fielder_spot):
+        """Variance-free total field time and its diagnostics components."""
+        ball_time = TimeCalculator.ball_travel_time(contact_type, depth)
+        react_time = TimeCalculator.reaction_time(fielder_react)
+        reach_time = TimeCalculator.fielder_reach_time(
+            depth, direction, fielder_pos, contact_type, fielder_speed
+        )
+        fieldspot_mod = TimeCalculator.fieldspot_modifier(fielder_spot)
+        reach_time_modified = reach_time * fieldspot_mod
+        is_outfield = depth in TimeCalculator.OUTFIELD_DEPTHS
+        retrieval_time = TimeCalculator.ball_retrieval_time(contact_type, is_outfield)
+
+        fixed_time = ball_time + react_time + reach_time_modified + retrieval_time
+        components = {
+            'ball_travel': round(ball_time, 3),
+            'reaction_time': round(react_time, 3),
+            'reach_time_base': round(reach_time, 3),
+            'fieldspot_modifier': round(fieldspot_mod, 3),
+            'reach_time_modified': round(reach_time_modified, 3),
+            'retrieval_time': round(retrieval_time, 3),
+            'defense_variance': 0.0,
+            'fielder_fieldreact': fielder_react,
+            'fielder_fieldspot': fielder_spot,
+            'fielder_speed': fielder_speed,
+        }
+        return fixed_time, components
+
+
 # ============================================================================
 # DEFENSE DECISION TREE - Makes strategic decisions for defense
 # ============================================================================
@@ -649,6 +846,7 @@ class DefenseDecisionTree:
         best_target = None
         best_margin = -999
         best_runner = None
+        timing = play_state.timing or TimeCalculator
 
         # Sort by target base descending (lead runner first)
         for runner in sorted(active_runners, key=lambda r: r.target_base, reverse=True):
@@ -659,13 +857,13 @@ class DefenseDecisionTree:
                 continue
 
             # Calculate timing
-            throw_time = TimeCalculator.throw_time(
+            throw_time = timing.throw_time(
                 fielder.position, target_base, fielder.player.throwpower
             )
 
             # Add catch/transfer time
             is_force = target_base in play_state.force_bases
-            catch_time = TimeCalculator.catch_transfer_time(fielder.player, is_force)
+            catch_time = timing.catch_transfer_time(fielder.player, is_force)
 
             total_defense_time = throw_time + catch_time
             runner_time, _ = TimeCalculator.runner_time(runner, include_variance=False)
@@ -706,14 +904,15 @@ class DefenseDecisionTree:
             return True
 
         # Calculate if safe to advance
-        throw_time = TimeCalculator.throw_time(
+        timing = play_state.timing or TimeCalculator
+        throw_time = timing.throw_time(
             play_state.ball_holder.position,
             runner.target_base,
             play_state.ball_holder.player.throwpower
         )
 
         is_force = runner.target_base in play_state.force_bases
-        catch_time = TimeCalculator.catch_transfer_time(
+        catch_time = timing.catch_transfer_time(
             play_state.ball_holder.player, is_force
         )
 
@@ -756,9 +955,6 @@ class DefenseDecisionTree:
 
 
 class fielding():
-    # Enable timing diagnostics for tuning analysis
-    ENABLE_TIMING_DIAGNOSTICS = True
-
     # Default distance weights for each contact type (fallback when not in config)
     # Order: homerun, deep_of, middle_of, shallow_of, deep_if, middle_if, shallow_if, mound, catcher
     DEFAULT_DISTWEIGHTS = {
@@ -771,142 +967,163 @@ class fielding():
         "weak": [0.0, 0.0, 0.02, 0.08, 0.10, 0.30, 0.35, 0.12, 0.03],
     }
 
+    # Ultimate fallback - generic weights favoring middle outcomes
+    FALLBACK_DISTWEIGHTS = [0.05, 0.15, 0.25, 0.25, 0.12, 0.10, 0.05, 0.02, 0.01]
+
+    # Default out rates per situation (fallback when not in catch_rates config)
+    DEFAULT_CATCH_RATES = {
+        "deep_gap": 0.30,
+        "gap": 0.50,
+        "deep_line": 0.45,
+        "line": 0.55,
+        "deep": 0.60,
+        "routine_of": 0.92,
+        "routine_if": 0.97,
+    }
+    DEFAULT_CATCH_RATE = 0.70
+
     # Situation categories derived from depth + direction
     GAP_DIRECTIONS = ["center left", "center right"]
     LINE_DIRECTIONS = ["far left", "far right"]
     OUTFIELD_DEPTHS = ["deep_of", "middle_of", "shallow_of"]
     INFIELD_DEPTHS = ["deep_if", "middle_if", "shallow_if", "mound", "catcher"]
 
-    def __init__(self, gamestate):
-        self.gamestate = gamestate
-        self.test = self.gamestate.game.baselines.threestepaway
-        self.distweights = self.gamestate.game.baselines.distweights
-        self.distoutcomes = self.gamestate.game.baselines.distoutcomes
-        self.defensivealignment = self.gamestate.game.baselines.defensivealignment
-        # Load catch_rates (new system)
-        self.catch_rates = getattr(
-            self.gamestate.game.baselines, 'catch_rates', {}
-        )
+    # Location of a fielder who takes a throw at each base
+    BASE_LOCATIONS = {base: f"base_{base}" for base in range(1, 5)}
+
+    def __init__(self, game):
+        """
+        One resolver per game, reused for every ball in play: the runner,
+        fielder and play states, the error and description lists and the
+        PlayResult are pooled and reset per play instead of allocated.
+
+        Args:
+            game: Game whose balls in play this resolves
+        """
+        self.runner_pool = tuple(RunnerState(0, None, base, base + 1) for base in range(4))
+        self.fielder_pool = {}  # position -> FielderState
+        self.play_state = PlayState()
         self.errorlist = []
         self.defensiveactions = []
+        self.scored = []
+        self.result = PlayResult(scored=self.scored, errors=self.errorlist, actions=self.defensiveactions)
+        # Balls in play so far, for sampled timing diagnostics
+        self.balls_in_play = 0
+
+    def resolve(self, gamestate) -> PlayResult:
+        """
+        Play out the ball in play of an action.
+
+        Args:
+            gamestate: Action whose outcome is (contact type, direction, ...)
+
+        Returns:
+            This resolver's PlayResult (valid until its next play)
+        """
+        game = gamestate.game
+        self.gamestate = gamestate
+        self.rng = game.rng.defense
+        self.errorlist.clear()
+        self.defensiveactions.clear()
+        self.scored.clear()
         self.catch_probability = None  # Set in _is_out_play if applicable
-        self.timing_diagnostics = None  # Set if ENABLE_TIMING_DIAGNOSTICS is True
+        self.timing_diagnostics = None  # Set on diagnosed hits
+        # Play descriptions and diagnostics are skipped in outcome-only games
+        self.describe = not game.outcome_only
+        # Timing diagnostics on every Nth ball in play (game.timing_diagnostics, 0 = off)
+        every = game.timing_diagnostics
+        if every:
+            self.balls_in_play += 1
+            self.diagnose = self.describe and self.balls_in_play % every == 0
+        else:
+            self.diagnose = False
+        # Memoised throw/transfer/reach times for this game
+        self.timing = game.defense_timing
 
-        self.contacttype = self.gamestate.outcome[0]
-        self.direction = self.gamestate.outcome[1]
+        # Integer-coded tables built once per config (see Baselines.compile)
+        self.compiled = game.baselines.compiled
 
-        # Determine what type of batted ball and where it goes (preserved logic)
-        # Use fallback weights if contact type missing or weights sum to zero
-        self.specificweights = self._get_distweights(self.contacttype)
-        self.depth = fielding.PickDepth(self)
+        self.contacttype = gamestate.outcome[0]
+        self.direction = gamestate.outcome[1]
+        self.contact_code = CONTACT_CODE[self.contacttype]
+        self.direction_code = DIRECTION_CODE[self.direction]
+
+        # Determine what type of batted ball and where it goes
+        self.depth_code = self.compiled.pick_depth(self.contact_code, self.rng)
+        self.depth = DEPTH_NAMES[self.depth_code]
         self.fieldingdefender = fielding.PickDefender(self)
         self.airball_bool = fielding.AirballBool(self.contacttype)
 
         # Derive situation category from depth + direction
-        self.situation = self._derive_situation()
-
-        # Initialize play state with new decision tree system
-        self.play_state = self._initialize_play_state()
-
-        # Process the play using decision tree
-        self.batted_ball_outcome = self._process_play()
-
-        # Convert play state back to base_situation format for compatibility
-        self.base_situation = self._build_base_situation()
-
-        # Build the defenseoutcome tuple (extended with timing diagnostics)
-        self.defenseoutcome = (
-            self.contacttype,
-            self.direction,
-            self.fieldingdefender,
-            self.batted_ball_outcome,
-            self.base_situation,
-            self.errorlist,
-            self.defensiveactions,
-            self.timing_diagnostics  # New: timing data for tuning analysis
-        )
+        self.situation_code = self.compiled.situations[self.depth_code][self.direction_code]
+        self.situation = SITUATION_NAMES[self.situation_code]
+
+        # Surrogate defense tables (see surrogate_defense.py) sample the play
+        # when attached and the situation is tabulated
+        result = self.result
+        surrogate = game.surrogate_defense
+        if surrogate is None or not surrogate.apply(self):
+            # Initialize play state with new decision tree system
+            self._initialize_play_state()
+
+            # Process the play using decision tree
+            result.outcome = self._process_play()
+
+            # Runners' final bases from the play state
+            self._set_result_bases()
+            if surrogate is not None:
+                surrogate.observe(self)
+
+        result.contact_type = self.contacttype
+        result.direction = self.direction
+        result.defender = self.fieldingdefender
+        result.timing = self.timing_diagnostics  # Timing data for tuning analysis
+        return result
 
     def _initialize_play_state(self) -> PlayState:
-        """Initialize PlayState from game state."""
+        """Reset the pooled PlayState and runners from the game state."""
         game = self.gamestate.game
         batter = game.battingteam.currentbatter
+        pool = self.runner_pool
 
-        runners = []
+        play_state = self.play_state
+        runners = play_state.runners
+        runners.clear()
 
-        # Add batter as runner from home
+        # Add batter as runner from home (always forced to run)
         if batter:
-            runners.append(RunnerState(
-                player_id=batter.id,
-                player=batter,
-                current_base=0,
-                target_base=1,
-                progress=0.0,
-                is_forced=True,  # Batter always forced to run
-                speed_rating=getattr(batter, 'speed', 50),
-                basereaction=getattr(batter, 'basereaction', 50),
-                baserunning=getattr(batter, 'baserunning', 50),
-                earned_run=True
-            ))
-
-        # Add runners on bases
-        if game.on_firstbase:
-            runners.append(RunnerState(
-                player_id=game.on_firstbase.id,
-                player=game.on_firstbase,
-                current_base=1,
-                target_base=2,
-                progress=0.0,
-                is_forced=True,  # Forced by batter
-                speed_rating=getattr(game.on_firstbase, 'speed', 50),
-                basereaction=getattr(game.on_firstbase, 'basereaction', 50),
-                baserunning=getattr(game.on_firstbase, 'baserunning', 50),
-                earned_run=True
-            ))
-
-        if game.on_secondbase:
-            # Forced only if first base occupied
-            is_forced = game.on_firstbase is not None
-            runners.append(RunnerState(
-                player_id=game.on_secondbase.id,
-                player=game.on_secondbase,
-                current_base=2,
-                target_base=3,
-                progress=0.0,
-                is_forced=is_forced,
-                speed_rating=getattr(game.on_secondbase, 'speed', 50),
-                basereaction=getattr(game.on_secondbase, 'basereaction', 50),
-                baserunning=getattr(game.on_secondbase, 'baserunning', 50),
-                earned_run=True
-            ))
-
-        if game.on_thirdbase:
-            # Forced only if first and second occupied
-            is_forced = game.on_firstbase is not None and game.on_secondbase is not None
-            runners.append(RunnerState(
-                player_id=game.on_thirdbase.id,
-                player=game.on_thirdbase,
-                current_base=3,
-                target_base=4,
-                progress=0.0,
-                is_forced=is_forced,
-                speed_rating=getattr(game.on_thirdbase, 'speed', 50),
-                basereaction=getattr(game.on_thirdbase, 'basereaction', 50),
-                baserunning=getattr(game.on_thirdbase, 'baserunning', 50),
-                earned_run=True
-            ))
-
+            runners.append(pool[0].place(batter, 0, True))
+
+        # Add runners on bases; each is forced when every base behind is occupied
+        state = game.state
+        first, second, third = state.first, state.second, state.third
+        if first is not None:
+            runners.append(pool[1].place(first, 1, True))
+        if second is not None:
+            runners.append(pool[2].place(second, 2, first is not None))
+        if third is not None:
+            runners.append(pool[3].place(third, 3, first is not None and second is not None))
+
+        play_state.ball_location = self.depth
+        play_state.ball_holder = None
+        play_state.outs_this_play = 0
         # Calculate initial force bases
-        force_bases = DefenseDecisionTree.calculate_force_bases(runners)
-
-        return PlayState(
-            ball_location=self.depth,
-            ball_holder=None,
-            runners=runners,
-            outs_this_play=0,
-            force_bases=force_bases,
-            play_active=True,
-            contact_type=self.contacttype
-        )
+        play_state.force_bases = DefenseDecisionTree.calculate_force_bases(runners)
+        play_state.play_active = True
+        play_state.contact_type = self.contacttype
+        play_state.batted_ball_outcome = ""
+        play_state.timing = self.timing
+        return play_state
+
+    def _fielder_state(self, position: str, player, has_ball: bool, location: str) -> FielderState:
+        """Pooled FielderState of a position, reset for a new holder."""
+        fielder_state = self.fielder_pool.get(position)
+        if fielder_state is None:
+            fielder_state = self.fielder_pool[position] = FielderState(position, player)
+        fielder_state.player = player
+        fielder_state.has_ball = has_ball
+        fielder_state.location = location
+        return fielder_state
 
     def _is_out_play(self) -> bool:
         """
@@ -926,29 +1143,15 @@ class fielding():
         if self.depth == 'homerun':
             return False
 
-        # Look up out rate from config
-        # Format: catch_rates[contacttype][situation] = probability
-        contact_rates = self.catch_rates.get(self.contacttype, {})
-        out_probability = contact_rates.get(self.situation)
-
-        # If no config found, use sensible defaults based on situation
-        if out_probability is None:
-            DEFAULT_CATCH_RATES = {
-                "deep_gap": 0.30,
-                "gap": 0.50,
-                "deep_line": 0.45,
-                "line": 0.55,
-                "deep": 0.60,
-                "routine_of": 0.92,
-                "routine_if": 0.97,
-            }
-            out_probability = DEFAULT_CATCH_RATES.get(self.situation, 0.70)
+        # Look up out rate from the compiled catch_rates config
+        # (defaults per situation already folded in)
+        out_probability = self.compiled.catch_rates[self.contact_code][self.situation_code]
 
         # Store probability for debugging output
         self.catch_probability = out_probability
 
         # Roll against out probability
-        return random.random() < out_probability
+        return self.rng.random() < out_probability
 
     def _process_play(self) -> str:
         """
@@ -970,25 +1173,30 @@ class fielding():
 
         # Create fielder state for primary fielder
         if self.fieldingdefender:
-            fielder_state = FielderState(
-                position=self.fieldingdefender.lineup,
-                player=self.fieldingdefender,
-                has_ball=False,
-                location=self.depth
+            fielder_state = self._fielder_state(
+                self.fieldingdefender.lineup, self.fieldingdefender, False, self.depth
             )
         else:
             # No fielder (shouldn't happen except for HR)
             return 'single'
 
-        # Calculate field time for runner advancement (now returns tuple with components)
-        total_time, field_components = TimeCalculator.total_field_time(
-            self.contacttype,
-            self.depth,
-            self.direction,
-            fielder_state.position,
-            fielder_state.player,
-            include_variance=True
-        )
+        # Calculate field time for runner advancement (with its components
+        # when the play is diagnosed)
+        if self.diagnose:
+            total_time, field_components = self.timing.total_field_time(
+                self.contacttype,
+                self.depth,
+                self.direction,
+                fielder_state.position,
+                fielder_state.player,
+                include_variance=True,
+                rng=self.rng
+            )
+        else:
+            total_time = self.timing.field_time(
+                self.contacttype, self.depth, self.direction,
+                fielder_state.position, fielder_state.player, rng=self.rng
+            )
 
         # Determine if defense makes the play (applies to ALL contact types)
         is_out_attempt = self._is_out_play()
@@ -1002,7 +1210,8 @@ class fielding():
 
                 # Check for catching error only
                 error_on_play, d_action = Error_Catch(self, None, self.fieldingdefender)
-                self.defensiveactions.append(d_action)
+                if self.describe:
+                    self.defensiveactions.append(d_action)
             else:
                 # GROUND BALL - runners advance while ball is fielded
                 self._advance_non_batter_runners(total_time)
@@ -1012,7 +1221,8 @@ class fielding():
                 error_throw, error_catch, d_action = Error_Throw_Catch(
                     self, self.fieldingdefender, first_baseman
                 )
-                self.defensiveactions.append(d_action)
+                if self.describe:
+                    self.defensiveactions.append(d_action)
                 error_on_play = error_throw or error_catch
 
             if error_on_play:
@@ -1036,7 +1246,8 @@ class fielding():
                     self.gamestate.game.outcount += 1
 
                     if self.airball_bool:
-                        self.defensiveactions.append("out at bat (fly)")
+                        if self.describe:
+                            self.defensiveactions.append("out at bat (fly)")
                         # Award putout to fielder who caught
                         if hasattr(self.fieldingdefender, 'fieldingstats'):
                             self.fieldingdefender.fieldingstats.Adder("putouts", 1)
@@ -1046,7 +1257,8 @@ class fielding():
                         ball_time = TimeCalculator.ball_travel_time(self.contacttype, self.depth)
                         self._handle_tag_up(ball_time)
                     else:
-                        self.defensiveactions.append("out at 1st (ground ball)")
+                        if self.describe:
+                            self.defensiveactions.append("out at 1st (ground ball)")
                         # Award putout to first baseman, assist to fielder
                         first_baseman = self.gamestate.game.pitchingteam.firstbase
                         if hasattr(first_baseman, 'fieldingstats'):
@@ -1086,7 +1298,7 @@ class fielding():
             is_outfield_hit = self.depth in TimeCalculator.OUTFIELD_DEPTHS
             if is_outfield_hit:
                 # Calculate throw time from outfielder to home (longest throw)
-                throw_time_home = TimeCalculator.throw_time(
+                throw_time_home = self.timing.throw_time(
                     fielder_state.position, 4, fielder_state.player.throwpower
                 )
                 # Non-batter runners advance during the full throw time
@@ -1098,21 +1310,25 @@ class fielding():
             self.play_state.ball_holder = fielder_state
 
             # Capture timing diagnostics BEFORE defense loop
-            if fielding.ENABLE_TIMING_DIAGNOSTICS and batter_runner:
+            if batter_runner and not self.diagnose:
+                # Same variance draw as the diagnostics, so the defense stream
+                # (and every later play) does not depend on diagnostics
+                TimeCalculator.runner_variance(self.rng)
+            elif batter_runner:
                 # Calculate what the throw-out timing would be
-                throw_time = TimeCalculator.throw_time(
+                throw_time = self.timing.throw_time(
                     fielder_state.position, 1, fielder_state.player.throwpower
                 )
-                catch_time = TimeCalculator.catch_transfer_time(
+                catch_time = self.timing.catch_transfer_time(
                     self.gamestate.game.pitchingteam.firstbase, True
                 )
                 defense_time = throw_time + catch_time
-                runner_time_remaining, runner_var = TimeCalculator.runner_time(batter_runner, include_variance=True)
+                runner_time_remaining, runner_var = TimeCalculator.runner_time(batter_runner, include_variance=True, rng=self.rng)
 
                 # Calculate extra time given to non-batter runners on outfield hits
                 extra_runner_time = 0
                 if is_outfield_hit:
-                    throw_time_home = TimeCalculator.throw_time(
+                    throw_time_home = self.timing.throw_time(
                         fielder_state.position, 4, fielder_state.player.throwpower
                     )
                     extra_runner_time = throw_time_home
@@ -1184,9 +1400,10 @@ class fielding():
 
             if target_result is None:
                 # No play available - hold ball
-                self.defensiveactions.append(
-                    f"{self.play_state.ball_holder.position} holds"
-                )
+                if self.describe:
+                    self.defensiveactions.append(
+                        f"{self.play_state.ball_holder.position} holds"
+                    )
                 self.play_state.play_active = False
                 break
 
@@ -1206,7 +1423,8 @@ class fielding():
                 target_runner.is_out = True
                 self.play_state.outs_this_play += 1
                 self.gamestate.game.outcount += 1
-                self.defensiveactions.append(f"out at {target_base}")
+                if self.describe:
+                    self.defensiveactions.append(f"out at {target_base}")
 
                 # Update force state after out
                 DefenseDecisionTree.update_force_state_after_out(
@@ -1221,7 +1439,8 @@ class fielding():
 
             else:
                 # Runner safe
-                self.defensiveactions.append(f"safe at {target_base}")
+                if self.describe:
+                    self.defensiveactions.append(f"safe at {target_base}")
                 target_runner.progress = 1.0
                 target_runner.current_base = target_base
                 self.play_state.play_active = False
@@ -1242,12 +1461,8 @@ class fielding():
             self.play_state.ball_holder.position
         )
 
-        try:
-            covering_player = [
-                p for p in self.gamestate.game.pitchingteam.battinglist
-                if p.lineup == covering_pos
-            ][0]
-        except (IndexError, AttributeError):
+        covering_player = self.gamestate.game.pitchingteam.index.fielder(covering_pos)
+        if covering_player is None:
             covering_player = self.gamestate.game.pitchingteam.currentpitcher
 
         # Check for throwing error
@@ -1264,31 +1479,29 @@ class fielding():
 
         # Check for catching error
         catch_error, catch_action = Error_Catch(self, self.play_state.ball_holder.player, covering_player)
-        self.defensiveactions.append(f"{throw_action} {catch_action}")
+        if self.describe:
+            self.defensiveactions.append(f"{throw_action} {catch_action}")
 
         if catch_error:
             self.errorlist.append(f"Catching error by {covering_pos}")
             return "error"
 
         # Calculate timing
-        throw_time = TimeCalculator.throw_time(
+        throw_time = self.timing.throw_time(
             self.play_state.ball_holder.position,
             target_base,
             self.play_state.ball_holder.player.throwpower
         )
 
         is_force = target_base in self.play_state.force_bases
-        catch_time = TimeCalculator.catch_transfer_time(covering_player, is_force)
+        catch_time = self.timing.catch_transfer_time(covering_player, is_force)
 
         total_defense_time = throw_time + catch_time
-        runner_time, runner_var = TimeCalculator.runner_time(target_runner, include_variance=True)
+        runner_time, runner_var = TimeCalculator.runner_time(target_runner, include_variance=True, rng=self.rng)
 
         # Update ball holder to catching fielder
-        self.play_state.ball_holder = FielderState(
-            position=covering_pos,
-            player=covering_player,
-            has_ball=True,
-            location=f"base_{target_base}"
+        self.play_state.ball_holder = self._fielder_state(
+            covering_pos, covering_player, True, fielding.BASE_LOCATIONS[target_base]
         )
         self.fieldingdefender = covering_player
 
@@ -1358,7 +1571,7 @@ class fielding():
             time_remaining = available_time + jump_bonus
 
             # Get route efficiency modifier based on baserunning
-            route_mod = TimeCalculator.route_efficiency_modifier(runner.baserunning)
+            route_mod = self.timing.route_efficiency_modifier(runner.baserunning)
 
             while time_remaining > 0 and runner.current_base < 4:
                 # Calculate time to next base
@@ -1408,7 +1621,8 @@ class fielding():
             runner.current_base = 4  # Scored
             runner.target_base = 4
             runner.progress = 1.0
-        self.defensiveactions.append("home run")
+        if self.describe:
+            self.defensiveactions.append("home run")
 
     def _mark_runs_unearned(self):
         """Mark all potential runs as unearned due to error."""
@@ -1477,7 +1691,7 @@ class fielding():
             time_remaining = available_time + jump_bonus
 
             # Get route efficiency modifier based on baserunning
-            route_mod = TimeCalculator.route_efficiency_modifier(runner.baserunning)
+            route_mod = self.timing.route_efficiency_modifier(runner.baserunning)
 
             while time_remaining > 0 and runner.current_base < 4:
                 base_key = (runner.current_base, runner.target_base)
@@ -1526,7 +1740,7 @@ class fielding():
             return
 
         # Need less than 3 outs to tag up (the fly out just added one)
-        current_outs = self.gamestate.game.currentouts + self.play_state.outs_this_play
+        current_outs = self.gamestate.game.state.outs + self.play_state.outs_this_play
         if current_outs >= 3:
             # DEBUG
             # print(f"TAG-UP: too many outs ({current_outs})")
@@ -1565,7 +1779,7 @@ class fielding():
             base_time = TimeCalculator.BASE_RUNNING_TIMES.get(base_key, 4.0)
             speed_mod = 1.0 - ((runner.speed_rating - 50) * 0.01)
             speed_mod = max(speed_mod, 0.5)
-            route_mod = TimeCalculator.route_efficiency_modifier(runner.baserunning)
+            route_mod = self.timing.route_efficiency_modifier(runner.baserunning)
 
             # Cap progress for tag-up - runners don't run full speed on fly balls
             effective_progress = min(runner.progress, 0.4)
@@ -1582,7 +1796,7 @@ class fielding():
 
             # Calculate defense time (throw from outfielder to target base)
             # Apply depth multiplier - catches at middle_of/deep_of are further from home
-            base_throw_time = TimeCalculator.throw_time(fielder_pos, target_base, fielder_throw_power)
+            base_throw_time = self.timing.throw_time(fielder_pos, target_base, fielder_throw_power)
             depth_mult = TimeCalculator.TAG_UP_DEPTH_MULTIPLIER.get(self.depth, 1.0)
             throw_time = base_throw_time * depth_mult
 
@@ -1596,7 +1810,7 @@ class fielding():
             else:
                 receiver = self.gamestate.game.pitchingteam.firstbase
 
-            catch_time = TimeCalculator.catch_transfer_time(receiver, is_force=False)
+            catch_time = self.timing.catch_transfer_time(receiver, is_force=False)
             total_defense_time = throw_time + catch_time
 
             # Decision: Does the runner attempt the tag-up?
@@ -1613,14 +1827,15 @@ class fielding():
                 runner.target_base = min(target_base + 1, 4)
                 runner.progress = 0.0
 
-                if target_base == 4:
-                    self.defensiveactions.append(f"scores on sac fly")
-                else:
-                    self.defensiveactions.append(f"tags to {target_base}")
+                if self.describe:
+                    if target_base == 4:
+                        self.defensiveactions.append(f"scores on sac fly")
+                    else:
+                        self.defensiveactions.append(f"tags to {target_base}")
             elif margin > -0.2:
                 # Close play - add variance to determine outcome
                 # High baserunning reduces risk of bad read
-                variance = TimeCalculator.runner_variance()
+                variance = TimeCalculator.runner_variance(self.rng)
                 adjusted_margin = margin + variance
 
                 if adjusted_margin > 0:
@@ -1629,10 +1844,11 @@ class fielding():
                     runner.target_base = min(target_base + 1, 4)
                     runner.progress = 0.0
 
-                    if target_base == 4:
-                        self.defensiveactions.append(f"scores on sac fly (close)")
-                    else:
-                        self.defensiveactions.append(f"tags to {target_base} (close)")
+                    if self.describe:
+                        if target_base == 4:
+                            self.defensiveactions.append(f"scores on sac fly (close)")
+                        else:
+                            self.defensiveactions.append(f"tags to {target_base} (close)")
                 else:
                     # Runner held or thrown out (for now, just hold)
                     # Could add thrown out logic later
@@ -1644,141 +1860,43 @@ class fielding():
             # Reset runner progress (they've returned to base after the catch)
             runner.progress = 0.0
 
-    def _build_base_situation(self) -> list:
-        """
-        Convert play state to base_situation format.
-        Format: [firstbase_player, secondbase_player, thirdbase_player, [scored_players]]
-        """
-        first = None
-        second = None
-        third = None
-        scored = []
+    def _set_result_bases(self):
+        """Copy where the play state left each runner into the PlayResult."""
+        result = self.result
+        result.first = result.second = result.third = None
+        scored = self.scored
 
         for runner in self.play_state.runners:
             if runner.is_out:
                 continue
 
             if runner.current_base == 1:
-                first = runner.player
+                result.first = runner.player
             elif runner.current_base == 2:
-                second = runner.player
+                result.second = runner.player
             elif runner.current_base == 3:
-                third = runner.player
+                result.third = runner.player
             elif runner.current_base >= 4:
                 scored.append(runner.player)
 
-        return [first, second, third, scored]
-
-    def _get_distweights(self, contacttype: str) -> list:
-        """
-        Get distance weights for a contact type with fallback to defaults.
-
-        Args:
-            contacttype: The type of contact (barrel, solid, flare, etc.)
-
-        Returns:
-            List of weights for distance outcomes
-        """
-        # Try to get from config
-        weights = self.distweights.get(contacttype)
-
-        # Check if weights exist and sum to more than zero
-        if weights and sum(weights) > 0:
-            return weights
-
-        # Fall back to defaults
-        default = fielding.DEFAULT_DISTWEIGHTS.get(contacttype)
-        if default:
-            return default
-
-        # Ultimate fallback - generic weights favoring middle outcomes
-        return [0.05, 0.15, 0.25, 0.25, 0.12, 0.10, 0.05, 0.02, 0.01]
-
-    def _derive_situation(self) -> str:
-        """
-        Derive situation category from depth + direction for catch_rates lookup.
-
-        Situation categories:
-        - deep_gap: Deep outfield + gap direction (hardest to catch)
-        - gap: Non-deep outfield + gap direction
-        - deep_line: Deep outfield + line direction
-        - line: Non-deep outfield + line direction
-        - deep: Deep outfield + straight-away
-        - routine_of: Shallow/middle outfield + straight-away
-        - routine_if: Infield fly ball
-
-        Returns:
-            Situation category string
-        """
-        is_gap = self.direction in fielding.GAP_DIRECTIONS
-        is_line = self.direction in fielding.LINE_DIRECTIONS
-        is_deep = self.depth == "deep_of"
-        is_outfield = self.depth in fielding.OUTFIELD_DEPTHS
-        is_infield = self.depth in fielding.INFIELD_DEPTHS
-
-        # Infield first - simplest case
-        if is_infield:
-            return "routine_if"
-
-        # Outfield situations
-        if is_outfield:
-            if is_gap:
-                return "deep_gap" if is_deep else "gap"
-            elif is_line:
-                return "deep_line" if is_deep else "line"
-            else:
-                # Straight-away (center, left, right but not gap/line)
-                return "deep" if is_deep else "routine_of"
-
-        # Fallback for homerun or unknown depths
-        return "deep"
-
     # =========================================================================
     # PRESERVED HELPER METHODS
     # =========================================================================
 
-    def PickDepth(self):
-        # Ensure we have valid outcomes and weights
-        if not self.distoutcomes or not self.specificweights:
-            return 'middle_of'  # Safe default
-
-        # Ensure weights sum to more than zero
-        if sum(self.specificweights) <= 0:
-            # Use uniform weights as fallback
-            weights = [1] * len(self.distoutcomes)
-        else:
-            weights = self.specificweights
-
-        depth = random.choices(self.distoutcomes, weights, k=1)[0]
-        return depth
-        
     def PickDefender(self):
         if self.depth == 'homerun':
             primary_defender = None
         else:
-            weight = 1
-            listofweights = []
-
-            # Safely get defender list with fallbacks for missing direction/depth
-            try:
-                direction_data = self.defensivealignment.get(self.direction, {})
-                defenderlist = direction_data.get(self.depth, [])
-            except (KeyError, TypeError):
-                defenderlist = []
+            # Aligned defenders weighted 1, .5, .25, ... (compiled per config)
+            defenderposition = self.compiled.pick_position(self.direction_code, self.depth_code, self.rng)
 
             # If no defenders found, return pitcher as fallback
-            if not defenderlist:
+            if defenderposition is None:
                 return self.gamestate.game.pitchingteam.currentpitcher
 
-            for item in range(0, len(defenderlist)):
-                listofweights.append(weight)
-                weight = (weight *.5)
-
-            defenderposition = random.choices(defenderlist, listofweights, k=1)[0]
-
-            try:
-                primary_defender = [player for player in self.gamestate.game.pitchingteam.battinglist if player.lineup==defenderposition][0]
-            except:
+            # Positions outside the lineup (the pitcher) fall back to the pitcher
+            primary_defender = self.gamestate.game.pitchingteam.index.fielder(defenderposition)
+            if primary_defender is None:
                 primary_defender = self.gamestate.game.pitchingteam.currentpitcher
 
         return primary_defender
@@ -1797,6 +1915,8 @@ class fielding():
 def Error_Throw_Catch(self, thrower, catcher):
     throw, t_action = Error_Catch(self, thrower, catcher)
     catch, c_action = Error_Throw(self, thrower, catcher)
+    if self.gamestate.game.outcome_only:
+        return throw, catch, None
     defensiveaction = str(t_action) + " " + str(c_action)
     return throw, catch, defensiveaction
 
@@ -1816,7 +1936,7 @@ def Error_Catch(self, thrower, catcher):
         else:
             depth = 'infield'
 
-    diceroll = np.random.rand()
+    diceroll = self.gamestate.game.rng.defense.random()
     cfs = (catcher.fieldspot - 50)/50
     cfr = (catcher.fieldreact - 50)/50
     cfc = (catcher.fieldcatch - 50)/50
@@ -1832,6 +1952,8 @@ def Error_Catch(self, thrower, catcher):
         if hasattr(catcher, 'fieldingstats'):
             catcher.fieldingstats.Adder("catching_errors", 1)
         return True, f"error by {catcher.lineup} {catcher.name}"
+    elif self.gamestate.game.outcome_only:
+        return False, None
     else:
         if thrower == None:
             return False, f"Ball caught by {catcher.lineup} {catcher.name}"
@@ -1852,7 +1974,7 @@ def Error_Throw(self, thrower, catcher):
         # Default to infield if no thrower
         depth = 'infield'
 
-    diceroll = np.random.rand()
+    diceroll = self.gamestate.game.rng.defense.random()
     tta = (thrower.throwacc - 50)/50
     ttp = (thrower.throwpower - 50)/50
     cscores = [tta, ttp]
@@ -1868,6 +1990,8 @@ def Error_Throw(self, thrower, catcher):
         if hasattr(thrower, 'fieldingstats'):
             thrower.fieldingstats.Adder("throwing_errors", 1)
         return True, f"error by {thrower.lineup} {thrower.name}"
+    elif self.gamestate.game.outcome_only:
+        return False, None
     else:
         return False, f"{thrower.lineup} {thrower.name} throws it to {catcher.lineup} {catcher.name}"        
 
@@ -2029,6 +2153,6 @@ class BasePaths():
             needadvance = [baserunner for runner in self.baserunner_eval_list if (baserunner.base - 1) == runner.base]
             if needadvance != []:
                 baserunner.running = True
-        if (self.gamestate.game.currentouts + self.gamestate.game.outcount) == self.gamestate.game.rules.outs -1:
+        if (self.gamestate.game.state.outs + self.gamestate.game.outcount) == self.gamestate.game.rules.outs -1:
             for baserunner in self.baserunner_eval_list:
                 baserunner.running = True
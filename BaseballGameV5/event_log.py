@@ -0,0 +1,142 @@
+"""
+Levelled game event logging.
+
+Each Game owns an EventLog that keeps the most recent records in a bounded
+in-memory ring buffer. The level decides what gets recorded:
+- off:   nothing (records are never built)
+- pa:    one compact record per completed plate appearance
+- pitch: the full action record for every pitch/action
+
+Records can also be exported through the "baseball.events" logger. Export
+goes through a QueueHandler drained by a QueueListener thread, so the
+simulation only pays for a queue put, never for the I/O.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from collections import deque
+
+
+# Verbosity levels
+OFF = 0
+PA = 1
+PITCH = 2
+
+LEVELS = {"off": OFF, "pa": PA, "pitch": PITCH}
+
+# Level used when a game doesn't choose one
+LOG_LEVEL_ENV = "SIM_LOG_LEVEL"
+DEFAULT_LEVEL = "off"
+
+# Records kept per game before the oldest are dropped
+DEFAULT_CAPACITY = 10000
+
+EXPORT_LOGGER_NAME = "baseball.events"
+
+_export_lock = threading.Lock()
+_export_listener = None
+
+
+def resolve_level(level) -> int:
+    """
+    Turn a level name (or None for the configured default) into a level.
+
+    Args:
+        level: "off", "pa", "pitch", an int level, or None
+
+    Returns:
+        Integer level
+
+    Raises:
+        ValueError: If the level name is unknown
+    """
+    if level is None:
+        level = os.environ.get(LOG_LEVEL_ENV, DEFAULT_LEVEL)
+    if isinstance(level, int):
+        return level
+    try:
+        return LEVELS[str(level).lower()]
+    except KeyError:
+        raise ValueError(f"Unknown log level '{level}' (expected one of {list(LEVELS)})")
+
+
+def export_logger(handler: logging.Handler = None) -> logging.Logger:
+    """
+    Get the export logger, starting its background listener on first use.
+
+    Args:
+        handler: Handler the listener writes to (defaults to stderr);
+                 only used on the first call in a process
+
+    Returns:
+        Logger whose records are queued and written by the listener thread
+    """
+    global _export_listener
+    logger = logging.getLogger(EXPORT_LOGGER_NAME)
+    with _export_lock:
+        if _export_listener is None:
+            records = queue.SimpleQueue()
+            logger.addHandler(logging.handlers.QueueHandler(records))
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+
+            if handler is None:
+                handler = logging.StreamHandler(sys.stderr)
+            _export_listener = logging.handlers.QueueListener(records, handler)
+            _export_listener.start()
+            atexit.register(stop_export)
+    return logger
+
+
+def stop_export():
+    """Flush and stop the export listener (if running)."""
+    global _export_listener
+    with _export_lock:
+        if _export_listener is not None:
+            _export_listener.stop()
+            _export_listener = None
+
+
+class EventLog:
+    """Per-game ring buffer of event records filtered by level."""
+
+    def __init__(self, level=None, capacity: int = DEFAULT_CAPACITY, export: bool = False):
+        """
+        Args:
+            level: "off", "pa" or "pitch" (None uses SIM_LOG_LEVEL, default off)
+            capacity: Maximum records kept; older ones are dropped
+            export: Also send records to the export logger
+        """
+        self.level = resolve_level(level)
+        self.buffer = deque(maxlen=capacity)
+        self.logger = export_logger() if export and self.level > OFF else None
+
+    def enabled(self, level: int) -> bool:
+        """Whether records at the given level are being kept."""
+        return self.level >= level
+
+    def record(self, level: int, record: dict):
+        """
+        Keep a record if its level is enabled.
+
+        Callers should check enabled() first so nothing is built when
+        the level is off.
+
+        Args:
+            level: PA or PITCH
+            record: The event record
+        """
+        if self.level < level:
+            return
+        self.buffer.append(record)
+        if self.logger is not None:
+            self.logger.info("%s", record)
+
+    def records(self) -> list:
+        """Records currently in the buffer, oldest first."""
+        return list(self.buffer)
@@ -0,0 +1,304 @@
+"""
+Compact play-by-play records.
+
+Every Action is captured as a slotted PlayEvent holding plain scalars,
+integer codes (see codes.py) and player ids instead of the old ~70-key
+dict of stringified lists and player reference dicts. Post-game analytics
+read the typed fields directly; the legacy dict shape is only produced by
+to_dict() at the API/JSON boundary.
+"""
+
+from codes import (
+    CONTACT_CODE, CONTACT_NAMES, DEPTH_CODE, DEPTH_NAMES, DIRECTION_CODE, DIRECTION_NAMES,
+    SITUATION_CODE, SITUATION_NAMES, PITCH_RESULT_CODE, PITCH_RESULT_NAMES,
+    PITCH_DETAIL_CODE, PITCH_DETAIL_NAMES, PLAY_OUTCOME_CODE, PLAY_OUTCOME_NAMES,
+    PitchResult, PitchDetail, PlayOutcome
+)
+from game_state import (
+    IS_WALK, IS_STRIKEOUT, IS_INPLAY, IS_HIT, IS_HBP, IS_PICKOFF,
+    IS_STEALATTEMPT, IS_STEALSUCCESS, IS_LIVEBALL,
+    IS_SINGLE, IS_DOUBLE, IS_TRIPLE, IS_HOMERUN, AB_OVER
+)
+
+
+# (dict key, flag bit) in legacy dict key order: the action flags come
+# before Error_Count / Is_Liveball / Is_Foul, the hit type flags after
+ACTION_FLAG_KEYS = tuple(zip(
+    ("Is_Walk", "Is_Strikeout", "Is_InPlay", "Is_Hit", "Is_HBP", "Is_Pickoff",
+     "Is_StealAttempt", "Is_StealSuccess"),
+    (IS_WALK, IS_STRIKEOUT, IS_INPLAY, IS_HIT, IS_HBP, IS_PICKOFF,
+     IS_STEALATTEMPT, IS_STEALSUCCESS)
+))
+HIT_FLAG_KEYS = tuple(zip(
+    ("Is_Single", "Is_Double", "Is_Triple", "Is_Homerun", "AB_Over"),
+    (IS_SINGLE, IS_DOUBLE, IS_TRIPLE, IS_HOMERUN, AB_OVER)
+))
+
+# Fielders captured per event, in legacy dict key order
+FIELDER_KEYS = (
+    "Catcher", "First Base", "Second Base", "Third Base",
+    "Shortstop", "Left Field", "Center Field", "Right Field"
+)
+FIELDER_ATTRS = (
+    "catcher", "firstbase", "secondbase", "thirdbase",
+    "shortstop", "leftfield", "centerfield", "rightfield"
+)
+
+HIT_OUTCOMES = frozenset((PlayOutcome.SINGLE, PlayOutcome.DOUBLE, PlayOutcome.TRIPLE, PlayOutcome.HOMERUN))
+
+
+def player_id(player):
+    """Id of a player (None for no player)."""
+    if player is None:
+        return None
+    return getattr(player, 'id', None)
+
+
+class PlayEvent:
+    """One Action of a game, as typed fields."""
+
+    __slots__ = (
+        "id", "inning", "top", "home_team", "home_score", "away_team", "away_score",
+        "balls", "strikes", "outs", "outs_this_action",
+        "batter_id", "pitcher_id",
+        "result", "detail", "pitch_name",
+        "contact", "direction", "depth", "situation", "air", "catch_probability",
+        "targeted_id", "play_outcome", "errors", "defensive_actions",
+        "on_first_id", "on_second_id", "on_third_id", "scored_ids",
+        "flags", "error_count", "fielder_ids",
+        "modifiers", "interaction", "timing",
+        "pre_r1_id", "pre_r2_id", "pre_r3_id", "pre_outs",
+        "wpa", "leverage"
+    )
+
+    @classmethod
+    def from_action(cls, action):
+        """
+        Capture the state of an Action as it finishes processing.
+
+        Args:
+            action: Action.Action instance
+
+        Returns:
+            PlayEvent
+        """
+        game = action.game
+        event = object.__new__(cls)
+        event.id = action.id
+        event.inning = game.currentinning
+        event.top = bool(game.topofinning)
+        event.home_team = game.hometeam.name
+        event.home_score = game.hometeam.score
+        event.away_team = game.awayteam.name
+        event.away_score = game.awayteam.score
+        state = game.state
+        event.balls = state.balls
+        event.strikes = state.strikes
+        event.outs = state.outs
+        event.outs_this_action = game.outcount
+        event.batter_id = player_id(game.battingteam.currentbatter)
+        event.pitcher_id = player_id(game.pitchingteam.currentpitcher)
+
+        # Pitch outcome: [result, detail, pitch] or, in play, [contact, direction, pitch]
+        outcome = action.outcome
+        event.contact = event.direction = event.depth = event.situation = None
+        event.air = event.catch_probability = event.targeted_id = None
+        if outcome is None:
+            event.result = event.detail = event.pitch_name = None
+        else:
+            event.pitch_name = outcome[2]
+            if outcome[1] in DIRECTION_CODE:
+                event.result = PitchResult.IN_PLAY
+                event.detail = None
+                event.contact = CONTACT_CODE[outcome[0]]
+                event.direction = DIRECTION_CODE[outcome[1]]
+            else:
+                event.result = PITCH_RESULT_CODE[outcome[0]]
+                event.detail = PITCH_DETAIL_CODE[outcome[1]]
+
+        # Batted ball fields are only set on the game for in-play actions
+        if game.batted_ball is not None:
+            event.contact = CONTACT_CODE[game.batted_ball]
+            event.air = game.air_or_ground == "air"
+            event.targeted_id = player_id(game.targeted_defender)
+            event.depth = DEPTH_CODE[game.hit_depth]
+            event.direction = DIRECTION_CODE[game.hit_direction]
+            event.situation = SITUATION_CODE[game.hit_situation]
+            event.catch_probability = game.catch_probability
+
+        defensive = action.defensiveoutcome
+        if defensive is None:
+            event.play_outcome = event.errors = event.defensive_actions = event.timing = None
+        else:
+            event.play_outcome = None if defensive.outcome is None else PLAY_OUTCOME_CODE[defensive.outcome]
+            # Error entries may be players; keep their text as printed
+            event.errors = tuple(repr(error) for error in defensive.errors)
+            event.defensive_actions = tuple(defensive.actions)
+            event.timing = defensive.timing
+
+        event.on_first_id = player_id(state.first)
+        event.on_second_id = player_id(state.second)
+        event.on_third_id = player_id(state.third)
+        event.scored_ids = tuple(player_id(runner) for runner in game.current_runners_home)
+        event.flags = state.flags
+        event.error_count = game.error_count
+
+        pitchingteam = game.pitchingteam
+        event.fielder_ids = tuple(player_id(getattr(pitchingteam, attr)) for attr in FIELDER_ATTRS)
+
+        pitch_event = getattr(action, 'pitch_event', None)
+        event.interaction = pitch_event.get_phase_snapshot() if pitch_event is not None else None
+        event.modifiers = (
+            pitch_event.batted_ball_event.get_modifier_snapshot()
+            if pitch_event is not None and pitch_event.batted_ball_event is not None else None
+        )
+
+        event.pre_r1_id = player_id(action.pre_r1)
+        event.pre_r2_id = player_id(action.pre_r2)
+        event.pre_r3_id = player_id(action.pre_r3)
+        event.pre_outs = action.pre_outs
+
+        tables = game.expectancy
+        if tables is None:
+            event.wpa = event.leverage = None
+        else:
+            event.wpa, event.leverage = tables.event_values(event)
+        return event
+
+    # ------------------------------------------------------------------
+    # Typed accessors used by analytics
+    # ------------------------------------------------------------------
+
+    def has(self, flag: int) -> bool:
+        """Whether a flag bit (e.g. IS_WALK) is set."""
+        return bool(self.flags & flag)
+
+    @property
+    def is_foul(self) -> bool:
+        return self.detail == PitchDetail.FOUL
+
+    @property
+    def runners_scored(self) -> int:
+        return len(self.scored_ids)
+
+    @property
+    def is_hit_outcome(self) -> bool:
+        return self.play_outcome in HIT_OUTCOMES
+
+    @property
+    def batted_ball(self):
+        """Contact type name of a ball put in play (None otherwise)."""
+        return CONTACT_NAMES[self.contact] if self.depth is not None else None
+
+    @property
+    def outcome_name(self):
+        """Defensive outcome name (None if there was no play)."""
+        return PLAY_OUTCOME_NAMES[self.play_outcome] if self.play_outcome is not None else None
+
+    @property
+    def is_dp_opportunity(self) -> bool:
+        return self.pre_r1_id is not None and self.pre_outs < 2 and self.air is False
+
+    @property
+    def is_tp_opportunity(self) -> bool:
+        return (self.pre_r1_id is not None and self.pre_r2_id is not None
+                and self.pre_outs == 0 and self.air is False)
+
+    @property
+    def is_dp(self) -> bool:
+        return self.is_dp_opportunity and self.outs_this_action >= 2
+
+    @property
+    def is_tp(self) -> bool:
+        return self.is_tp_opportunity and self.outs_this_action >= 3
+
+    @property
+    def outcomes(self):
+        """The legacy [result, detail, pitch] outcome list (None if no pitch)."""
+        if self.result is None:
+            return None
+        if self.result == PitchResult.IN_PLAY:
+            return [CONTACT_NAMES[self.contact], DIRECTION_NAMES[self.direction], self.pitch_name]
+        return [PITCH_RESULT_NAMES[self.result], PITCH_DETAIL_NAMES[self.detail], self.pitch_name]
+
+    # ------------------------------------------------------------------
+    # Legacy dict expansion (API/JSON boundary)
+    # ------------------------------------------------------------------
+
+    def to_dict(self, names: dict) -> dict:
+        """
+        Expand to the legacy play-by-play dict.
+
+        Args:
+            names: Player id -> "First Last" for every player in the game
+
+        Returns:
+            Dict in the ActionPrint shape
+        """
+        def ref(pid):
+            if pid is None:
+                return None
+            return {"player_id": pid, "player_name": names.get(pid, " ")}
+
+        in_play = self.depth is not None
+        outcomes = self.outcomes
+        flags = self.flags
+
+        record = {
+            "ID": self.id,
+            "Inning": self.inning,
+            "Inning Half": "Top" if self.top else "Bottom",
+            "Home Team": self.home_team,
+            "Home Score": self.home_score,
+            "Away Team": self.away_team,
+            "Away Score": self.away_score,
+            "Ball Count": self.balls,
+            "Strike Count": self.strikes,
+            "Out Count": self.outs,
+            "Outs this Action": self.outs_this_action,
+            "Batter": ref(self.batter_id),
+            "Pitcher": ref(self.pitcher_id),
+            "Outcomes": str(outcomes),
+            "Batted Ball": str(self.batted_ball),
+            "Air or Ground": ("air" if self.air else "ground") if in_play else "None",
+            "Hit Depth": DEPTH_NAMES[self.depth] if in_play else "None",
+            "Hit Direction": DIRECTION_NAMES[self.direction] if in_play else "None",
+            "Hit Situation": SITUATION_NAMES[self.situation] if in_play else "None",
+            "Catch Probability": self.catch_probability,
+            "Targeted Defender": ref(self.targeted_id) if self.targeted_id is not None else "None",
+            "Defensive Outcome": str(self.outcome_name),
+            "Error List": "[" + ", ".join(self.errors) + "]" if self.errors is not None else "None",
+            "Defensive Actions": str(list(self.defensive_actions)) if self.defensive_actions is not None else "None",
+            "On First": ref(self.on_first_id),
+            "On Second": ref(self.on_second_id),
+            "On Third": ref(self.on_third_id),
+            "Home": [ref(pid) for pid in self.scored_ids],
+        }
+        for key, flag in ACTION_FLAG_KEYS:
+            record[key] = bool(flags & flag)
+        record["Error_Count"] = self.error_count
+        record["Is_Liveball"] = bool(flags & IS_LIVEBALL)
+        record["Is_Foul"] = outcomes is not None and outcomes[1] == "Foul"
+        for key, flag in HIT_FLAG_KEYS:
+            record[key] = bool(flags & flag)
+        for key, pid in zip(FIELDER_KEYS, self.fielder_ids):
+            record[key] = ref(pid)
+        record.update({
+            "At_Bat_Modifiers": self.modifiers,
+            "Interaction_Data": self.interaction,
+            "Timing_Diagnostics": self.timing,
+            "Pre_R1": ref(self.pre_r1_id),
+            "Pre_R2": ref(self.pre_r2_id),
+            "Pre_R3": ref(self.pre_r3_id),
+            "Pre_Outs": self.pre_outs,
+            "Runners_Scored": len(self.scored_ids),
+            "Runners_Scored_IDs": list(self.scored_ids),
+            "Is_DP_Opportunity": self.is_dp_opportunity,
+            "Is_DP": self.is_dp,
+            "Is_TP_Opportunity": self.is_tp_opportunity,
+            "Is_TP": self.is_tp,
+        })
+        if self.leverage is not None:
+            record["WPA"] = self.wpa
+            record["Leverage"] = self.leverage
+        return record
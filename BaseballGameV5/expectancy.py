@@ -0,0 +1,370 @@
+"""
+Run expectancy, win expectancy and leverage tables.
+
+Tables are generated per level config by simulating many games and
+reading their play-by-play:
+
+- RE24: mean runs scored from each base-out state to the end of the
+  half-inning
+- Win expectancy: home team win share by inning, half, score differential
+  and base-out state (sparse states fall back to coarser aggregates)
+- Leverage index: mean absolute win expectancy swing of the next action
+  from each state, relative to the average swing
+
+Built tables are cached on disk keyed by a fingerprint of the level
+config, game constants and rules. A game with tables attached
+(game.expectancy) gives every PlayEvent its WPA and leverage through two
+flat-list lookups.
+
+Usage:
+    python expectancy.py <payload.json> --level 9 --games 2000
+"""
+
+import os
+import sys
+import argparse
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from table_cache import TableCache, simulate_level_games
+
+
+# Bump when the table layout or generation changes (invalidates the cache)
+TABLE_VERSION = 1
+
+OUTS_PER_INNING = 3
+BASE_OUT_STATES = 8 * OUTS_PER_INNING
+# Score differentials beyond this are folded into the edge buckets
+MAX_RUN_DIFF = 8
+RUN_DIFFS = 2 * MAX_RUN_DIFF + 1
+# States seen fewer times than this use a coarser win expectancy
+MIN_STATE_SAMPLES = 25
+
+DEFAULT_GAMES = 2000
+CACHE_DIR_ENV = "EXPECTANCY_CACHE_DIR"
+
+
+def base_out(r1, r2, r3, outs: int) -> int:
+    """
+    Base-out state code: occupied bases bitmask (1st=1, 2nd=2, 3rd=4) + 8 * outs.
+
+    The same code GameState.base_out gives for a live game.
+
+    Args:
+        r1, r2, r3: Runner (or runner id) on each base, None when empty
+        outs: Outs in the inning (0-2)
+
+    Returns:
+        Code in range(24)
+    """
+    return ((r1 is not None) | (r2 is not None) << 1 | (r3 is not None) << 2) + 8 * outs
+
+
+def state_index(inning: int, top: bool, diff: int, base_out_code: int, innings: int) -> int:
+    """
+    Flat win expectancy table index.
+
+    Args:
+        inning: Inning (extra innings share the last regulation inning)
+        top: Top of the inning
+        diff: Home score minus away score
+        base_out_code: See base_out()
+        innings: Regulation innings
+
+    Returns:
+        Index into the win expectancy / leverage tables
+    """
+    inning = min(max(inning, 1), innings)
+    diff = min(max(diff, -MAX_RUN_DIFF), MAX_RUN_DIFF) + MAX_RUN_DIFF
+    return (((inning - 1) * 2 + (not top)) * RUN_DIFFS + diff) * BASE_OUT_STATES + base_out_code
+
+
+def pre_state(event, innings: int) -> int:
+    """Table index of the state an event started from."""
+    runs = len(event.scored_ids)
+    diff = event.home_score - event.away_score
+    diff += runs if event.top else -runs
+    code = base_out(event.pre_r1_id, event.pre_r2_id, event.pre_r3_id, min(event.pre_outs, OUTS_PER_INNING - 1))
+    return state_index(event.inning, event.top, diff, code, innings)
+
+
+def post_state(event, innings: int):
+    """
+    State an event left the game in.
+
+    Args:
+        event: PlayEvent
+        innings: Regulation innings
+
+    Returns:
+        (index, None) for a table state, or (None, home win value) when the
+        event ended the game
+    """
+    diff = event.home_score - event.away_score
+    outs = event.pre_outs + event.outs_this_action
+    inning = event.inning
+    if outs >= OUTS_PER_INNING:
+        if event.top:
+            if inning >= innings and diff > 0:
+                return None, 1.0
+            return state_index(inning, False, diff, 0, innings), None
+        if inning >= innings and diff != 0:
+            return None, 1.0 if diff > 0 else 0.0
+        return state_index(inning + 1, True, diff, 0, innings), None
+    if not event.top and inning > innings and diff > 0 and event.outs_this_action:
+        # Extra-inning walkoff
+        return None, 1.0
+    code = base_out(event.on_first_id, event.on_second_id, event.on_third_id, outs)
+    return state_index(inning, event.top, diff, code, innings), None
+
+
+class ExpectancyTables:
+    """RE24, win expectancy and leverage tables for one level config."""
+
+    def __init__(self, innings: int, re24: list, win_expectancy: list, leverage: list,
+                 games: int = 0, key: str = None):
+        """
+        Args:
+            innings: Regulation innings the tables were built for
+            re24: Run expectancy per base-out code
+            win_expectancy: Home win expectancy per state_index()
+            leverage: Leverage index per state_index()
+            games: Number of simulated games behind the tables
+            key: Config fingerprint the tables were built for
+        """
+        self.innings = innings
+        self.re24 = re24
+        self.win_expectancy = win_expectancy
+        self.leverage = leverage
+        self.games = games
+        self.key = key
+
+    @classmethod
+    def from_games(cls, games, innings: int, key: str = None):
+        """
+        Build tables from simulated games.
+
+        Args:
+            games: Iterable of PlayEvent lists, one per finished game
+            innings: Regulation innings
+            key: Config fingerprint to record
+
+        Returns:
+            ExpectancyTables
+        """
+        size = innings * 2 * RUN_DIFFS * BASE_OUT_STATES
+        wins = [0.0] * size
+        seen = [0] * size
+        re_runs = [0] * BASE_OUT_STATES
+        re_seen = [0] * BASE_OUT_STATES
+        transitions = []
+        game_count = 0
+
+        for events in games:
+            if not events:
+                continue
+            game_count += 1
+            last = events[-1]
+            if last.home_score != last.away_score:
+                result = 1.0 if last.home_score > last.away_score else 0.0
+            else:
+                result = 0.5
+
+            # Runs to the end of the half-inning, walking each game backwards
+            half = None
+            half_runs = 0
+            for event in reversed(events):
+                if (event.inning, event.top) != half:
+                    half = (event.inning, event.top)
+                    half_runs = 0
+                half_runs += len(event.scored_ids)
+                code = base_out(event.pre_r1_id, event.pre_r2_id, event.pre_r3_id,
+                                min(event.pre_outs, OUTS_PER_INNING - 1))
+                re_runs[code] += half_runs
+                re_seen[code] += 1
+
+            for event in events:
+                pre = pre_state(event, innings)
+                wins[pre] += result
+                seen[pre] += 1
+                transitions.append((pre,) + post_state(event, innings))
+
+        # Coarser aggregates for sparse states: (inning, half, diff), then diff
+        per_block = [0.0] * (size // BASE_OUT_STATES)
+        per_block_seen = [0] * len(per_block)
+        per_diff = [0.0] * RUN_DIFFS
+        per_diff_seen = [0] * RUN_DIFFS
+        for index in range(size):
+            if seen[index]:
+                block = index // BASE_OUT_STATES
+                per_block[block] += wins[index]
+                per_block_seen[block] += seen[index]
+                per_diff[block % RUN_DIFFS] += wins[index]
+                per_diff_seen[block % RUN_DIFFS] += seen[index]
+
+        win_expectancy = []
+        for index in range(size):
+            block = index // BASE_OUT_STATES
+            diff = block % RUN_DIFFS
+            if seen[index] >= MIN_STATE_SAMPLES:
+                value = wins[index] / seen[index]
+            elif per_block_seen[block] >= MIN_STATE_SAMPLES:
+                value = per_block[block] / per_block_seen[block]
+            elif per_diff_seen[diff] >= MIN_STATE_SAMPLES:
+                value = per_diff[diff] / per_diff_seen[diff]
+            else:
+                value = 0.5 if diff == MAX_RUN_DIFF else float(diff > MAX_RUN_DIFF)
+            win_expectancy.append(round(value, 4))
+
+        # Leverage: mean |WE swing| from each state over the mean swing
+        swing = [0.0] * size
+        swing_seen = [0] * size
+        total_swing = 0.0
+        for pre, post, final in transitions:
+            after = final if post is None else win_expectancy[post]
+            change = abs(after - win_expectancy[pre])
+            swing[pre] += change
+            swing_seen[pre] += 1
+            total_swing += change
+        mean_swing = total_swing / len(transitions) if transitions else 0.0
+
+        leverage = []
+        for index in range(size):
+            if swing_seen[index] >= MIN_STATE_SAMPLES and mean_swing:
+                value = swing[index] / swing_seen[index] / mean_swing
+            else:
+                value = 1.0
+            leverage.append(round(value, 3))
+
+        re24 = [round(re_runs[code] / re_seen[code], 3) if re_seen[code] else 0.0
+                for code in range(BASE_OUT_STATES)]
+        return cls(innings, re24, win_expectancy, leverage, game_count, key)
+
+    def run_expectancy(self, r1, r2, r3, outs: int) -> float:
+        """Expected runs to the end of the half-inning from a base-out state."""
+        return self.re24[base_out(r1, r2, r3, outs)]
+
+    def home_win_expectancy(self, inning: int, top: bool, diff: int, base_out_code: int) -> float:
+        """Home team win expectancy for a game state."""
+        return self.win_expectancy[state_index(inning, top, diff, base_out_code, self.innings)]
+
+    def event_values(self, event):
+        """
+        WPA and leverage of one event.
+
+        Args:
+            event: PlayEvent (all fields captured)
+
+        Returns:
+            (wpa, leverage): home win expectancy added by the event and the
+            leverage index of the state it started from
+        """
+        pre = pre_state(event, self.innings)
+        post, final = post_state(event, self.innings)
+        after = final if post is None else self.win_expectancy[post]
+        return round(after - self.win_expectancy[pre], 4), self.leverage[pre]
+
+    def to_dict(self) -> dict:
+        return {
+            "version": TABLE_VERSION,
+            "key": self.key,
+            "games": self.games,
+            "innings": self.innings,
+            "re24": self.re24,
+            "win_expectancy": self.win_expectancy,
+            "leverage": self.leverage,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(data["innings"], data["re24"], data["win_expectancy"], data["leverage"],
+                   data.get("games", 0), data.get("key"))
+
+
+# ----------------------------------------------------------------------
+# Generation and disk cache
+# ----------------------------------------------------------------------
+
+TABLE_CACHE = TableCache("expectancy", TABLE_VERSION, ExpectancyTables, CACHE_DIR_ENV)
+
+
+def generate_tables(game_payloads: list, rules: dict, level_config: dict, game_constants: dict,
+                    games: int = DEFAULT_GAMES, seed=0, save: bool = True) -> ExpectancyTables:
+    """
+    Simulate a level and build (and cache) its tables.
+
+    Args:
+        game_payloads: Game payloads (rosters) to cycle through
+        rules: Rules dict for the level
+        level_config: Level config
+        game_constants: Game constants
+        games: Number of games to simulate
+        seed: Base seed for the simulated games
+        save: Write the tables to the disk cache
+
+    Returns:
+        ExpectancyTables
+    """
+    import Game
+
+    key = TABLE_CACHE.key(level_config, game_constants, rules)
+    innings = Game.CONFIG_CACHE.get_rules(rules).innings
+    played = simulate_level_games(game_payloads, rules, level_config, game_constants,
+                                  games, seed, stream="expectancy")
+    tables = ExpectancyTables.from_games((game.actions for game in played), innings, key)
+    if save:
+        TABLE_CACHE.save(tables)
+    return tables
+
+
+def format_re24(tables: ExpectancyTables) -> str:
+    """RE24 as a text grid (rows: bases, columns: outs)."""
+    lines = ["Bases     0 out   1 out   2 out"]
+    for mask in range(8):
+        bases = "".join(str(base + 1) if mask >> base & 1 else "-" for base in range(3))
+        values = "".join(f"{tables.re24[mask + 8 * outs]:8.3f}" for outs in range(OUTS_PER_INNING))
+        lines.append(f"{bases:<8}{values}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate run/win expectancy and leverage tables for a level"
+    )
+    parser.add_argument("json_file", help="Payload whose games (rosters) are simulated")
+    parser.add_argument("--level", default="9", help="League level id (default: 9)")
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES,
+                        help=f"Games to simulate (default: {DEFAULT_GAMES})")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed (default: 0)")
+    parser.add_argument("--force", action="store_true", help="Regenerate even if cached")
+    args = parser.parse_args()
+
+    from run_local import load_json_file, DEFAULT_RULES, DEFAULT_LEVEL_CONFIG
+
+    payload = load_json_file(args.json_file)
+    game_constants = payload.get("game_constants", {})
+    rules = payload.get("rules", {}).get(args.level, DEFAULT_RULES)
+    level_config = payload.get("level_configs", {}).get(args.level, DEFAULT_LEVEL_CONFIG)
+    game_payloads = [
+        game for games in payload.get("subweeks", {}).values() for game in games
+        if str(game.get("league_level_id", "9")) == args.level
+    ]
+    if not game_payloads:
+        parser.error(f"no games at level {args.level} in {args.json_file}")
+
+    tables = None if args.force else TABLE_CACHE.get(level_config, game_constants, rules)
+    if tables is None:
+        print(f"Simulating {args.games} games at level {args.level}...")
+        tables = generate_tables(game_payloads, rules, level_config, game_constants,
+                                 games=args.games, seed=args.seed)
+        print(f"Saved: {TABLE_CACHE.path(tables.key)}")
+    else:
+        print(f"Cached ({tables.games} games): {TABLE_CACHE.path(tables.key)}")
+
+    print()
+    print(format_re24(tables))
+
+
+if __name__ == "__main__":
+    main()
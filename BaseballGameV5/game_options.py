@@ -0,0 +1,57 @@
+"""
+Per-request engine options.
+
+GameOptions collects the switches a payload (or the run_local command line)
+sets for every game it runs: result sections, event logging and the engine
+modes (expectancy tables, outcome-only, PA sampling, surrogate defense,
+timing diagnostics). It is built once per request, passed to workers as a
+single picklable value and applied to each game by Game.apply_options().
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class GameOptions:
+    """Result sections, logging and engine modes for the games of one request."""
+
+    # Optional result sections to build (None builds all)
+    sections: Optional[tuple] = None
+    # Event log level ("off", "pa", "pitch"; None = SIM_LOG_LEVEL)
+    log_level: Optional[str] = None
+    # Attach the level's cached expectancy tables (WPA and leverage per play)
+    expectancy: bool = False
+    # Score, boxscore and injuries only (no sections, logging or descriptions)
+    outcome_only: bool = False
+    # Sample PAs from per-matchup outcome distributions (not a speedup)
+    pa_sampling: bool = False
+    # Sample balls in play from the level's cached surrogate defense tables
+    surrogate_defense: bool = False
+    # Timing diagnostics on every Nth ball in play (0 = off)
+    timing_diagnostics: int = 0
+
+    @classmethod
+    def from_payload(cls, payload: dict, default_sections=None):
+        """
+        Options of a simulation payload.
+
+        Args:
+            payload: Payload dict (SimulationPayload.model_dump() or raw JSON)
+            default_sections: Sections used when the payload sets none
+
+        Returns:
+            GameOptions
+        """
+        sections = payload.get("sections")
+        if sections is None:
+            sections = default_sections
+        return cls(
+            sections=None if sections is None else tuple(sections),
+            log_level=payload.get("log_level"),
+            expectancy=bool(payload.get("expectancy")),
+            outcome_only=bool(payload.get("outcome_only")),
+            pa_sampling=bool(payload.get("pa_sampling")),
+            surrogate_defense=bool(payload.get("surrogate_defense")),
+            timing_diagnostics=int(payload.get("timing_diagnostics") or 0),
+        )
@@ -0,0 +1,139 @@
+"""
+Compact live game state.
+
+GameState holds everything that changes pitch to pitch in __slots__: the
+three runners, outs, the count and the per-action / per-plate-appearance
+flags as a single bitmask. Hot paths switch on integer codes instead of
+comparing loose attributes:
+
+- bases: occupied bases bitmask (1st=1, 2nd=2, 3rd=4)
+- base_out: bases + 8 * outs, the 24 base-out states the run expectancy
+  tables are keyed on (see expectancy.base_out)
+- count: balls + 5 * strikes
+- flags: IS_* bits, in play-by-play order (PlayEvent.flags is a copy)
+
+Game keeps the legacy attribute names (on_firstbase, currentouts, is_walk,
+...) as properties over its state, so existing callers are unaffected.
+"""
+
+from operator import attrgetter
+
+
+# Flag bits, in legacy play-by-play key order
+FLAG_ATTRS = (
+    "is_walk", "is_strikeout", "is_inplay", "is_hit", "is_hbp", "is_pickoff",
+    "is_stealattempt", "is_stealsuccess", "is_liveball",
+    "is_single", "is_double", "is_triple", "is_homerun", "ab_over"
+)
+(IS_WALK, IS_STRIKEOUT, IS_INPLAY, IS_HIT, IS_HBP, IS_PICKOFF,
+ IS_STEALATTEMPT, IS_STEALSUCCESS, IS_LIVEBALL,
+ IS_SINGLE, IS_DOUBLE, IS_TRIPLE, IS_HOMERUN, AB_OVER) = (1 << bit for bit in range(len(FLAG_ATTRS)))
+
+# Flags cleared after every action
+ACTION_FLAGS = IS_PICKOFF | IS_STEALATTEMPT | IS_STEALSUCCESS | IS_INPLAY
+# Flags cleared when a plate appearance ends
+PA_FLAGS = (IS_WALK | IS_HBP | IS_STRIKEOUT | IS_HIT |
+            IS_SINGLE | IS_DOUBLE | IS_TRIPLE | IS_HOMERUN | AB_OVER)
+# Plate appearances that put the batter on first without an at-bat
+FREE_PASS = IS_WALK | IS_HBP
+# Hit flags by defensive outcome
+HIT_FLAGS = {
+    "single": IS_HIT | IS_SINGLE,
+    "double": IS_HIT | IS_DOUBLE,
+    "triple": IS_HIT | IS_TRIPLE,
+    "homerun": IS_HIT | IS_HOMERUN,
+}
+
+FIRST, SECOND, THIRD = 1, 2, 4
+BASES_EMPTY, BASES_LOADED = 0, FIRST | SECOND | THIRD
+BASE_STATES = 8
+# Count codes cover terminal counts (4 balls / 3 strikes) too
+COUNT_BALLS = 5
+
+
+class GameState:
+    """Runners, outs, count and flags of a game in progress."""
+
+    __slots__ = ("first", "second", "third", "outs", "balls", "strikes", "flags")
+
+    def __init__(self):
+        self.first = self.second = self.third = None
+        self.outs = self.balls = self.strikes = 0
+        self.flags = 0
+
+    def copy(self):
+        """Independent copy (runner references are shared)."""
+        clone = object.__new__(GameState)
+        clone.first, clone.second, clone.third = self.first, self.second, self.third
+        clone.outs, clone.balls, clone.strikes, clone.flags = self.outs, self.balls, self.strikes, self.flags
+        return clone
+
+    @property
+    def bases(self) -> int:
+        """Occupied bases bitmask (FIRST | SECOND | THIRD)."""
+        return (self.first is not None) | (self.second is not None) << 1 | (self.third is not None) << 2
+
+    @property
+    def base_out(self) -> int:
+        """Base-out state code, bases + 8 * outs."""
+        return self.bases + BASE_STATES * self.outs
+
+    @property
+    def count(self) -> int:
+        """Count code, balls + 5 * strikes."""
+        return self.balls + COUNT_BALLS * self.strikes
+
+    @property
+    def runners_on(self) -> int:
+        """Number of runners on base."""
+        return (self.first is not None) + (self.second is not None) + (self.third is not None)
+
+    def end_action(self):
+        """Clear the per-action flags."""
+        self.flags &= ~ACTION_FLAGS
+
+    def end_plate_appearance(self):
+        """Reset the count and clear the plate appearance flags."""
+        self.balls = self.strikes = 0
+        self.flags &= ~PA_FLAGS
+
+    def end_half_inning(self):
+        """Clear the bases and outs."""
+        self.first = self.second = self.third = None
+        self.outs = 0
+
+
+def _slot_property(slot: str):
+    getter = attrgetter("state." + slot)
+
+    def setter(game, value):
+        setattr(game.state, slot, value)
+    return property(getter, setter)
+
+
+def _flag_property(bit: int):
+    def getter(game):
+        return bool(game.state.flags & bit)
+
+    def setter(game, value):
+        if value:
+            game.state.flags |= bit
+        else:
+            game.state.flags &= ~bit
+    return property(getter, setter)
+
+
+class StateAttributes:
+    """Legacy Game attribute names backed by Game.state."""
+
+    on_firstbase = _slot_property("first")
+    on_secondbase = _slot_property("second")
+    on_thirdbase = _slot_property("third")
+    currentouts = _slot_property("outs")
+    currentballs = _slot_property("balls")
+    currentstrikes = _slot_property("strikes")
+
+
+for _bit, _attr in enumerate(FLAG_ATTRS):
+    setattr(StateAttributes, _attr, _flag_property(1 << _bit))
+del _bit, _attr
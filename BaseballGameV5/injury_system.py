@@ -7,7 +7,6 @@ This module provides:
 - Application of injury effects to player stats
 """
 
-import random
 from typing import Optional, List, Dict
 
 
@@ -23,15 +22,17 @@ class InjurySystem:
         "Safe": 0.5,
     }
 
-    def __init__(self, injury_adapter, base_rate: float = 0.001):
+    def __init__(self, injury_adapter, rng, base_rate: float = 0.001):
         """
         Initialize the injury system.
 
         Args:
             injury_adapter: InjuryAdapter instance with injury type definitions
+            rng: Random stream for injury rolls (the game's rng.injury)
             base_rate: Base probability of injury per at-bat (default 0.1%)
         """
         self.injury_adapter = injury_adapter
+        self.rng = rng
         self.base_rate = base_rate
         self.injuries_this_game = []
 
@@ -65,7 +66,7 @@ class InjurySystem:
             injury_prob *= 0.8  # Fielding is lower risk
 
         # Roll for injury
-        if random.random() > injury_prob:
+        if self.rng.random() > injury_prob:
             return None
 
         # Player is injured - determine injury type
@@ -82,7 +83,7 @@ class InjurySystem:
             return None
 
         # Random selection
-        roll = random.random() * total_weight
+        roll = self.rng.random() * total_weight
         cumulative = 0
         selected_injury = None
         for i, inj in enumerate(injury_pool):
@@ -95,8 +96,8 @@ class InjurySystem:
             selected_injury = injury_pool[0]
 
         # Calculate duration and effects
-        duration = self.injury_adapter.calculate_injury_duration(selected_injury)
-        effects = self.injury_adapter.calculate_injury_effects(selected_injury)
+        duration = self.injury_adapter.calculate_injury_duration(selected_injury, self.rng)
+        effects = self.injury_adapter.calculate_injury_effects(selected_injury, self.rng)
 
         # Apply effects to player
         applied_effects = self._apply_injury_effects(player, effects)
@@ -154,8 +155,13 @@ class InjurySystem:
                 continue
 
             original = getattr(player, attr_name)
-            modified = original * multiplier
-            setattr(player, attr_name, modified)
+            if player.add_rating_multiplier(attr_name, multiplier):
+                # Persists through later AbilityMod recomputes
+                player.AbilityMod()
+                modified = getattr(player, attr_name)
+            else:
+                modified = original * multiplier
+                setattr(player, attr_name, modified)
 
             applied[attr_name] = {
                 "original": original,
@@ -177,12 +183,13 @@ class InjurySystem:
         self.injuries_this_game = []
 
 
-def create_injury_system(injury_adapter, level_config: dict = None) -> InjurySystem:
+def create_injury_system(injury_adapter, rng, level_config: dict = None) -> InjurySystem:
     """
     Factory function to create an InjurySystem with appropriate settings.
 
     Args:
         injury_adapter: InjuryAdapter instance
+        rng: Random stream for injury rolls
         level_config: Level config with injury rate settings
 
     Returns:
@@ -194,4 +201,4 @@ def create_injury_system(injury_adapter, level_config: dict = None) -> InjurySys
         game_settings = level_config.get("game", {})
         base_rate = game_settings.get("ingame_injury_base_rate", 0.001)
 
-    return InjurySystem(injury_adapter, base_rate)
+    return InjurySystem(injury_adapter, rng, base_rate)
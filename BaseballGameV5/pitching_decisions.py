@@ -0,0 +1,160 @@
+"""
+Online pitching decisions (W/L/S/BS/holds).
+
+PitchingDecisionTracker follows lead changes, pitchers of record and
+relief appearances as each action is processed, so decisions are
+available at any point in the game without replaying the play-by-play.
+
+Rules (simplified):
+- Winning pitcher: pitcher of record when his team takes the final lead
+- Losing pitcher: pitcher who gave up the run that put the opponent ahead for good
+- Save: last pitcher of the winning team, if not the winning pitcher, and
+  the final margin is 3 or less
+- Save situation: a reliever enters with a lead of 1-3 runs, or with the
+  tying run on base, at bat or on deck
+- Blown save: pitcher in a save situation who allows the tying/go-ahead run
+- Hold: reliever who enters in a save situation, records an out and leaves
+  with the lead intact (never the winning or saving pitcher)
+"""
+
+
+# Largest lead a reliever can enter with for a save situation
+SAVE_SITUATION_LEAD = 3
+
+
+class Appearance:
+    """One pitcher's current stint for a team."""
+
+    __slots__ = ("pitcher_id", "save_situation", "outs", "blown")
+
+    def __init__(self, pitcher_id, save_situation: bool):
+        self.pitcher_id = pitcher_id
+        self.save_situation = save_situation
+        self.outs = 0
+        self.blown = False
+
+    def copy(self):
+        clone = Appearance(self.pitcher_id, self.save_situation)
+        clone.outs = self.outs
+        clone.blown = self.blown
+        return clone
+
+
+class PitchingDecisionTracker:
+    """Lead-change and pitcher-of-record tracking for one game."""
+
+    def __init__(self):
+        self.score = {"home": 0, "away": 0}
+        # Pitching team -> current appearance
+        self.appearances = {"home": None, "away": None}
+        # Team -> pitcher credited if that team wins / blamed if it loses
+        self.pitcher_of_record = {"home": None, "away": None}
+        self.losing_pitcher = {"home": None, "away": None}
+        self.blown_saves = []
+        self.holds = []
+
+    def copy(self):
+        """Independent copy (for forked games)."""
+        clone = object.__new__(PitchingDecisionTracker)
+        clone.score = dict(self.score)
+        clone.appearances = {team: appearance.copy() if appearance is not None else None
+                             for team, appearance in self.appearances.items()}
+        clone.pitcher_of_record = dict(self.pitcher_of_record)
+        clone.losing_pitcher = dict(self.losing_pitcher)
+        clone.blown_saves = list(self.blown_saves)
+        clone.holds = list(self.holds)
+        return clone
+
+    def lead(self, team: str) -> int:
+        """Runs the team leads by (negative when trailing)."""
+        other = "away" if team == "home" else "home"
+        return self.score[team] - self.score[other]
+
+    def record(self, top: bool, pitcher_id, runs: int, runners_on: int, outs: int):
+        """
+        Update with one processed action.
+
+        Args:
+            top: Top of the inning (home team pitching)
+            pitcher_id: Id of the pitcher on the mound for the action
+            runs: Runs scored on the action
+            runners_on: Runners on base before the action
+            outs: Outs recorded on the action
+        """
+        pitching = "home" if top else "away"
+        batting = "away" if top else "home"
+
+        appearance = self.appearances[pitching]
+        if pitcher_id is not None and (appearance is None or appearance.pitcher_id != pitcher_id):
+            appearance = self._change_pitcher(pitching, pitcher_id, runners_on)
+        if appearance is not None:
+            appearance.outs += outs
+
+        if runs <= 0:
+            return
+
+        prev_lead = self.lead("home")
+        self.score[batting] += runs
+        new_lead = self.lead("home")
+
+        if prev_lead <= 0 and new_lead > 0:
+            # Home took the lead; the away pitcher who gave it up is on the hook
+            self.pitcher_of_record["home"] = self._pitcher("home")
+            self.losing_pitcher["away"] = self._pitcher("away")
+        elif prev_lead >= 0 and new_lead < 0:
+            self.pitcher_of_record["away"] = self._pitcher("away")
+            self.losing_pitcher["home"] = self._pitcher("home")
+
+        if (appearance is not None and appearance.save_situation and not appearance.blown
+                and self.lead(pitching) <= 0):
+            appearance.blown = True
+            self.blown_saves.append(appearance.pitcher_id)
+
+    def result(self, home_score: int, away_score: int) -> dict:
+        """
+        Decisions as of now (final once the game is over).
+
+        Args:
+            home_score: Home team score
+            away_score: Away team score
+
+        Returns:
+            Dict of winning_pitcher, losing_pitcher, save (player ids or
+            None) and blown_saves, holds (lists of player ids)
+        """
+        winning_pitcher = losing_pitcher = save_pitcher = None
+        if home_score != away_score:
+            winner, loser = ("home", "away") if home_score > away_score else ("away", "home")
+            winning_pitcher = self.pitcher_of_record[winner]
+            losing_pitcher = self.losing_pitcher[loser]
+
+            last_winning_pitcher = self._pitcher(winner)
+            if (last_winning_pitcher is not None and winning_pitcher is not None and
+                    last_winning_pitcher != winning_pitcher and
+                    abs(home_score - away_score) <= SAVE_SITUATION_LEAD):
+                save_pitcher = last_winning_pitcher
+
+        return {
+            "winning_pitcher": winning_pitcher,
+            "losing_pitcher": losing_pitcher,
+            "save": save_pitcher,
+            "blown_saves": list(self.blown_saves),
+            "holds": [pid for pid in self.holds if pid not in (winning_pitcher, save_pitcher)],
+        }
+
+    def _pitcher(self, team: str):
+        appearance = self.appearances[team]
+        return appearance.pitcher_id if appearance is not None else None
+
+    def _change_pitcher(self, team: str, pitcher_id, runners_on: int) -> Appearance:
+        previous = self.appearances[team]
+        lead = self.lead(team)
+        if previous is not None and previous.save_situation and not previous.blown and previous.outs > 0 and lead > 0:
+            self.holds.append(previous.pitcher_id)
+
+        # Starters never enter in a save situation
+        save_situation = previous is not None and 0 < lead and (
+            lead <= SAVE_SITUATION_LEAD or lead <= runners_on + 2
+        )
+        appearance = self.appearances[team] = Appearance(pitcher_id, save_situation)
+        return appearance
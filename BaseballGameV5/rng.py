@@ -0,0 +1,72 @@
+"""
+Per-game random number generation.
+
+Every Game owns a GameRNG instead of drawing from the process-global
+`random` / `numpy.random` state. The game seed is split into independent
+child streams, one per simulation phase, so:
+- games can run concurrently on threads, processes or machines and still
+  reproduce exactly from their seed
+- extra or fewer draws in one phase never shift the sequence of another
+"""
+
+import hashlib
+import random
+import secrets
+
+
+class GameRNG:
+    """Root RNG for one game, holding a child stream per simulation phase."""
+
+    # Child streams derived from the game seed
+    STREAMS = ("pitch", "batted_ball", "defense", "baserunning", "injury")
+
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed: Game seed (int or str). A random seed is drawn when None.
+        """
+        if seed is None:
+            seed = secrets.randbits(64)
+        self.seed = seed
+
+        self.pitch = self.spawn("pitch")
+        self.batted_ball = self.spawn("batted_ball")
+        self.defense = self.spawn("defense")
+        self.baserunning = self.spawn("baserunning")
+        self.injury = self.spawn("injury")
+
+    @staticmethod
+    def split_seed(seed, name: str) -> int:
+        """
+        Derive a child seed from a parent seed and a stream name.
+
+        Args:
+            seed: Parent seed
+            name: Child stream name
+
+        Returns:
+            64-bit child seed
+        """
+        digest = hashlib.blake2b(f"{seed}/{name}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+    def spawn(self, name: str) -> random.Random:
+        """
+        Create an independent child stream for the given name.
+
+        Args:
+            name: Stream name (same name always yields the same sequence)
+
+        Returns:
+            random.Random seeded from the game seed and the name
+        """
+        return random.Random(GameRNG.split_seed(self.seed, name))
+
+    def getstate(self) -> dict:
+        """Capture the state of every child stream."""
+        return {name: getattr(self, name).getstate() for name in self.STREAMS}
+
+    def setstate(self, state: dict):
+        """Restore child streams captured with getstate()."""
+        for name, stream_state in state.items():
+            getattr(self, name).setstate(stream_state)
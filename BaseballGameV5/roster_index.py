@@ -0,0 +1,64 @@
+"""
+Indexed roster lookups for a Team.
+
+RosterIndex maps player id -> player, fielding position -> fielder in the
+lineup and player id -> strategy entry, so the per-pitch and per-throw
+lookups (steal and pickoff frequencies, pitcher strategy, covering
+fielders, targeted defenders) are dict hits instead of list scans.
+
+Entries keep the first match of the list they were built from, like the
+scans they replace. Team keeps the index in sync when it substitutes a
+player; code that rearranges a lineup by hand calls rebuild().
+"""
+
+
+class RosterIndex:
+    """Id, position and strategy maps over one team."""
+
+    __slots__ = ("players", "fielders", "strategies")
+
+    def __init__(self, team):
+        """
+        Args:
+            team: Team with roster.playerlist, battinglist and strategy set
+        """
+        self.players = {}
+        self.fielders = {}
+        self.strategies = {}
+        self.rebuild(team)
+
+    def rebuild(self, team):
+        """Re-read every map from the team."""
+        self.players.clear()
+        for player in team.roster.playerlist:
+            self.players.setdefault(player.id, player)
+
+        self.fielders.clear()
+        for player in team.battinglist:
+            self.fielders.setdefault(player.lineup, player)
+
+        self.strategies.clear()
+        for strat in team.strategy.playerstrategy:
+            self.strategies.setdefault(strat.id, strat)
+
+    def player(self, player_id):
+        """Player with this id (None if not on the roster)."""
+        return self.players.get(player_id)
+
+    def fielder(self, position: str):
+        """Lineup player at a position, e.g. 'shortstop' (None if nobody plays it)."""
+        return self.fielders.get(position)
+
+    def strategy(self, player_id):
+        """Strategy entry of a player (KeyError if the player has none)."""
+        return self.strategies[player_id]
+
+    def substitute(self, incoming):
+        """
+        Record a lineup substitution (incoming takes over the position).
+
+        Args:
+            incoming: Player entering the lineup, with lineup already set
+        """
+        self.fielders[incoming.lineup] = incoming
+        self.players.setdefault(incoming.id, incoming)
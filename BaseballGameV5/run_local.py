@@ -11,6 +11,12 @@ Usage:
     python run_local.py input.json -o output.json --compact --no-debug
     python run_local.py input.json -o output.json.gz --compress
     python run_local.py input.json --split  # Creates output_a.json, output_b.json, etc.
+    python run_local.py input.json --log-level pa  # Print one line per plate appearance
+    python run_local.py input.json --expectancy  # WPA/leverage per play (see expectancy.py)
+    python run_local.py input.json --outcome-only  # Scores, box scores and injuries only
+    python run_local.py input.json --pa-sampling  # Sample PAs from matchup distributions (not faster)
+    python run_local.py input.json --surrogate-defense  # Sampled defense (see surrogate_defense.py)
+    python run_local.py input.json --timing-diagnostics 10  # Timing diagnostics on every 10th ball in play
 """
 
 import os
@@ -18,11 +24,14 @@ import sys
 import json
 import gzip
 import argparse
+import logging
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import Game
+from event_log import export_logger
+from game_options import GameOptions
 
 
 # Default configurations
@@ -60,7 +69,7 @@ def load_json_file(filepath: str) -> dict:
 
 def run_single_game(game_data: dict, rules: dict, level_config: dict,
                     game_constants: dict, injury_types: list = None,
-                    include_debug: bool = True) -> dict:
+                    options: GameOptions = None) -> dict:
     """
     Run a single game simulation.
 
@@ -70,11 +79,15 @@ def run_single_game(game_data: dict, rules: dict, level_config: dict,
         level_config: Level-specific configuration
         game_constants: Shared game constants
         injury_types: Injury type definitions
-        include_debug: Whether to include debug data in output
+        options: Sections, logging and engine modes (None = all sections,
+                 default modes); LookupError when surrogate defense is
+                 requested and the level has no tables
 
     Returns:
         Game result dictionary
     """
+    if options is None:
+        options = GameOptions()
     game = Game.Game.from_endpoint(
         payload=game_data,
         rules=rules,
@@ -82,25 +95,19 @@ def run_single_game(game_data: dict, rules: dict, level_config: dict,
         game_constants=game_constants,
         injury_types=injury_types
     )
-
-    result = game.run_simulation()
-
-    # Remove debug section if not requested (saves significant memory/disk)
-    if not include_debug and 'debug' in result:
-        del result['debug']
-
-    return result
+    game.apply_options(options, level_config, game_constants, rules)
+    return game.run_simulation(options.sections)
 
 
 def process_payload(payload: dict, verbose: bool = False,
-                    include_debug: bool = True) -> dict:
+                    options: GameOptions = None) -> dict:
     """
     Process a unified payload (works for both single game and batch).
 
     Args:
         payload: The unified payload structure
         verbose: Print detailed output
-        include_debug: Whether to include debug data in output
+        options: Sections, logging and engine modes for every game
 
     Returns:
         Results dict with subweeks, counts, errors
@@ -141,7 +148,7 @@ def process_payload(payload: dict, verbose: bool = False,
                     level_config=level_config,
                     game_constants=game_constants,
                     injury_types=injury_types,
-                    include_debug=include_debug
+                    options=options
                 )
 
                 results[subweek_name].append(result)
@@ -294,6 +301,42 @@ def main():
         action="store_true",
         help="Exclude debug section from output (significantly reduces size)"
     )
+    parser.add_argument(
+        "--log-level",
+        choices=["off", "pa", "pitch"],
+        default="off",
+        help="Print game events per plate appearance or per pitch (default: off)"
+    )
+    parser.add_argument(
+        "--expectancy",
+        action="store_true",
+        help="Add WPA and leverage to play-by-play (tables from expectancy.py)"
+    )
+    parser.add_argument(
+        "--outcome-only",
+        action="store_true",
+        help="Fast season mode: scores, box scores and injuries only (same results per seed)"
+    )
+    parser.add_argument(
+        "--pa-sampling",
+        action="store_true",
+        help="Sample plate appearances from cached per-matchup outcome distributions "
+             "(alternative pitch model; no meaningful speedup)"
+    )
+    parser.add_argument(
+        "--surrogate-defense",
+        action="store_true",
+        help="Sample balls in play from cached tables (generate with surrogate_defense.py)"
+    )
+    parser.add_argument(
+        "--timing-diagnostics",
+        type=int,
+        nargs="?",
+        const=1,
+        default=0,
+        metavar="N",
+        help="Timing diagnostics on every Nth ball in play (no N: every one; default: off)"
+    )
     parser.add_argument(
         "--split",
         action="store_true",
@@ -331,8 +374,22 @@ def main():
             print(f"  Subweek {sw}: {len(games)} game(s)")
 
     # Process payload
-    include_debug = not args.no_debug
-    results = process_payload(payload, verbose=args.verbose, include_debug=include_debug)
+    if args.log_level != "off":
+        export_logger(logging.StreamHandler(sys.stdout))
+    # Skip building the debug section entirely if not requested
+    # (saves significant time, memory and disk)
+    sections = tuple(section for section in Game.Game.OPTIONAL_SECTIONS
+                     if section != "debug" or not args.no_debug)
+    options = GameOptions(
+        sections=sections,
+        log_level=args.log_level,
+        expectancy=args.expectancy,
+        outcome_only=args.outcome_only,
+        pa_sampling=args.pa_sampling,
+        surrogate_defense=args.surrogate_defense,
+        timing_diagnostics=args.timing_diagnostics
+    )
+    results = process_payload(payload, verbose=args.verbose, options=options)
 
     # Summary
     print()
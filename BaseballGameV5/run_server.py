@@ -3,6 +3,20 @@ Server entry point for Railway deployment.
 
 Run with: python run_server.py
 or: uvicorn run_server:app --host 0.0.0.0 --port 8000
+
+Set SIM_POOL_WORKERS=<n> to simulate games in parallel across n worker
+processes (default 0 runs every game serially in the server process).
+Set SIM_POOL_MODE=thread to use n threads in the server process instead;
+on free-threaded Python (3.13t) they run games on every core without
+pickling payloads to subprocesses.
+
+Set SIM_LOG_LEVEL=pa|pitch to log game events to stderr through a
+background listener (default off: no event records are built).
+
+Background jobs (/jobs) are held in the memory of one server process, so
+the server refuses to start with WEB_CONCURRENCY > 1 while they are
+enabled. Scale games with SIM_POOL_WORKERS, or set SIM_JOBS=off to run
+several server workers without the /jobs endpoints.
 """
 
 import os
@@ -13,6 +27,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import uvicorn
 from api.app import app
+from api.jobs import MULTI_WORKER_MESSAGE, jobs_enabled_from_env, web_workers_from_env
 
 # Re-export app for uvicorn
 __all__ = ["app"]
@@ -22,6 +37,11 @@ if __name__ == "__main__":
     # Get port from environment (Railway sets this)
     port = int(os.environ.get("PORT", 8000))
     host = os.environ.get("HOST", "0.0.0.0")
+    # Each game draws from its own seeded RNG, so results are deterministic
+    # regardless of how many server workers handle requests
+    workers = web_workers_from_env()
+    if workers > 1 and jobs_enabled_from_env():
+        sys.exit(f"Error: {MULTI_WORKER_MESSAGE}")
 
     print(f"Starting Baseball Simulation API on {host}:{port}")
 
@@ -30,5 +50,5 @@ if __name__ == "__main__":
         host=host,
         port=port,
         reload=False,
-        workers=1,  # Single worker for deterministic results
+        workers=workers,
     )
@@ -0,0 +1,243 @@
+"""
+Game snapshots and forks for mid-game Monte Carlo.
+
+A GameSnapshot captures a running Game between actions as a compact state
+encoding: the game and team scalars, player references as ids, each
+player's attribute dict with copies of its stat and pitch records, and
+the RNG stream states. Config objects (frozen Baselines, Rules, team
+strategy, injury definitions) and recorded play-by-play events are
+immutable and shared, never copied.
+
+fork() rebuilds an independent Game from the snapshot with plain dict
+copies instead of copy.deepcopy. Pitches and rating multipliers are
+copy-on-write (shared until a fork rewrites them), so thousands of forks
+per second can be built and played to completion. Without a seed a fork
+continues the original RNG streams exactly (it replays what the original
+game would have done); with a seed each fork gets its own streams.
+"""
+
+import Action
+from Player import Player
+from event_log import EventLog, OFF
+from rng import GameRNG
+from roster_index import RosterIndex
+from defense import fielding
+from Steals import BaserunningEngine
+
+
+# Game attributes that reference players
+GAME_PLAYER_ATTRS = ("targeted_defender",)
+# GameState slots that reference players
+STATE_RUNNER_SLOTS = ("first", "second", "third")
+# Game lists that grow during play (copied per fork)
+GAME_LIST_ATTRS = ("actions", "overallresults", "ingame_injury_reports")
+# Per-game caches and helpers rebuilt (or recreated lazily) for each fork
+GAME_RESET_ATTRS = (
+    "rng", "state", "hometeam", "awayteam", "battingteam", "pitchingteam", "current_runners_home",
+    "matchup_cache", "players_by_id", "analytics", "decision_tracker", "event_log",
+    "meta", "_injury_system", "play_resolver", "baserunning_engine"
+)
+
+PLAYER_STAT_ATTRS = ("battingstats", "fieldingstats", "pitchingstats")
+# Team attributes rebuilt for each fork rather than captured
+TEAM_REBUILT_ATTRS = ("roster", "index")
+
+
+def copy_record(record):
+    """Copy a flat attribute-only object (stats line, pitch) without deepcopy."""
+    clone = object.__new__(type(record))
+    clone.__dict__ = record.__dict__.copy()
+    return clone
+
+
+class TeamState:
+    """Team attributes with player references stored as ids."""
+
+    __slots__ = ("team_class", "shared", "refs", "lists", "roster")
+
+    def __init__(self, team):
+        self.team_class = type(team)
+        self.shared = {}
+        self.refs = {}
+        self.lists = {}
+        for attr, value in team.__dict__.items():
+            if attr in TEAM_REBUILT_ATTRS:
+                continue
+            if isinstance(value, Player):
+                self.refs[attr] = value.id
+            elif isinstance(value, list) and all(isinstance(p, Player) for p in value):
+                self.lists[attr] = [p.id for p in value]
+            else:
+                self.shared[attr] = value
+        self.roster = (team.roster, [p.id for p in team.roster.playerlist])
+
+    def build(self, players: dict):
+        team = object.__new__(self.team_class)
+        team.__dict__.update(self.shared)
+        for attr, pid in self.refs.items():
+            setattr(team, attr, players[pid])
+        for attr, ids in self.lists.items():
+            setattr(team, attr, [players[pid] for pid in ids])
+
+        roster, ids = self.roster
+        team.roster = copy_record(roster)
+        team.roster.playerlist = [players[pid] for pid in ids]
+        team.index = RosterIndex(team)
+        return team
+
+
+class GameSnapshot:
+    """Compact, immutable capture of a Game between actions."""
+
+    def __init__(self, game):
+        """
+        Args:
+            game: Game to capture (must be between actions)
+        """
+        self.game_class = type(game)
+        self.rng_seed = game.rng.seed
+        self.rng_state = game.rng.getstate()
+
+        self.players = {}
+        for team in (game.awayteam, game.hometeam):
+            for player in team.roster.playerlist:
+                self.players[player.id] = self._capture_player(player)
+
+        self.teams = {"away": TeamState(game.awayteam), "home": TeamState(game.hometeam)}
+        self.batting_home = game.battingteam is game.hometeam
+
+        self.state = {}
+        for attr, value in game.__dict__.items():
+            if attr in GAME_RESET_ATTRS:
+                continue
+            if attr in GAME_PLAYER_ATTRS and isinstance(value, Player):
+                value = PlayerRef(value.id)
+            elif attr in GAME_LIST_ATTRS:
+                value = tuple(value)
+            self.state[attr] = value
+        self.game_state = game.state.copy()
+        for slot in STATE_RUNNER_SLOTS:
+            runner = getattr(self.game_state, slot)
+            if runner is not None:
+                setattr(self.game_state, slot, PlayerRef(runner.id))
+        self.runners_home = tuple(p.id for p in game.current_runners_home)
+        self.decision_tracker = game.decision_tracker.copy()
+
+    @staticmethod
+    def _capture_player(player):
+        attrs = dict(player.__dict__)
+        for attr in PLAYER_STAT_ATTRS + Player.PITCH_ATTRS:
+            attrs[attr] = copy_record(attrs[attr])
+        # Forks share the captured pitches until they rewrite them
+        attrs["shared_pitches"] = True
+        if isinstance(player.on_base_pitcher, Player):
+            attrs["on_base_pitcher"] = PlayerRef(player.on_base_pitcher.id)
+        return attrs
+
+    def fork(self, seed=None):
+        """
+        Build an independent Game from the snapshot.
+
+        Args:
+            seed: None to continue the captured RNG streams exactly, or a
+                  seed for fresh streams (use a different seed per fork)
+
+        Returns:
+            Game ready to be played on with Action.Action / run_simulation
+        """
+        players = {}
+        for pid, attrs in self.players.items():
+            player = object.__new__(Player)
+            player.__dict__ = attrs.copy()
+            for attr in PLAYER_STAT_ATTRS:
+                setattr(player, attr, copy_record(attrs[attr]))
+            players[pid] = player
+        for player in players.values():
+            if isinstance(player.on_base_pitcher, PlayerRef):
+                player.on_base_pitcher = players[player.on_base_pitcher.pid]
+
+        game = object.__new__(self.game_class)
+        game.__dict__.update(self.state)
+        for attr in GAME_PLAYER_ATTRS:
+            value = getattr(game, attr, None)
+            if isinstance(value, PlayerRef):
+                setattr(game, attr, players[value.pid])
+        for attr in GAME_LIST_ATTRS:
+            if attr in self.state:
+                setattr(game, attr, list(self.state[attr]))
+        game.state = self.game_state.copy()
+        for slot in STATE_RUNNER_SLOTS:
+            runner = getattr(game.state, slot)
+            if runner is not None:
+                setattr(game.state, slot, players[runner.pid])
+
+        if seed is None:
+            game.rng = GameRNG(self.rng_seed)
+            game.rng.setstate(self.rng_state)
+        else:
+            game.rng = GameRNG(seed)
+
+        game.awayteam = self.teams["away"].build(players)
+        game.hometeam = self.teams["home"].build(players)
+        if self.batting_home:
+            game.battingteam, game.pitchingteam = game.hometeam, game.awayteam
+        else:
+            game.battingteam, game.pitchingteam = game.awayteam, game.hometeam
+        game.current_runners_home = [players[pid] for pid in self.runners_home]
+
+        game.matchup_cache = {}
+        game.play_resolver = fielding(game)
+        game.baserunning_engine = BaserunningEngine(game)
+        game.players_by_id = players
+        game.analytics = None
+        game.decision_tracker = self.decision_tracker.copy()
+        game.event_log = EventLog(OFF)
+        game.meta = self.game_class.GameResult(game.gname, game.hometeam, game.awayteam, game.actions)
+        return game
+
+    def play_out(self, seed=None):
+        """
+        Fork and play the fork to the end of the game.
+
+        Args:
+            seed: See fork()
+
+        Returns:
+            The finished Game
+        """
+        game = self.fork(seed)
+        game.record_actions = False
+        while not game.gamedone:
+            Action.Action(game)
+        return game
+
+    def win_probability(self, forks: int, seed=None) -> float:
+        """
+        Estimate the home team's win probability from the captured state.
+
+        Args:
+            forks: Number of forks to play out
+            seed: Base seed; fork i is seeded from (seed, i). None uses the
+                  captured game seed, so the estimate is reproducible.
+
+        Returns:
+            Share of forks the home team wins (ties count half)
+        """
+        base = self.rng_seed if seed is None else seed
+        wins = 0.0
+        for i in range(forks):
+            game = self.play_out(GameRNG.split_seed(base, f"fork/{i}"))
+            if game.hometeam.score > game.awayteam.score:
+                wins += 1
+            elif game.hometeam.score == game.awayteam.score:
+                wins += 0.5
+        return wins / forks if forks else 0.0
+
+
+class PlayerRef:
+    """Player id stand-in inside captured state."""
+
+    __slots__ = ("pid",)
+
+    def __init__(self, pid):
+        self.pid = pid
@@ -0,0 +1,609 @@
+"""
+Surrogate defense: pre-tabulated ball-in-play outcome distributions.
+
+For season-scale runs a game can resolve balls in play by sampling from
+empirical tables instead of running the defensive decision tree. Tables
+are generated per level config by recording what the full engine does
+with every ball in play over many simulated games, keyed by:
+
+- contact type, depth and direction of the ball
+- base-out state before the play (see GameState.base_out)
+- bucketed rating of the targeted fielder (reaction, spotting, catching)
+- bucketed speed of the batter
+
+Each cell holds the observed outcomes: hit type, where the batter and
+every runner ended up (base, scored or out), errors and the putouts,
+assists and errors credited to each fielding role. Cells seen fewer than
+MIN_CELL_SAMPLES times fall back to coarser keys (without the rating
+buckets, then without the direction); situations not tabulated at all are
+resolved by the full engine.
+
+Built tables are cached on disk keyed by a fingerprint of the level
+config, game constants and rules, like the expectancy tables. Tables are
+only cached once they pass validation: out-of-sample games played with
+the tables must stay within FIDELITY_LIMITS of the full engine. A game
+with tables attached (game.surrogate_defense) samples one outcome per
+ball in play from the game's defense random stream.
+
+The mode is experimental. Sampling resolves a ball in play a few times
+faster than the decision tree, but play resolution is a small part of a
+game, so whole games run only modestly faster.
+
+Usage:
+    python surrogate_defense.py <payload.json> --level 9 --games 2000
+    python surrogate_defense.py <payload.json> --level 9 --validate 500
+"""
+
+import os
+import sys
+import time
+import argparse
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from table_cache import TableCache, simulate_level_games
+from codes import SITUATION_NAMES
+
+
+# Bump when the table layout or generation changes (invalidates the cache)
+TABLE_VERSION = 2
+
+# Rating bucket edges (ratings are 20-80): below, between, above
+RATING_EDGES = (45, 55)
+# Cells seen fewer times than this use a coarser key
+MIN_CELL_SAMPLES = 30
+# Runner destination of a runner put out on the play
+OUT = -1
+# Fielding stats a play can credit
+CREDIT_STATS = ("putouts", "assists", "catching_errors", "throwing_errors")
+# Role of the targeted defender in credits (other fielders use their position)
+FIELDER_ROLE = "fielder"
+PITCHER_ROLE = "pitcher"
+
+DEFAULT_GAMES = 2000
+DEFAULT_VALIDATION_GAMES = 200
+# Fewest balls in play behind tables that may be cached
+MIN_TABLE_PLAYS = 20000
+# Largest validation drift from the full engine for tables to be cached:
+# relative for per-game rates, absolute for shares of balls in play
+FIDELITY_LIMITS = {
+    "runs_per_game": 0.05,
+    "hits_per_game": 0.05,
+    "babip_share": 0.015,
+    "fallback_share": 0.10,
+}
+CACHE_DIR_ENV = "SURROGATE_DEFENSE_CACHE_DIR"
+
+
+def rating_bucket(rating) -> int:
+    """Bucket of a 20-80 rating: 0 below, 1 between, 2 above RATING_EDGES."""
+    return (rating >= RATING_EDGES[0]) + (rating > RATING_EDGES[1])
+
+
+def fielder_bucket(fielder) -> int:
+    """Rating bucket of the targeted defender (-1 when there is none)."""
+    if fielder is None:
+        return -1
+    return rating_bucket((fielder.fieldreact + fielder.fieldspot + fielder.fieldcatch) / 3)
+
+
+def cell_key(play) -> tuple:
+    """
+    Finest table key of a ball in play.
+
+    Args:
+        play: defense.fielding with depth, direction and defender picked
+
+    Returns:
+        (contact, depth, direction, base_out, fielder bucket, speed bucket)
+    """
+    game = play.gamestate.game
+    return (play.contact_code, play.depth_code, play.direction_code, game.state.base_out,
+            fielder_bucket(play.fieldingdefender),
+            rating_bucket(game.battingteam.currentbatter.speed))
+
+
+def coarse_keys(key: tuple) -> tuple:
+    """Fallback keys of a cell, finest first."""
+    contact, depth, direction, base_out_code = key[:4]
+    return key, (contact, depth, direction, base_out_code), (contact, depth, base_out_code)
+
+
+class SurrogateRecorder:
+    """
+    Records the outcome of every ball in play the full engine resolves.
+
+    Attached as game.surrogate_defense during table generation: apply()
+    captures the situation and lets the decision tree run, observe() reads
+    what it did.
+    """
+
+    def __init__(self, counts: dict = None):
+        """
+        Args:
+            counts: Cell key -> Counter of outcomes to add to (shared
+                    between the games of one generation run)
+        """
+        self.counts = {} if counts is None else counts
+        self._pending = None
+
+    def apply(self, play) -> bool:
+        """Capture the pre-play situation; the full engine resolves the play."""
+        game = play.gamestate.game
+        state = game.state
+        team = game.pitchingteam
+        fielders = list(team.battinglist)
+        if team.currentpitcher not in fielders:
+            fielders.append(team.currentpitcher)
+        before = [tuple(getattr(player.fieldingstats, stat) for stat in CREDIT_STATS)
+                  for player in fielders]
+        runners = (game.battingteam.currentbatter, state.first, state.second, state.third)
+        self._pending = (cell_key(play), runners, play.fieldingdefender, fielders, before, game.outcount)
+        return False
+
+    def observe(self, play):
+        """Record the resolved play against the situation captured by apply()."""
+        key, runners, defender, fielders, before, outcount = self._pending
+        self._pending = None
+        game = play.gamestate.game
+
+        result = play.result
+        first, second, third, scored = result.first, result.second, result.third, result.scored
+        destinations = []
+        for runner in runners:
+            if runner is None:
+                destinations.append(None)
+            elif runner is first:
+                destinations.append(1)
+            elif runner is second:
+                destinations.append(2)
+            elif runner is third:
+                destinations.append(3)
+            elif any(runner is player for player in scored):
+                destinations.append(4)
+            else:
+                destinations.append(OUT)
+
+        credits = []
+        pitcher = game.pitchingteam.currentpitcher
+        for player, counts in zip(fielders, before):
+            if player is defender:
+                role = FIELDER_ROLE
+            elif player is pitcher:
+                role = PITCHER_ROLE
+            else:
+                role = player.lineup
+            stats = player.fieldingstats
+            for stat, count in zip(CREDIT_STATS, counts):
+                added = getattr(stats, stat) - count
+                if added:
+                    credits.append((role, stat, added))
+
+        outcome = (result.outcome, tuple(destinations), game.outcount - outcount,
+                   len(play.errorlist), tuple(sorted(credits)))
+        self.counts.setdefault(key, Counter())[outcome] += 1
+
+
+class SurrogateDefense:
+    """Ball-in-play outcome tables for one level config."""
+
+    def __init__(self, cells: dict, games: int = 0, plays: int = 0, key: str = None):
+        """
+        Args:
+            cells: Cell key (any level of coarse_keys()) -> (outcomes,
+                   cumulative counts) for every cell with enough samples
+            games: Number of simulated games behind the tables
+            plays: Number of balls in play behind the tables
+            key: Config fingerprint the tables were built for
+        """
+        self.cells = cells
+        self.games = games
+        self.plays = plays
+        self.key = key
+
+    @classmethod
+    def from_counts(cls, counts: dict, games: int = 0, key: str = None):
+        """
+        Build tables from recorded outcome counts.
+
+        Args:
+            counts: Finest cell key -> Counter of outcomes (SurrogateRecorder.counts)
+            games: Number of games recorded
+            key: Config fingerprint to record
+
+        Returns:
+            SurrogateDefense
+        """
+        merged = {}
+        for finest, outcomes in counts.items():
+            for key_ in coarse_keys(finest):
+                merged.setdefault(key_, Counter()).update(outcomes)
+
+        cells = {}
+        for key_, outcomes in merged.items():
+            if sum(outcomes.values()) >= MIN_CELL_SAMPLES:
+                # Most common first keeps the average bisect short
+                ordered = outcomes.most_common()
+                cells[key_] = (tuple(outcome for outcome, _ in ordered),
+                               list(accumulate(count for _, count in ordered)))
+        plays = sum(sum(outcomes.values()) for outcomes in counts.values())
+        return cls(cells, games, plays, key)
+
+    def lookup(self, key: tuple):
+        """(outcomes, cumulative counts) of the finest tabulated cell, or None."""
+        cells = self.cells
+        for key_ in coarse_keys(key):
+            cell = cells.get(key_)
+            if cell is not None:
+                return cell
+        return None
+
+    def apply(self, play) -> bool:
+        """
+        Resolve a ball in play from the tables.
+
+        Args:
+            play: defense.fielding with depth, direction and defender picked
+
+        Returns:
+            True if the play was sampled, False if its situation is not
+            tabulated (the full engine resolves it)
+        """
+        cell = self.lookup(cell_key(play))
+        if cell is None:
+            return False
+        outcomes, cumulative = cell
+        result, destinations, outs, errors, credits = outcomes[
+            bisect_right(cumulative, play.rng.random() * cumulative[-1])
+        ]
+
+        game = play.gamestate.game
+        state = game.state
+        runners = (game.battingteam.currentbatter, state.first, state.second, state.third)
+        bases = [None, None, None]
+        for runner, base in zip(runners, destinations):
+            if base is None or base == OUT:
+                continue
+            if base >= 4:
+                play.scored.append(runner)
+            else:
+                bases[base - 1] = runner
+
+        team = game.pitchingteam
+        for role, stat, count in credits:
+            if role == FIELDER_ROLE:
+                player = play.fieldingdefender
+            elif role == PITCHER_ROLE:
+                player = team.currentpitcher
+            else:
+                player = team.index.fielder(role) or team.currentpitcher
+            player.fieldingstats.Adder(stat, count)
+            if play.describe and stat in ("catching_errors", "throwing_errors"):
+                play.defensiveactions.append(f"error by {player.lineup} {player.name}")
+
+        game.outcount += outs
+        play.errorlist.extend(["error"] * errors)
+        if play.depth != 'homerun':
+            play.catch_probability = play.compiled.catch_rates[play.contact_code][play.situation_code]
+        if play.describe:
+            play.defensiveactions.append(f"{result} (surrogate, {SITUATION_NAMES[play.situation_code]})")
+        play.result.outcome = result
+        play.result.first, play.result.second, play.result.third = bases
+        return True
+
+    def observe(self, play):
+        """Plays the tables could not resolve are not recorded."""
+
+    def to_dict(self) -> dict:
+        return {
+            "version": TABLE_VERSION,
+            "key": self.key,
+            "games": self.games,
+            "plays": self.plays,
+            "cells": [
+                [list(key_), [[result, list(destinations), outs, errors, [list(credit) for credit in credits]]
+                              for result, destinations, outs, errors, credits in outcomes], cumulative]
+                for key_, (outcomes, cumulative) in self.cells.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        cells = {}
+        for key_, outcomes, cumulative in data["cells"]:
+            cells[tuple(key_)] = (
+                tuple((result, tuple(destinations), outs, errors, tuple(tuple(credit) for credit in credits))
+                      for result, destinations, outs, errors, credits in outcomes),
+                cumulative
+            )
+        return cls(cells, data.get("games", 0), data.get("plays", 0), data.get("key"))
+
+
+# ----------------------------------------------------------------------
+# Generation and disk cache
+# ----------------------------------------------------------------------
+
+TABLE_CACHE = TableCache("surrogate_defense", TABLE_VERSION, SurrogateDefense, CACHE_DIR_ENV)
+
+
+def simulate_games(game_payloads: list, rules: dict, level_config: dict, game_constants: dict,
+                   games: int, seed=0, surrogate=None, stream: str = "surrogate"):
+    """
+    Simulate outcome-only games with a surrogate defense hook attached.
+
+    Args:
+        game_payloads: Game payloads (rosters) to cycle through
+        rules: Rules dict for the level
+        level_config: Level config
+        game_constants: Game constants
+        games: Number of games to simulate
+        seed: Base seed; game i is seeded from (seed, stream/i)
+        surrogate: Object attached as game.surrogate_defense (None = full engine)
+        stream: Seed stream name
+
+    Yields:
+        Each finished game
+    """
+    def prepare(game):
+        game.outcome_only = True
+        game.surrogate_defense = surrogate
+
+    return simulate_level_games(game_payloads, rules, level_config, game_constants,
+                                games, seed, stream, prepare)
+
+
+def generate_tables(game_payloads: list, rules: dict, level_config: dict, game_constants: dict,
+                    games: int = DEFAULT_GAMES, seed=0, save: bool = True) -> SurrogateDefense:
+    """
+    Simulate a level with the full defense engine and build (and cache) its tables.
+
+    Args:
+        game_payloads: Game payloads (rosters) to cycle through
+        rules: Rules dict for the level
+        level_config: Level config
+        game_constants: Game constants
+        games: Number of games to simulate
+        seed: Base seed for the simulated games
+        save: Validate the tables against the full engine and write them
+              to the disk cache
+
+    Returns:
+        SurrogateDefense
+
+    Raises:
+        ValueError: save was set and the tables failed validation
+    """
+    key = TABLE_CACHE.key(level_config, game_constants, rules)
+    recorder = SurrogateRecorder()
+    for _ in simulate_games(game_payloads, rules, level_config, game_constants, games, seed, recorder):
+        pass
+    tables = SurrogateDefense.from_counts(recorder.counts, games, key)
+    if save:
+        report = run_validation(game_payloads, rules, level_config, game_constants,
+                                tables, seed=seed + 1)
+        save_validated(tables, report)
+    return tables
+
+
+def save_validated(tables: SurrogateDefense, report: dict) -> str:
+    """
+    Write tables to the disk cache if they passed validation.
+
+    Args:
+        tables: Tables to cache
+        report: run_validation() report of the tables
+
+    Returns:
+        Path written
+
+    Raises:
+        ValueError: The tables failed validation (see fidelity_failures())
+    """
+    failures = fidelity_failures(tables, report)
+    if failures:
+        raise ValueError("surrogate defense tables failed validation: " + "; ".join(failures))
+    return TABLE_CACHE.save(tables)
+
+
+# ----------------------------------------------------------------------
+# Validation against the full engine
+# ----------------------------------------------------------------------
+
+class PlayTally:
+    """
+    Surrogate hook that times play resolution and tallies outcomes.
+
+    Wraps the tables under test (None = full engine): the time from apply()
+    to the end of the play is resolution time, whichever engine resolved it.
+    """
+
+    def __init__(self, tables: SurrogateDefense = None):
+        self.tables = tables
+        self.seconds = 0.0
+        self.sampled_seconds = 0.0
+        self.plays = 0
+        self.sampled = 0
+        self.fallbacks = 0
+        self.results = Counter()
+        self.outs = Counter()
+        self.errors = 0
+        self._start = None
+
+    def apply(self, play) -> bool:
+        start = time.perf_counter()
+        outcount = play.gamestate.game.outcount
+        if self.tables is not None and self.tables.apply(play):
+            elapsed = time.perf_counter() - start
+            self.seconds += elapsed
+            self.sampled_seconds += elapsed
+            self.sampled += 1
+            self._tally(play, outcount)
+            return True
+        self.fallbacks += self.tables is not None
+        self._start = (start, outcount)
+        return False
+
+    def observe(self, play):
+        start, outcount = self._start
+        self.seconds += time.perf_counter() - start
+        self._tally(play, outcount)
+
+    def _tally(self, play, outcount):
+        self.plays += 1
+        self.results[play.result.outcome] += 1
+        self.outs[play.gamestate.game.outcount - outcount] += 1
+        self.errors += bool(play.errorlist)
+
+
+def run_validation(game_payloads: list, rules: dict, level_config: dict, game_constants: dict,
+                   tables: SurrogateDefense, games: int = DEFAULT_VALIDATION_GAMES, seed=1) -> dict:
+    """
+    Play the same seeded games with the full engine and with the tables.
+
+    Seeds differ from generation's, so the tables are tested out of sample.
+
+    Returns:
+        {"full": summary, "surrogate": summary}, each with per-game run,
+        hit and error rates, per-ball-in-play outcome shares and timings
+    """
+    report = {}
+    for name, hook_tables in (("full", None), ("surrogate", tables)):
+        tally = PlayTally(hook_tables)
+        runs = 0
+        start = time.perf_counter()
+        for game in simulate_games(game_payloads, rules, level_config, game_constants,
+                                   games, seed, tally, stream="validate"):
+            runs += game.hometeam.score + game.awayteam.score
+        elapsed = time.perf_counter() - start
+        plays = tally.plays or 1
+        hits = sum(tally.results[result] for result in ("single", "double", "triple", "homerun"))
+        report[name] = {
+            "runs_per_game": runs / games,
+            "bip_per_game": tally.plays / games,
+            "hits_per_game": hits / games,
+            "babip_share": {result: tally.results[result] / plays
+                            for result in ("out", "single", "double", "triple", "homerun")},
+            "multi_out_share": sum(count for outs, count in tally.outs.items() if outs >= 2) / plays,
+            "error_share": tally.errors / plays,
+            "fallback_share": tally.fallbacks / plays,
+            "us_per_play": tally.seconds * 1e6 / plays,
+            "us_per_sampled_play": tally.sampled_seconds * 1e6 / (tally.sampled or 1),
+            "ms_per_game": elapsed * 1e3 / games,
+        }
+    return report
+
+
+def fidelity_failures(tables: SurrogateDefense, report: dict) -> list:
+    """
+    Ways tables fall short of the full engine (see FIDELITY_LIMITS).
+
+    Args:
+        tables: Tables that were validated
+        report: run_validation() report of the tables
+
+    Returns:
+        Failure descriptions (empty when the tables may be cached)
+    """
+    full, surrogate = report["full"], report["surrogate"]
+    failures = []
+    if tables.plays < MIN_TABLE_PLAYS:
+        failures.append(f"{tables.plays} balls in play (need {MIN_TABLE_PLAYS})")
+    for field in ("runs_per_game", "hits_per_game"):
+        drift = abs(surrogate[field] / (full[field] or 1) - 1)
+        if drift > FIDELITY_LIMITS[field]:
+            failures.append(f"{field} drifts {drift:.1%} (limit {FIDELITY_LIMITS[field]:.1%})")
+    for result, share in full["babip_share"].items():
+        drift = abs(surrogate["babip_share"][result] - share)
+        if drift > FIDELITY_LIMITS["babip_share"]:
+            failures.append(f"BIP {result} share drifts {drift:.2%} "
+                            f"(limit {FIDELITY_LIMITS['babip_share']:.2%})")
+    if surrogate["fallback_share"] > FIDELITY_LIMITS["fallback_share"]:
+        failures.append(f"{surrogate['fallback_share']:.1%} of plays fall back to the full engine "
+                        f"(limit {FIDELITY_LIMITS['fallback_share']:.1%})")
+    return failures
+
+
+def format_validation(report: dict) -> str:
+    """Side-by-side text report of run_validation()."""
+    full, surrogate = report["full"], report["surrogate"]
+    rows = [
+        ("Runs/game", "runs_per_game", "{:.3f}"),
+        ("Balls in play/game", "bip_per_game", "{:.2f}"),
+        ("Hits/game", "hits_per_game", "{:.2f}"),
+        ("Multi-out plays", "multi_out_share", "{:.2%}"),
+        ("Plays with errors", "error_share", "{:.2%}"),
+        ("Full-engine fallbacks", "fallback_share", "{:.2%}"),
+        ("Resolution us/play", "us_per_play", "{:.2f}"),
+        ("Game ms", "ms_per_game", "{:.2f}"),
+    ]
+    lines = [f"{'':<24}{'full':>12}{'surrogate':>12}"]
+    for label, field, fmt in rows:
+        lines.append(f"{label:<24}{fmt.format(full[field]):>12}{fmt.format(surrogate[field]):>12}")
+    for result in full["babip_share"]:
+        lines.append(f"{'BIP ' + result:<24}{full['babip_share'][result]:>12.2%}"
+                     f"{surrogate['babip_share'][result]:>12.2%}")
+    if surrogate["us_per_play"]:
+        lines.append(f"Resolution speedup: {full['us_per_play'] / surrogate['us_per_play']:.1f}x overall, "
+                     f"{full['us_per_play'] / surrogate['us_per_sampled_play']:.1f}x per sampled play")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate (and validate) surrogate defense tables for a level"
+    )
+    parser.add_argument("json_file", help="Payload whose games (rosters) are simulated")
+    parser.add_argument("--level", default="9", help="League level id (default: 9)")
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES,
+                        help=f"Games to simulate (default: {DEFAULT_GAMES})")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed (default: 0)")
+    parser.add_argument("--force", action="store_true", help="Regenerate even if cached")
+    parser.add_argument("--validate", type=int, default=DEFAULT_VALIDATION_GAMES, metavar="GAMES",
+                        help="Games compared against the full engine before the tables are "
+                             f"cached (default: {DEFAULT_VALIDATION_GAMES})")
+    args = parser.parse_args()
+
+    from run_local import load_json_file, DEFAULT_RULES, DEFAULT_LEVEL_CONFIG
+
+    payload = load_json_file(args.json_file)
+    game_constants = payload.get("game_constants", {})
+    rules = payload.get("rules", {}).get(args.level, DEFAULT_RULES)
+    level_config = payload.get("level_configs", {}).get(args.level, DEFAULT_LEVEL_CONFIG)
+    game_payloads = [
+        game for games in payload.get("subweeks", {}).values() for game in games
+        if str(game.get("league_level_id", "9")) == args.level
+    ]
+    if not game_payloads:
+        parser.error(f"no games at level {args.level} in {args.json_file}")
+
+    tables = None if args.force else TABLE_CACHE.get(level_config, game_constants, rules)
+    cached = tables is not None
+    if cached:
+        print(f"Cached ({tables.games} games): {TABLE_CACHE.path(tables.key)}")
+    else:
+        print(f"Simulating {args.games} games at level {args.level}...")
+        tables = generate_tables(game_payloads, rules, level_config, game_constants,
+                                 games=args.games, seed=args.seed, save=False)
+    print(f"{tables.plays} balls in play, {len(tables.cells)} cells")
+
+    print()
+    print(f"Validating over {args.validate} games...")
+    report = run_validation(game_payloads, rules, level_config, game_constants,
+                            tables, games=args.validate, seed=args.seed + 1)
+    print(format_validation(report))
+
+    if not cached:
+        print()
+        try:
+            print(f"Saved: {save_validated(tables, report)}")
+        except ValueError as e:
+            print(f"Not saved: {e}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Table Cache - Versioned disk cache for generated per-level tables.
+
+Expectancy and surrogate defense tables are both built by simulating many
+games at one level and stored as JSON, keyed by a fingerprint of the table
+version, level config, game constants and rules. TableCache holds what
+they share: where the files live, atomic writes, the version check on load
+and an in-memory map of loaded tables, so per-game lookups cost one dict
+hit. Misses are remembered as well, so a level without tables does not
+retry the disk for every game; save() replaces the entry.
+simulate_level_games() is the seeded simulation loop both generators run.
+"""
+
+import os
+import json
+import threading
+
+from config_cache import fingerprint
+
+
+DEFAULT_CACHE_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "BaseballGameV5")
+
+
+class TableCache:
+    """Disk cache of one kind of generated table."""
+
+    def __init__(self, name: str, version: int, table_class, env_var: str):
+        """
+        Args:
+            name: Cache subdirectory under DEFAULT_CACHE_ROOT
+            version: Table layout version; bump it when the layout or the
+                     generation changes (invalidates the cache)
+            table_class: Class with to_dict(), from_dict() and a key attribute
+            env_var: Environment variable that overrides the cache directory
+        """
+        self.name = name
+        self.version = version
+        self.table_class = table_class
+        self.env_var = env_var
+        self.default_dir = os.path.join(DEFAULT_CACHE_ROOT, name)
+        self._loaded = {}
+        # Key -> (path, mtime) of the file when it was last found missing or unusable
+        self._missed = {}
+        self._lock = threading.Lock()
+
+    def key(self, level_config: dict, game_constants: dict, rules: dict) -> str:
+        """Cache key (config fingerprint) for a level's tables."""
+        return fingerprint(self.version, level_config, game_constants, rules)
+
+    def path(self, key: str) -> str:
+        """Disk cache file for a table key."""
+        directory = os.environ.get(self.env_var) or self.default_dir
+        return os.path.join(directory, f"{key}.json")
+
+    def get(self, level_config: dict, game_constants: dict, rules: dict):
+        """
+        Tables for a level config from the cache, without generating.
+
+        A miss is remembered with the file's modification time, so later
+        lookups cost one stat until tables are written for the config.
+
+        Returns:
+            Tables, or None if none were generated for the config
+        """
+        key = self.key(level_config, game_constants, rules)
+        with self._lock:
+            if key in self._loaded:
+                return self._loaded[key]
+            missed = self._missed.get(key)
+        path = self.path(key)
+        stamp = (path, _mtime(path))
+        if missed == stamp:
+            return None
+        tables = self._read(key)
+        with self._lock:
+            if tables is None:
+                self._missed[key] = stamp
+                return self._loaded.get(key)
+            self._missed.pop(key, None)
+            return self._loaded.setdefault(key, tables)
+
+    def require(self, level_config: dict, game_constants: dict, rules: dict):
+        """
+        Tables for a level config; raises when none were generated.
+
+        Raises:
+            LookupError: No tables in the cache for the config
+        """
+        tables = self.get(level_config, game_constants, rules)
+        if tables is None:
+            raise LookupError(
+                f"no {self.name} tables for this level config; "
+                f"generate them with {self.name}.py"
+            )
+        return tables
+
+    def save(self, tables) -> str:
+        """
+        Write tables to disk and keep them loaded.
+
+        Returns:
+            Path written
+        """
+        path = self.path(tables.key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(tables.to_dict(), f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._loaded[tables.key] = tables
+            self._missed.pop(tables.key, None)
+        return path
+
+    def _read(self, key: str):
+        try:
+            with open(self.path(key)) as f:
+                data = json.load(f)
+            if data.get("version") != self.version:
+                return None
+            return self.table_class.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+def _mtime(path: str):
+    """File modification time in ns, or None if the file does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def simulate_level_games(game_payloads: list, rules: dict, level_config: dict,
+                         game_constants: dict, games: int, seed=0, stream: str = "tables",
+                         prepare=None):
+    """
+    Simulate games at one level for table generation.
+
+    Args:
+        game_payloads: Game payloads (rosters) to cycle through
+        rules: Rules dict for the level
+        level_config: Level config
+        game_constants: Game constants
+        games: Number of games to simulate
+        seed: Base seed; game i is seeded from (seed, stream/i)
+        stream: Seed stream name
+        prepare: Optional callable applied to each game before it is played
+
+    Yields:
+        Each finished game
+    """
+    import Action
+    import Game
+    from rng import GameRNG
+
+    for i in range(games):
+        payload = dict(game_payloads[i % len(game_payloads)])
+        payload["random_seed"] = GameRNG.split_seed(seed, f"{stream}/{i}")
+        # No injuries: tables describe the level, not one game's attrition
+        game = Game.Game.from_endpoint(payload, rules, level_config, game_constants, [])
+        if prepare is not None:
+            prepare(game)
+        while not game.gamedone:
+            Action.Action(game)
+        yield game
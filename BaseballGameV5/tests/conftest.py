@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+# Engine modules are imported flat from the package directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests.payloads import make_payload
+
+
+@pytest.fixture(scope="session")
+def payload():
+    """Four-game synthetic payload (two 9-inning and two 7-inning games)."""
+    return make_payload(games=4)
+
+
+@pytest.fixture
+def make_game(payload):
+    """Factory for a fresh Game of the payload's i-th game."""
+    import Game
+    from api.app import _iter_game_jobs
+
+    jobs = list(_iter_game_jobs(payload))
+
+    def build(i=0):
+        _, game_data, rules, level_config = jobs[i]
+        return Game.Game.from_endpoint(game_data, rules, level_config,
+                                       payload["game_constants"], payload["injury_types"])
+
+    return build
@@ -0,0 +1,128 @@
+"""
+Synthetic simulation payloads for the tests.
+
+Rosters, ratings and configs are drawn from a fixed-seed random.Random, so
+the same arguments always build the same payload, and each game carries its
+own random_seed, so simulating it is reproducible too.
+"""
+
+import random
+
+POSITIONS = ["c", "fb", "sb", "tb", "ss", "lf", "cf", "rf", "dh"]
+PITCHES = ["Fastball", "Slider", "Curveball", "Changeup", "Sinker"]
+RATINGS = [
+    "contact", "power", "discipline", "eye", "basereaction", "baserunning", "speed",
+    "throwpower", "throwacc", "fieldcatch", "fieldreact", "fieldspot", "catchframe",
+    "catchsequence", "pendurance", "pthrowpower", "pgencontrol", "pickoff", "psequencing",
+]
+DIRECTIONS = ["far_left", "left", "center_left", "dead_center", "center_right", "right", "far_right"]
+OUTFIELDERS = {
+    "far_left": ["leftfield"], "left": ["leftfield"], "center_left": ["leftfield", "centerfield"],
+    "dead_center": ["centerfield"], "center_right": ["centerfield", "rightfield"],
+    "right": ["rightfield"], "far_right": ["rightfield"],
+}
+INFIELDERS = {
+    "far_left": ["thirdbase"], "left": ["thirdbase", "shortstop"], "center_left": ["shortstop"],
+    "dead_center": ["pitcher", "shortstop", "secondbase"], "center_right": ["secondbase"],
+    "right": ["firstbase", "secondbase"], "far_right": ["firstbase"],
+}
+
+LEVEL_CONFIG = {
+    "batting": {"inside_contact": 0.87, "inside_swing": 0.65, "modexp": 2,
+                "outside_contact": 0.66, "outside_swing": 0.3},
+    "contact_odds": {"barrel": 7, "solid": 12, "flare": 36, "burner": 39,
+                     "under": 2.4, "topped": 3.2, "weak": 0.4},
+    "distance_weights": {},
+    "fielding_weights": {},
+    "game": {"steal_success": 0.65, "pickoff_success": 0.1, "error_rate": 0.05},
+}
+
+INJURY_TYPES = [{
+    "id": 1, "code": "hs", "name": "Hamstring", "timeframe": "ingame", "target": "both",
+    "frequency_weight": 1, "min_weeks": 1, "max_weeks": 3, "mean_weeks": 2,
+    "impact_template_json": {"speed": {"min_pct": 0.8, "max_pct": 0.9}},
+}]
+
+
+def _player(rng, pid, ptype):
+    player = {
+        "id": pid, "ptype": ptype, "firstname": f"F{pid}", "lastname": f"L{pid}",
+        "bat_hand": rng.choice(["R", "L", "S"]), "pitch_hand": rng.choice(["R", "L"]),
+        "injury_risk": rng.choice(["Normal", "Risky", "Safe"]), "stamina": 100,
+        "stealfreq": rng.choice([2.0, 5.0, 10.0]), "pickofffreq": rng.choice([2.0, 5.0, 10.0]),
+        "left_split": 0.35, "center_split": 0.35, "right_split": 0.30,
+    }
+    for rating in RATINGS:
+        player[f"{rating}_base"] = rng.randint(30, 80)
+    for i, name in enumerate(PITCHES, start=1):
+        player[f"pitch{i}_name"] = name
+        player[f"pitch{i}_ovr"] = rng.randint(30, 80)
+        for rating in ("pacc", "pcntrl", "pbrk", "consist"):
+            player[f"pitch{i}_{rating}_base"] = rng.randint(30, 80)
+    return player
+
+
+def _side(rng, base, abbrev):
+    players = [_player(rng, base + i, "Position" if i < 13 else "Pitcher") for i in range(26)]
+    return {
+        "team_abbrev": abbrev,
+        "players": players,
+        "lineup": [base + i for i in range(9)],
+        "defense": {position: base + i for i, position in enumerate(POSITIONS)},
+        "bench": [base + i for i in range(9, 13)],
+        "available_pitcher_ids": [base + i for i in range(14, 26)],
+        "starting_pitcher_id": base + 13,
+        "pregame_injuries": [{"player_id": base + 2, "code": "x", "name": "Sore",
+                              "effects": {"contact": 0.9}}],
+    }
+
+
+def game_constants() -> dict:
+    """Game constants with a full defensive alignment and default tables."""
+    alignment = {
+        direction: {
+            "deep_of": OUTFIELDERS[direction],
+            "middle_of": OUTFIELDERS[direction],
+            "shallow_of": OUTFIELDERS[direction] + INFIELDERS[direction][:1],
+            "deep_if": INFIELDERS[direction],
+            "middle_if": INFIELDERS[direction],
+            "shallow_if": INFIELDERS[direction],
+            "mound": ["pitcher"],
+            "catcher": ["catcher"],
+        }
+        for direction in DIRECTIONS
+    }
+    return {"defensive_alignment": alignment, "fielding_difficulty": {}, "fielding_modifier": {},
+            "time_to_ground": {}, "field_zones": []}
+
+
+def make_payload(games: int = 4, seed: int = 7) -> dict:
+    """
+    Build a simulation payload.
+
+    Args:
+        games: Number of games, split over subweeks "a" and "b" and
+               alternating between a 9-inning and a 7-inning level
+        seed: Seed for rosters and ratings
+
+    Returns:
+        Payload dict in the /simulate shape
+    """
+    rng = random.Random(seed)
+    game_list = []
+    for g in range(games):
+        game_list.append({
+            "game_id": 1000 + g,
+            "league_level_id": 9 if g % 2 == 0 else 5,
+            "random_seed": str(12345 + g * 7919),
+            "ballpark": {"power_mod": 1.0, "pitch_break_mod": 1.0},
+            "away_side": _side(rng, 1000 + g * 100, "AAA"),
+            "home_side": _side(rng, 50000 + g * 100, "HHH"),
+        })
+    return {
+        "game_constants": game_constants(),
+        "level_configs": {"9": LEVEL_CONFIG, "5": LEVEL_CONFIG},
+        "rules": {"9": {"innings": 9}, "5": {"innings": 7}},
+        "injury_types": INJURY_TYPES,
+        "subweeks": {"a": game_list[:games // 2], "b": game_list[games // 2:]},
+    }
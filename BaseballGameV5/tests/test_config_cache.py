@@ -0,0 +1,51 @@
+import copy
+import pickle
+
+import pytest
+
+from Baselines import FrozenDict
+
+
+def test_frozen_configs_are_read_only(make_game):
+    game = make_game(0)
+    with pytest.raises(AttributeError):
+        game.baselines.error_rate = 0.0
+    with pytest.raises(AttributeError):
+        game.rules.innings = 7
+    with pytest.raises(TypeError):
+        game.baselines.defensivealignment["extra"] = 1
+
+
+def test_deep_copied_game_shares_the_cached_configs(make_game):
+    game = make_game(0)
+    clone = copy.deepcopy(game)
+    assert clone.baselines is game.baselines
+    assert clone.rules is game.rules
+    assert clone.run_simulation() == game.run_simulation()
+
+
+def test_frozen_configs_pickle(make_game):
+    game = make_game(0)
+    baselines = pickle.loads(pickle.dumps(game.baselines))
+    state = dict(vars(baselines), compiled=None)
+    assert state == dict(vars(game.baselines), compiled=None)
+    for name in type(baselines.compiled).__slots__:
+        assert getattr(baselines.compiled, name) == getattr(game.baselines.compiled, name)
+    assert isinstance(baselines.defensivealignment, FrozenDict)
+    with pytest.raises(AttributeError):
+        baselines.error_rate = 0.0
+    rules = pickle.loads(pickle.dumps(game.rules))
+    assert (rules.innings, rules.outs, rules.balls, rules.strikes) == (
+        game.rules.innings, game.rules.outs, game.rules.balls, game.rules.strikes)
+
+
+def test_frozen_dict_rejects_every_mutation():
+    frozen = FrozenDict({"a": 1})
+    for mutate in (lambda d: d.__setitem__("b", 2), lambda d: d.__delitem__("a"),
+                   lambda d: d.update(b=2), lambda d: d.pop("a"), lambda d: d.popitem(),
+                   lambda d: d.setdefault("b", 2), lambda d: d.clear()):
+        with pytest.raises(TypeError):
+            mutate(frozen)
+    assert frozen == {"a": 1}
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert copy.deepcopy(frozen) is frozen
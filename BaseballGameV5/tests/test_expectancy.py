@@ -0,0 +1,84 @@
+import pytest
+
+import Action
+import expectancy
+from expectancy import (
+    BASE_OUT_STATES, MAX_RUN_DIFF, RUN_DIFFS, ExpectancyTables, base_out, generate_tables,
+)
+
+LEVEL = "9"
+GAMES = 40
+
+
+@pytest.fixture(scope="module")
+def level(payload):
+    games = [game for subweek in payload["subweeks"].values() for game in subweek
+             if str(game["league_level_id"]) == LEVEL]
+    return games, payload["rules"][LEVEL], payload["level_configs"][LEVEL], payload["game_constants"]
+
+
+@pytest.fixture(scope="module")
+def tables(level):
+    games, rules, level_config, game_constants = level
+    return generate_tables(games, rules, level_config, game_constants, games=GAMES, save=False)
+
+
+def test_base_out_codes_cover_the_states():
+    codes = {
+        base_out(r1, r2, r3, outs)
+        for r1 in (None, 1) for r2 in (None, 2) for r3 in (None, 3) for outs in range(3)
+    }
+    assert codes == set(range(BASE_OUT_STATES))
+
+
+def test_tables_shape_and_ranges(tables):
+    assert tables.games == GAMES
+    assert len(tables.re24) == BASE_OUT_STATES
+    assert len(tables.win_expectancy) == tables.innings * 2 * RUN_DIFFS * BASE_OUT_STATES
+    assert len(tables.leverage) == len(tables.win_expectancy)
+    assert all(0.0 <= value <= 1.0 for value in tables.win_expectancy)
+    assert all(value >= 0.0 for value in tables.leverage)
+    assert all(value >= 0.0 for value in tables.re24)
+
+
+def test_run_expectancy_orders_states(tables):
+    assert tables.run_expectancy(1, 2, 3, 0) > tables.run_expectancy(None, None, None, 2)
+    assert tables.run_expectancy(None, None, None, 0) > tables.run_expectancy(None, None, None, 2)
+
+
+def test_win_expectancy_favours_the_leader(tables):
+    last = tables.innings
+    assert tables.home_win_expectancy(last, False, MAX_RUN_DIFF, 0) > 0.9
+    assert tables.home_win_expectancy(last, True, -MAX_RUN_DIFF, 0) < 0.1
+
+
+def test_wpa_adds_up_to_the_result(level, tables):
+    games, rules, level_config, game_constants = level
+    import Game
+
+    game = Game.Game.from_endpoint(games[0], rules, level_config, game_constants, [])
+    game.expectancy = tables
+    while not game.gamedone:
+        Action.Action(game)
+    events = game.actions
+
+    start = tables.win_expectancy[expectancy.pre_state(events[0], tables.innings)]
+    result = 1.0 if game.hometeam.score > game.awayteam.score else 0.0
+    # Each event's WPA is rounded to 4 places
+    assert sum(event.wpa for event in events) == pytest.approx(result - start, abs=1e-4 * len(events))
+
+
+def test_dict_round_trip(tables):
+    assert ExpectancyTables.from_dict(tables.to_dict()).to_dict() == tables.to_dict()
+
+
+def test_disk_cache_round_trip(level, tables, tmp_path, monkeypatch):
+    games, rules, level_config, game_constants = level
+    monkeypatch.setenv(expectancy.CACHE_DIR_ENV, str(tmp_path))
+    path = expectancy.TABLE_CACHE.save(tables)
+    assert path.startswith(str(tmp_path))
+
+    monkeypatch.setattr(expectancy.TABLE_CACHE, "_loaded", {})
+    cached = expectancy.TABLE_CACHE.get(level_config, game_constants, rules)
+    assert cached is not None
+    assert cached.to_dict() == tables.to_dict()
@@ -0,0 +1,37 @@
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.jobs import JOBS_ENV, WEB_WORKERS_ENV, jobs_enabled_from_env, web_workers_from_env
+
+
+@pytest.mark.parametrize("value, enabled", [
+    (None, True), ("", True), ("1", True), ("on", True),
+    ("0", False), ("off", False), ("False", False), ("no", False),
+])
+def test_jobs_enabled_from_env(monkeypatch, value, enabled):
+    if value is None:
+        monkeypatch.delenv(JOBS_ENV, raising=False)
+    else:
+        monkeypatch.setenv(JOBS_ENV, value)
+    assert jobs_enabled_from_env() is enabled
+
+
+@pytest.mark.parametrize("value, workers", [(None, 1), ("4", 4), ("0", 1), ("many", 1)])
+def test_web_workers_from_env(monkeypatch, value, workers):
+    if value is None:
+        monkeypatch.delenv(WEB_WORKERS_ENV, raising=False)
+    else:
+        monkeypatch.setenv(WEB_WORKERS_ENV, value)
+    assert web_workers_from_env() == workers
+
+
+def test_disabled_jobs_are_not_found(monkeypatch, payload):
+    # The api package re-exports the FastAPI app under the module's name
+    app_module = importlib.import_module("api.app")
+    monkeypatch.setattr(app_module, "jobs_enabled", False)
+    with TestClient(app_module.app) as client:
+        assert client.post("/jobs", json=payload).status_code == 404
+        assert client.get("/jobs/0").status_code == 404
+        assert client.delete("/jobs/0").status_code == 404
@@ -0,0 +1,131 @@
+"""
+Seeded regression tests for whole games.
+
+GOLDEN pins an md5 of the full /simulate response (every section, play by
+play included) for the synthetic payload in each engine mode. A change
+that is meant to preserve results must keep these hashes; one that changes
+results on purpose updates them, printed by running this file:
+
+    python -m tests.test_regression
+"""
+
+import hashlib
+import json
+
+import pytest
+
+from api.app import process_simulation
+from api.executor import SimulationPool
+from defense import fielding
+
+SECTIONS = ["game_summary", "play_by_play", "tuning_data", "debug"]
+
+# Payload mode -> md5 of the response to make_payload(games=4)
+GOLDEN = {
+    "default": "cfa121a81d6d6366f98bcb94b60e6214",
+    "outcome_only": "5dcc8ba0b93a02dae9aa3cd53adb8933",
+    "pa_sampling": "23bcded4496f0e0a7eacf33b30a31a4c",
+}
+
+MODES = {
+    "default": {},
+    "outcome_only": {"outcome_only": True},
+    "pa_sampling": {"pa_sampling": True},
+}
+
+
+def digest(value) -> str:
+    return hashlib.md5(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def simulate(payload, mode="default", pool=None) -> dict:
+    request = dict(payload, sections=SECTIONS, **MODES[mode])
+    return process_simulation(request, pool=pool)
+
+
+def strip_timing(value):
+    """Response with every Timing_Diagnostics entry removed."""
+    if isinstance(value, dict):
+        return {key: strip_timing(item) for key, item in value.items() if key != "Timing_Diagnostics"}
+    if isinstance(value, list):
+        return [strip_timing(item) for item in value]
+    return value
+
+
+@pytest.mark.parametrize("mode", sorted(GOLDEN))
+def test_golden_output(payload, mode):
+    response = simulate(payload, mode)
+    assert response["errors"] == []
+    assert response["total_games_simulated"] == 4
+    assert digest(response) == GOLDEN[mode]
+
+
+def test_same_seed_same_game(make_game):
+    first = make_game(1).run_simulation()
+    second = make_game(1).run_simulation()
+    assert digest(first) == digest(second)
+
+
+def test_outcome_only_matches_full_run(payload):
+    full = process_simulation(dict(payload, sections=[]))
+    fast = process_simulation(dict(payload, outcome_only=True))
+    for subweek, games in full["subweeks"].items():
+        for full_game, fast_game in zip(games, fast["subweeks"][subweek]):
+            assert fast_game["result"] == full_game["result"]
+            assert fast_game["boxscore"] == full_game["boxscore"]
+            assert fast_game["injuries"] == full_game["injuries"]
+
+
+def test_timing_diagnostics_do_not_change_plays(payload):
+    plain = simulate(payload)
+    diagnosed = simulate(dict(payload, timing_diagnostics=1))
+    assert digest(diagnosed) != digest(plain)
+    assert strip_timing(diagnosed) == strip_timing(plain)
+
+
+@pytest.mark.parametrize("pool_mode", ["thread", "process"])
+def test_pool_matches_serial(payload, pool_mode):
+    pool = SimulationPool(workers=2, mode=pool_mode)
+    try:
+        pooled = simulate(payload, pool=pool)
+    finally:
+        pool.shutdown()
+    assert digest(pooled) == digest(simulate(payload))
+
+
+
+class FreshResolver:
+    """Resolves every ball in play with a new resolver (nothing pooled)."""
+
+    def __init__(self, game):
+        self.game = game
+        self.current = fielding(game)
+
+    def resolve(self, gamestate):
+        self.current = fielding(self.game)
+        return self.current.resolve(gamestate)
+
+    def __getattr__(self, name):
+        return getattr(self.current, name)
+
+
+@pytest.mark.parametrize("index", range(4))
+def test_pooled_play_result_matches_fresh_resolver(make_game, index):
+    # The per-game resolver reuses one PlayResult and its lists for every
+    # play; nothing recorded may still point at them when the next play runs
+    pooled = make_game(index).run_simulation(SECTIONS)
+
+    game = make_game(index)
+    game.play_resolver = FreshResolver(game)
+    fresh = game.run_simulation(SECTIONS)
+
+    assert pooled["play_by_play"] == fresh["play_by_play"]
+    assert digest(pooled) == digest(fresh)
+
+
+if __name__ == "__main__":
+    from tests.payloads import make_payload
+
+    golden_payload = make_payload(games=4)
+    for golden_mode in sorted(GOLDEN):
+        print(f'    "{golden_mode}": "{digest(simulate(golden_payload, golden_mode))}",')
@@ -0,0 +1,132 @@
+import pytest
+
+import Action
+import surrogate_defense
+from surrogate_defense import (
+    MIN_CELL_SAMPLES, MIN_TABLE_PLAYS, OUT, SurrogateDefense, coarse_keys, fidelity_failures,
+    generate_tables,
+)
+
+LEVEL = "9"
+GAMES = 40
+RESULTS = {"out", "single", "double", "triple", "homerun"}
+
+
+@pytest.fixture(scope="module")
+def level(payload):
+    games = [game for subweek in payload["subweeks"].values() for game in subweek
+             if str(game["league_level_id"]) == LEVEL]
+    return games, payload["rules"][LEVEL], payload["level_configs"][LEVEL], payload["game_constants"]
+
+
+@pytest.fixture(scope="module")
+def tables(level):
+    games, rules, level_config, game_constants = level
+    return generate_tables(games, rules, level_config, game_constants, games=GAMES, save=False)
+
+
+def test_coarse_keys_drop_ratings_then_direction():
+    key = (1, 2, 3, 4, 0, 2)
+    assert coarse_keys(key) == (key, (1, 2, 3, 4), (1, 2, 4))
+
+
+def test_cells_are_well_formed(tables):
+    assert tables.games == GAMES
+    assert tables.plays > 0
+    assert tables.cells
+    for key, (outcomes, cumulative) in tables.cells.items():
+        assert len(outcomes) == len(cumulative)
+        assert cumulative[-1] >= MIN_CELL_SAMPLES
+        assert all(a < b for a, b in zip(cumulative, cumulative[1:]))
+        for result, destinations, outs, errors, credits in outcomes:
+            assert result in RESULTS
+            assert len(destinations) == 4
+            # The batter always ends up somewhere
+            assert destinations[0] is not None
+            assert all(base in (None, OUT, 1, 2, 3, 4) for base in destinations)
+            assert 0 <= outs <= 3
+            assert errors >= 0
+
+
+def test_lookup_falls_back_to_coarser_cells(tables):
+    coarse = next(key for key in tables.cells if len(key) == 3)
+    contact, depth, base_out = coarse
+    # Direction and buckets no table has seen
+    assert tables.lookup((contact, depth, 99, base_out, 9, 9)) is tables.cells[coarse]
+    assert tables.lookup((99, 99, 99, 99, 0, 0)) is None
+
+
+def test_dict_round_trip(tables):
+    assert SurrogateDefense.from_dict(tables.to_dict()).to_dict() == tables.to_dict()
+
+
+def test_games_with_tables_are_deterministic(level, tables):
+    games, rules, level_config, game_constants = level
+    import Game
+
+    def play():
+        game = Game.Game.from_endpoint(games[0], rules, level_config, game_constants, [])
+        game.surrogate_defense = tables
+        while not game.gamedone:
+            Action.Action(game)
+        return game.hometeam.score, game.awayteam.score, [event.to_dict(game.player_names())
+                                                          for event in game.actions]
+
+    assert play() == play()
+
+
+def test_disk_cache_round_trip(level, tables, tmp_path, monkeypatch):
+    games, rules, level_config, game_constants = level
+    monkeypatch.setenv(surrogate_defense.CACHE_DIR_ENV, str(tmp_path))
+    surrogate_defense.TABLE_CACHE.save(tables)
+
+    monkeypatch.setattr(surrogate_defense.TABLE_CACHE, "_loaded", {})
+    cached = surrogate_defense.TABLE_CACHE.get(level_config, game_constants, rules)
+    assert cached is not None
+    assert cached.to_dict() == tables.to_dict()
+
+
+def test_games_fail_without_tables(payload, tmp_path, monkeypatch):
+    from api.app import process_simulation
+
+    monkeypatch.setenv(surrogate_defense.CACHE_DIR_ENV, str(tmp_path))
+    monkeypatch.setattr(surrogate_defense.TABLE_CACHE, "_loaded", {})
+    response = process_simulation(dict(payload, surrogate_defense=True))
+    assert response["total_games_simulated"] == 0
+    assert len(response["errors"]) == 4
+    assert all("surrogate_defense.py" in error["error"] for error in response["errors"])
+
+
+def validation_report(**surrogate):
+    full = {
+        "runs_per_game": 8.0,
+        "hits_per_game": 10.0,
+        "babip_share": {"out": 0.7, "single": 0.2, "double": 0.06, "triple": 0.01, "homerun": 0.03},
+        "fallback_share": 0.0,
+    }
+    return {"full": full, "surrogate": dict(full, **surrogate)}
+
+
+def test_fidelity_failures():
+    tables = SurrogateDefense({}, plays=MIN_TABLE_PLAYS)
+    assert fidelity_failures(tables, validation_report()) == []
+    assert fidelity_failures(tables, validation_report(runs_per_game=7.8, fallback_share=0.05)) == []
+
+    failures = fidelity_failures(tables, validation_report(
+        runs_per_game=7.2,
+        babip_share={"out": 0.68, "single": 0.22, "double": 0.06, "triple": 0.01, "homerun": 0.03},
+        fallback_share=0.19,
+    ))
+    assert len(failures) == 4
+    assert failures[0].startswith("runs_per_game")
+
+    small = SurrogateDefense({}, plays=MIN_TABLE_PLAYS - 1)
+    assert len(fidelity_failures(small, validation_report())) == 1
+
+
+def test_failed_tables_are_not_saved(tables, tmp_path, monkeypatch):
+    monkeypatch.setenv(surrogate_defense.CACHE_DIR_ENV, str(tmp_path))
+    assert tables.plays < MIN_TABLE_PLAYS
+    with pytest.raises(ValueError, match="failed validation"):
+        surrogate_defense.save_validated(tables, validation_report())
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,66 @@
+import json
+import os
+
+import pytest
+
+from table_cache import TableCache
+
+VERSION = 1
+CONFIG = ({"level": 9}, {"constant": 1}, {"innings": 9})
+
+
+class Tables:
+    """Smallest table class TableCache accepts."""
+
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+
+    def to_dict(self):
+        return {"version": VERSION, "key": self.key, "value": self.value}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["key"], data["value"])
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEST_TABLE_CACHE_DIR", str(tmp_path))
+    return TableCache("test_tables", VERSION, Tables, "TEST_TABLE_CACHE_DIR")
+
+
+def test_miss_then_hit(cache):
+    assert cache.get(*CONFIG) is None
+    with pytest.raises(LookupError):
+        cache.require(*CONFIG)
+
+    key = cache.key(*CONFIG)
+    cache.save(Tables(key, 3))
+    assert cache.get(*CONFIG).value == 3
+
+
+def test_tables_written_elsewhere_replace_a_miss(cache):
+    assert cache.get(*CONFIG) is None
+    assert cache.get(*CONFIG) is None
+
+    # Another process (or the generator CLI) writes the tables
+    key = cache.key(*CONFIG)
+    with open(cache.path(key), "w") as f:
+        json.dump(Tables(key, 5).to_dict(), f)
+    assert cache.get(*CONFIG).value == 5
+
+
+def test_stale_version_is_a_miss_until_rewritten(cache):
+    key = cache.key(*CONFIG)
+    path = cache.path(key)
+    with open(path, "w") as f:
+        json.dump(dict(Tables(key, 1).to_dict(), version=VERSION - 1), f)
+    assert cache.get(*CONFIG) is None
+
+    with open(path, "w") as f:
+        json.dump(Tables(key, 2).to_dict(), f)
+    # Force a distinct mtime on filesystems with coarse timestamps
+    stamp = cache._missed[key][1] + 1_000_000_000
+    os.utime(path, ns=(stamp, stamp))
+    assert cache.get(*CONFIG).value == 2
@@ -0,0 +1,151 @@
+from functools import lru_cache
+
+import pytest
+
+from InteractionEngine import (
+    BALL, STRIKE, FOUL, HBP, IN_PLAY, MAX_TWO_STRIKE_FOULS, PitchTable, PlateAppearanceTable, pick,
+)
+
+COUNTS = [(balls, strikes) for balls in range(4) for strikes in range(3)]
+
+
+@pytest.fixture
+def game(make_game):
+    return make_game(0)
+
+
+def pitch_tables(game):
+    """Pitch table of every batter in the away lineup against the home battery."""
+    pitching = game.pitchingteam
+    return [
+        PitchTable.lookup(game, batter, pitching.currentpitcher, pitching.catcher)
+        for batter in game.battingteam.battinglist
+    ]
+
+
+def solve_plate_appearance(kind_prob, balls, strikes, rules):
+    """
+    Terminal distribution of a PA by recursion over the count, written
+    independently of PlateAppearanceTable's forward pass.
+    """
+    total = sum(kind_prob)
+    p = [k / total for k in kind_prob]
+    max_balls = rules.balls - 1
+    two_strikes = rules.strikes - 1
+
+    @lru_cache(maxsize=None)
+    def from_count(b, s, f):
+        ends = {}
+
+        def add(key, prob):
+            ends[key] = ends.get(key, 0.0) + prob
+
+        def follow(prob, b2, s2, f2):
+            for key, q in from_count(b2, s2, f2).items():
+                add(key, prob * q)
+
+        # At the foul cap further fouls leave the state unchanged, so every
+        # other outcome is scaled by the geometric sum 1 / (1 - p_foul)
+        capped = s == two_strikes and f == MAX_TWO_STRIKE_FOULS
+        scale = 1 / (1 - p[FOUL]) if capped else 1.0
+        add((HBP, b, s, f), p[HBP] * scale)
+        add((IN_PLAY, b, s, f), p[IN_PLAY] * scale)
+        if b == max_balls:
+            add((BALL, b, s, f), p[BALL] * scale)
+        else:
+            follow(p[BALL] * scale, b + 1, s, f)
+        if s == two_strikes:
+            add((STRIKE, b, s, f), p[STRIKE] * scale)
+            if not capped:
+                follow(p[FOUL], b, s, f + 1)
+        else:
+            follow(p[STRIKE] + p[FOUL], b, s + 1, f)
+        return ends
+
+    return from_count(balls, min(strikes, two_strikes), 0)
+
+
+def test_pitch_table_probabilities_sum_to_one(game):
+    for table in pitch_tables(game):
+        assert sum(table.probs) == pytest.approx(1.0, abs=1e-12)
+        assert sum(table.kind_prob) == pytest.approx(1.0, abs=1e-12)
+        assert table.cum[-1] == pytest.approx(1.0, abs=1e-12)
+        assert all(p > 0 for p in table.probs)
+        assert all(a < b for a, b in zip(table.cum, table.cum[1:]))
+        for kind, probs in enumerate(table.kind_probs):
+            assert sum(probs) == pytest.approx(table.kind_prob[kind], abs=1e-12)
+            assert all(table.kinds[i] == kind for i in table.kind_index[kind])
+
+
+def test_pitch_table_kinds_match_outcomes(game):
+    kinds = {
+        ("HBP", "Hit By Pitch"): HBP,
+        ("Ball", "Looking"): BALL,
+        ("Strike", "Looking"): STRIKE,
+        ("Strike", "Swinging"): STRIKE,
+        ("Strike", "Foul"): FOUL,
+    }
+    for table in pitch_tables(game):
+        for outcome, kind in zip(table.outcomes, table.kinds):
+            if outcome[0] in PitchTable.CONTACT_TYPES:
+                assert kind == IN_PLAY
+            else:
+                assert kinds[outcome[:2]] == kind
+
+
+def test_pitch_table_samples_cover_the_range(game):
+    table = pitch_tables(game)[0]
+    for u in (0.0, 0.25, 0.5, 0.75, 0.999999999):
+        outcome = table.sample(u)
+        assert len(outcome) == 3
+        if outcome[0] in PitchTable.CONTACT_TYPES:
+            assert outcome[1] in table.directions
+
+
+def test_plate_appearance_table_sums_to_one(game):
+    rules = game.rules
+    for table in pitch_tables(game):
+        for balls, strikes in COUNTS:
+            pa = PlateAppearanceTable(table, balls, strikes, rules)
+            assert sum(pa.probs) == pytest.approx(1.0, abs=1e-9)
+            for kind, b, s, fouls in pa.terminals:
+                assert kind != FOUL
+                assert balls <= b < rules.balls
+                assert strikes <= s < rules.strikes
+                assert 0 <= fouls <= MAX_TWO_STRIKE_FOULS
+                if kind == BALL:
+                    assert b == rules.balls - 1
+                if kind == STRIKE:
+                    assert s == rules.strikes - 1
+                if fouls:
+                    assert s == rules.strikes - 1
+
+
+def test_plate_appearance_table_matches_count_recursion(game):
+    rules = game.rules
+    table = pitch_tables(game)[0]
+    for balls, strikes in COUNTS:
+        pa = PlateAppearanceTable(table, balls, strikes, rules)
+        expected = solve_plate_appearance(tuple(table.kind_prob), balls, strikes, rules)
+        got = dict(zip(pa.terminals, pa.probs))
+        assert got.keys() == {key for key, p in expected.items() if p > 0}
+        for key, p in got.items():
+            assert p == pytest.approx(expected[key], rel=1e-9, abs=1e-15)
+
+
+def test_plate_appearance_table_is_cached_per_count(game):
+    table = pitch_tables(game)[0]
+    assert table.plate_appearance(1, 2, game.rules) is table.plate_appearance(1, 2, game.rules)
+    assert table.plate_appearance(1, 2, game.rules) is not table.plate_appearance(2, 1, game.rules)
+
+
+def test_pick_returns_entry_and_fresh_uniform():
+    probs = [0.2, 0.5, 0.3]
+    cum = [0.2, 0.7, 1.0]
+    assert pick(cum, probs, 0.0) == (0, 0.0)
+    index, rest = pick(cum, probs, 0.45)
+    assert index == 1
+    assert rest == pytest.approx(0.5)
+    index, rest = pick(cum, probs, 0.999999)
+    assert index == 2
+    assert 0.0 <= rest < 1.0